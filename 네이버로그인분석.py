@@ -2,80 +2,68 @@
 네이버 로그인 페이지 분석 스크립트
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 
-def analyze_naver_login():
-    # Chrome 드라이버 설정
-    chrome_options = webdriver.ChromeOptions()
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+from 블로그글쓰기자동화 import LOGIN_WATCH_SELECTORS, NAVER_URLS
+from 크롬프로필 import create_chrome_driver
+from 페이지스냅샷 import take_snapshot
+
+def analyze_naver_login(browser_profile: str = "default"):
+    # Chrome 드라이버 설정 (worker: 헤드리스로 분석)
+    driver = create_chrome_driver(browser_profile)
     
     try:
         print("네이버 로그인 페이지 접속...")
-        driver.get("https://nid.naver.com/nidlogin.login")
+        driver.get(NAVER_URLS["login"])
         
         # 페이지 로딩 대기
-        time.sleep(3)
+        WebDriverWait(driver, 10, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        
+        # 요소 속성을 하나씩 묻지 않고 페이지 구조 전체를 한 번에 수집
+        snapshot = take_snapshot(driver, LOGIN_WATCH_SELECTORS)
+        print(snapshot.summary())
         
         print("\n=== 모든 INPUT 요소 분석 ===")
-        inputs = driver.find_elements(By.TAG_NAME, "input")
-        for i, inp in enumerate(inputs):
-            input_type = inp.get_attribute('type')
-            input_id = inp.get_attribute('id')
-            input_name = inp.get_attribute('name')
-            input_class = inp.get_attribute('class')
-            input_placeholder = inp.get_attribute('placeholder')
-            
+        for i, inp in enumerate(snapshot.find(tag="input")):
             print(f"Input {i}:")
-            print(f"  Type: {input_type}")
-            print(f"  ID: {input_id}")
-            print(f"  Name: {input_name}")
-            print(f"  Class: {input_class}")
-            print(f"  Placeholder: {input_placeholder}")
+            print(f"  Type: {inp['type']}")
+            print(f"  ID: {inp['id']}")
+            print(f"  Name: {inp['name']}")
+            print(f"  Class: {' '.join(inp['classes'])}")
+            print(f"  Placeholder: {inp['placeholder']}")
             print("---")
         
         print("\n=== 모든 BUTTON 요소 분석 ===")
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        for i, btn in enumerate(buttons):
-            btn_class = btn.get_attribute('class')
-            btn_text = btn.text
-            btn_type = btn.get_attribute('type')
-            
+        for i, btn in enumerate(snapshot.find(tag="button")):
             print(f"Button {i}:")
-            print(f"  Class: {btn_class}")
-            print(f"  Text: {btn_text}")
-            print(f"  Type: {btn_type}")
+            print(f"  Class: {' '.join(btn['classes'])}")
+            print(f"  Text: {btn['text']}")
+            print(f"  Type: {btn['type']}")
             print("---")
         
         print("\n=== 로그인 관련 요소 찾기 ===")
         
-        # ID 입력 요소 찾기 시도
-        try:
-            id_element = driver.find_element(By.ID, "id")
-            print(f"ID 입력창 찾음: ID='id', Class='{id_element.get_attribute('class')}'")
-        except:
+        # ID 입력 요소
+        id_elements = snapshot.find(element_id="id")
+        if id_elements:
+            print(f"ID 입력창 찾음: ID='id', Class='{' '.join(id_elements[0]['classes'])}'")
+        else:
             print("ID='id' 요소를 찾을 수 없음")
         
-        # 비밀번호 입력 요소 찾기 시도
-        try:
-            pw_element = driver.find_element(By.ID, "pw")
-            print(f"비밀번호 입력창 찾음: ID='pw', Class='{pw_element.get_attribute('class')}'")
-        except:
+        # 비밀번호 입력 요소
+        pw_elements = snapshot.find(element_id="pw")
+        if pw_elements:
+            print(f"비밀번호 입력창 찾음: ID='pw', Class='{' '.join(pw_elements[0]['classes'])}'")
+        else:
             print("ID='pw' 요소를 찾을 수 없음")
         
-        # 로그인 버튼 찾기 시도
-        try:
-            login_btn = driver.find_element(By.CSS_SELECTOR, ".btn_login")
-            print(f"로그인 버튼 찾음: Class='{login_btn.get_attribute('class')}', Text='{login_btn.text}'")
-        except:
+        # 로그인 버튼
+        login_buttons = snapshot.find(class_name="btn_login")
+        if login_buttons:
+            print(f"로그인 버튼 찾음: Class='{' '.join(login_buttons[0]['classes'])}', Text='{login_buttons[0]['text']}'")
+        else:
             print("Class='btn_login' 버튼을 찾을 수 없음")
         
         # 사용자가 직접 확인할 수 있도록 브라우저 유지
@@ -88,4 +76,4 @@ def analyze_naver_login():
         driver.quit()
 
 if __name__ == "__main__":
-    analyze_naver_login()
\ No newline at end of file
+    analyze_naver_login()
@@ -0,0 +1,278 @@
+"""
+Selenium 자동화 성능 테스트용 로컬 네이버 모의 사이트
+
+실제 네이버 대신 같은 DOM 구조(로그인 폼의 #id/#pw/.btn_login, 글쓰기 페이지의 #mainFrame,
+SmartEditor의 .se-section-documentTitle/.se-section-text, 팝업 닫기 버튼, .save_btn__bzc5B,
+저장 완료 토스트)를 가진 페이지를 로컬 HTTP 서버로 제공합니다. 에디터 렌더링 지연,
+로그인/저장 지연, 팝업 표시 여부를 설정할 수 있습니다.
+
+사용법:
+    python 네이버모의사이트.py --port 8765 --render-delay 0.5
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from 브라우저세션풀 import AUTH_COOKIE_NAMES
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>NAVER (모의)</title>
+<link rel="stylesheet" href="/static/font.css"></head>
+<body><h1>모의 네이버</h1><img src="/static/logo.png" alt="logo">
+<script src="/static/analytics.js"></script></body></html>
+"""
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>로그인 (모의)</title></head>
+<body>
+<form id="frmNIDLogin" method="post" action="/nidlogin.login">
+  <input type="text" id="id" name="id" class="input_id" placeholder="아이디">
+  <input type="password" id="pw" name="pw" class="input_pw" placeholder="비밀번호">
+  <button type="submit" class="btn_login off next_step nlog-click">로그인</button>
+</form>
+<img src="/static/login_banner.jpg" alt="banner">
+</body></html>
+"""
+
+WRITE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>글쓰기 (모의)</title></head>
+<body style="margin:0">
+<iframe id="mainFrame" name="mainFrame" src="/PostWriteForm.naver" style="width:100%;height:900px;border:0"></iframe>
+</body></html>
+"""
+
+# 에디터는 render_delay 뒤에 그려지고, 저장은 save_delay 뒤에 토스트를 띄움
+EDITOR_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>SmartEditor (모의)</title>
+<link rel="stylesheet" href="/static/editor_font.woff2">
+<style>
+  .se-section-documentTitle, .se-section-text {{ border:1px solid #ddd; margin:8px; padding:8px; min-height:30px; }}
+  .se-section-text {{ min-height:400px; white-space:pre-wrap; }}
+  .se-popup, .se-help-panel {{ position:fixed; top:100px; left:100px; background:#fff; border:2px solid #333; padding:20px; z-index:10; }}
+  .se-help-panel {{ top:300px; }}
+</style></head>
+<body>
+<div id="root"></div>
+<script>
+var config = {config};
+setTimeout(function () {{
+  var root = document.getElementById('root');
+  root.innerHTML =
+    '<div class="se-section-documentTitle" contenteditable="true"></div>' +
+    '<div class="se-section-text" contenteditable="true"></div>' +
+    '<button class="save_btn__bzc5B" type="button">저장</button>';
+  if (config.popups) {{
+    var popup = document.createElement('div');
+    popup.className = 'se-popup';
+    popup.innerHTML = '작성 중인 글이 있습니다. <button class="se-popup-button-cancel">취소</button>';
+    document.body.appendChild(popup);
+    var help = document.createElement('div');
+    help.className = 'se-help-panel';
+    help.innerHTML = '도움말 <button class="se-help-panel-close-button">닫기</button>';
+    document.body.appendChild(help);
+    popup.querySelector('button').onclick = function () {{ popup.style.display = 'none'; }};
+    help.querySelector('button').onclick = function () {{ help.style.display = 'none'; }};
+  }}
+  document.querySelector('.save_btn__bzc5B').onclick = function () {{
+    var body = JSON.stringify({{
+      title: document.querySelector('.se-section-documentTitle').innerText,
+      content: document.querySelector('.se-section-text').innerText
+    }});
+    fetch('/api/posts', {{method: 'POST', headers: {{'Content-Type': 'application/json'}}, body: body}})
+      .then(function () {{
+        var toast = document.createElement('div');
+        toast.className = 'se-toast-popup';
+        toast.textContent = '저장되었습니다.';
+        document.body.appendChild(toast);
+      }});
+  }};
+}}, config.renderDelayMs);
+</script>
+<img src="/static/editor_toolbar.png" alt="toolbar">
+</body></html>
+"""
+
+# 차단 여부 확인용 정적 리소스 (worker 프로필은 요청 자체를 보내지 않음)
+STATIC_TYPES = {
+    ".png": "image/png", ".jpg": "image/jpeg", ".css": "text/css",
+    ".js": "application/javascript", ".woff2": "font/woff2",
+}
+
+
+class MockNaverSite:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, render_delay: float = 0.5,
+                 login_delay: float = 0.3, save_delay: float = 0.3, asset_delay: float = 0.2,
+                 popups: bool = True):
+        """
+        모의 사이트 초기화
+
+        Args:
+            host (str): 바인딩할 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            render_delay (float): 에디터가 그려지기까지의 지연(초)
+            login_delay (float): 로그인 요청 처리 지연(초)
+            save_delay (float): 저장 요청 처리 지연(초)
+            asset_delay (float): 이미지/폰트/스크립트 응답 지연(초)
+            popups (bool): 에디터에 팝업 두 개를 띄울지 여부
+        """
+        self.render_delay = render_delay
+        self.login_delay = login_delay
+        self.save_delay = save_delay
+        self.asset_delay = asset_delay
+        self.popups = popups
+        self.posts: List[dict] = []
+        self.asset_requests = 0
+        self.lock = threading.Lock()
+
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def urls(self) -> Dict[str, str]:
+        """NaverBlogAutomate에 넘길 페이지 주소 (home, login, write)"""
+        return {
+            "home": f"{self.base_url}/",
+            "login": f"{self.base_url}/nidlogin.login",
+            "write": f"{self.base_url}/GoBlogWrite.naver",
+        }
+
+    def start(self) -> "MockNaverSite":
+        """백그라운드 스레드에서 서버 시작"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                # 요청마다 로그를 찍지 않음
+                pass
+
+            def send_html(self, html: str, status: int = 200, headers: Optional[Dict[str, str]] = None):
+                body = html.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def redirect(self, location: str, cookies: Optional[List[str]] = None):
+                self.send_response(302)
+                self.send_header("Location", location)
+                for cookie in cookies or []:
+                    self.send_header("Set-Cookie", cookie)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def is_logged_in(self) -> bool:
+                cookies = self.headers.get("Cookie", "")
+                return all(f"{name}=" in cookies for name in AUTH_COOKIE_NAMES)
+
+            def read_body(self) -> bytes:
+                length = int(self.headers.get("Content-Length") or 0)
+                return self.rfile.read(length) if length else b""
+
+            def do_GET(self):
+                path = urllib.parse.urlparse(self.path).path
+                if path == "/":
+                    self.send_html(HOME_PAGE)
+                elif path == "/nidlogin.login":
+                    self.send_html(LOGIN_PAGE)
+                elif path == "/GoBlogWrite.naver":
+                    if not self.is_logged_in():
+                        self.redirect("/nidlogin.login")
+                        return
+                    self.send_html(WRITE_PAGE)
+                elif path == "/PostWriteForm.naver":
+                    config = json.dumps({"renderDelayMs": int(site.render_delay * 1000), "popups": site.popups})
+                    self.send_html(EDITOR_PAGE.format(config=config))
+                elif path == "/api/posts":
+                    with site.lock:
+                        count = len(site.posts)
+                    body = json.dumps({"count": count}).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                elif path.startswith("/static/"):
+                    with site.lock:
+                        site.asset_requests += 1
+                    time.sleep(site.asset_delay)
+                    extension = path[path.rfind("."):]
+                    body = b"\0" * 2048
+                    self.send_response(200)
+                    self.send_header("Content-Type", STATIC_TYPES.get(extension, "application/octet-stream"))
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self.send_html("<h1>404</h1>", status=404)
+
+            def do_POST(self):
+                path = urllib.parse.urlparse(self.path).path
+                body = self.read_body()
+                if path == "/nidlogin.login":
+                    form = urllib.parse.parse_qs(body.decode("utf-8"))
+                    time.sleep(site.login_delay)
+                    if not form.get("id") or not form.get("pw"):
+                        self.redirect("/nidlogin.login")
+                        return
+                    token = str(int(time.time() * 1000))
+                    self.redirect("/", [f"{name}={token}; Path=/" for name in AUTH_COOKIE_NAMES])
+                elif path == "/api/posts":
+                    time.sleep(site.save_delay)
+                    with site.lock:
+                        site.posts.append(json.loads(body.decode("utf-8") or "{}"))
+                    self.send_response(201)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                else:
+                    self.send_html("<h1>404</h1>", status=404)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 네이버 모의 사이트")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩할 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="포트 (기본값: 8765)")
+    parser.add_argument("--render-delay", type=float, default=0.5, help="에디터 렌더링 지연(초) (기본값: 0.5)")
+    parser.add_argument("--no-popups", action="store_true", help="에디터 팝업을 띄우지 않음")
+    args = parser.parse_args()
+
+    site = MockNaverSite(args.host, args.port, render_delay=args.render_delay, popups=not args.no_popups)
+    print(f"모의 네이버 사이트 실행 중: {site.base_url} (Ctrl+C로 종료)")
+    for name, url in site.urls.items():
+        print(f"  {name}: {url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+        print(f"저장된 글: {len(site.posts)}개")
+
+
+if __name__ == "__main__":
+    main()
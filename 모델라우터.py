@@ -0,0 +1,264 @@
+"""
+여러 API 키와 모델에 Gemini 요청을 나눠 보내는 라우터
+
+키마다 할당량이 따로 잡히므로 (키, 모델) 조합을 하나의 경로로 보고 경로별로 속도 제한,
+응답 시간, 할당량 소진 여부를 관리합니다. 우선 모델의 경로가 모두 포화되면 다음 모델로
+넘어갑니다.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from 생성백엔드 import GeminiBackend
+from 속도제한기 import RateLimiter
+from 재시도정책 import ERROR_QUOTA, classify_error, retry_after_seconds
+
+
+class Route:
+    def __init__(self, model_factory: Callable[[Optional[str]], object], key_label: str, model_name: str,
+                 requests_per_minute: int, tokens_per_minute: int, shared_state: Optional[Tuple] = None):
+        """
+        (API 키, 모델) 경로 초기화
+
+        Args:
+            model_factory (Callable[[Optional[str]], object]): 시스템 지시문을 받아 이 경로의 API 키로
+                생성 모델(generate_content 제공)을 만드는 함수
+            key_label (str): 출력용 키 이름 (키 값을 그대로 출력하지 않음)
+            model_name (str): 모델 이름
+            requests_per_minute (int): 이 경로의 분당 최대 요청 수
+            tokens_per_minute (int): 이 경로의 분당 최대 토큰 수
+            shared_state (Optional[Tuple]): 다른 프로세스와 나눠 쓰는 속도 제한 상태 (None이면 이 프로세스만 사용)
+        """
+        self.key_label = key_label
+        self.model_name = model_name
+        self.model_factory = model_factory
+        # 시스템 지시문별 모델 (컨텍스트 캐시도 모델마다 한 번만 만듦)
+        self.models: Dict[Optional[str], object] = {}
+        self.models_lock = threading.Lock()
+        self.model = self.model_for(None)
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute, shared_state)
+
+        # 할당량 소진 시 이 시각까지 사용하지 않음
+        self.cooldown_until = 0.0
+        self.consecutive_quota_errors = 0
+
+        # 통계
+        self.latency = 0.0
+        self.requests = 0
+        self.successes = 0
+        self.tokens = 0
+        self.errors: Dict[str, int] = {}
+        self.cooldowns = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.key_label}/{self.model_name}"
+
+    def model_for(self, system_instruction: Optional[str]):
+        """
+        시스템 지시문을 붙인 이 경로의 모델 (처음 요청할 때 만들어 재사용)
+
+        Args:
+            system_instruction (Optional[str]): 시스템 지시문 (None이면 지시문 없는 기본 모델)
+
+        Returns:
+            generate_content를 제공하는 생성 모델
+        """
+        with self.models_lock:
+            model = self.models.get(system_instruction)
+            if model is None:
+                model = self.model_factory(system_instruction)
+                self.models[system_instruction] = model
+            return model
+
+
+class ModelRouter:
+    def __init__(self, api_keys: List[str], model_names: List[str],
+                 requests_per_minute: int = 60, tokens_per_minute: int = 250000,
+                 cooldown_seconds: float = 60.0, saturation_wait: float = 2.0, backend=None,
+                 shared_quota: Optional[Dict[str, Tuple]] = None):
+        """
+        라우터 초기화
+
+        Args:
+            api_keys (List[str]): Gemini API 키 목록
+            model_names (List[str]): 우선순위 순서의 모델 이름 목록 (첫 번째가 기본 모델)
+            requests_per_minute (int): 경로(키, 모델)별 분당 최대 요청 수
+            tokens_per_minute (int): 경로(키, 모델)별 분당 최대 토큰 수
+            cooldown_seconds (float): 할당량 오류가 난 경로를 쉬게 할 기본 시간(초)
+            saturation_wait (float): 기본 모델의 대기 시간이 이보다 길면 다음 모델로 넘어감(초)
+            backend: 모델을 만드는 생성 백엔드 (None이면 GeminiBackend)
+            shared_quota (Optional[Dict[str, Tuple]]): 경로 이름별로 여러 프로세스가 나눠 쓰는 속도 제한 상태
+                (속도제한기.create_shared_quota, None이면 프로세스마다 따로 제한)
+        """
+        if not api_keys:
+            raise ValueError("API 키가 하나 이상 필요합니다.")
+        if not model_names:
+            raise ValueError("모델이 하나 이상 필요합니다.")
+
+        self.model_names = list(model_names)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.cooldown_seconds = cooldown_seconds
+        self.saturation_wait = saturation_wait
+        self.lock = threading.Lock()
+        self.backend = backend if backend is not None else GeminiBackend()
+
+        self.routes: List[Route] = []
+        for i, api_key in enumerate(api_keys):
+            key_label = self.key_label(i, api_key)
+            for model_name in self.model_names:
+                def model_factory(system_instruction, api_key=api_key, model_name=model_name):
+                    return self.backend.create_model(api_key, model_name, system_instruction)
+                shared_state = (shared_quota or {}).get(f"{key_label}/{model_name}")
+                self.routes.append(
+                    Route(model_factory, key_label, model_name, requests_per_minute, tokens_per_minute, shared_state)
+                )
+        self.failovers = 0
+
+    @staticmethod
+    def key_label(position: int, api_key: str) -> str:
+        """출력용 키 이름 (키 값을 그대로 출력하지 않음)"""
+        return f"키{position + 1}(…{api_key[-4:]})"
+
+    @classmethod
+    def route_names(cls, api_keys: List[str], model_names: List[str]) -> List[str]:
+        """
+        모델을 만들지 않고 경로 이름만 계산 (여러 프로세스가 나눠 쓸 속도 제한 상태를 미리 만들 때 사용)
+
+        Args:
+            api_keys (List[str]): API 키 목록
+            model_names (List[str]): 모델 이름 목록
+
+        Returns:
+            List[str]: Route.name 목록
+        """
+        return [f"{cls.key_label(i, api_key)}/{model_name}"
+                for i, api_key in enumerate(api_keys) for model_name in model_names]
+
+    def _score(self, route: Route, estimated_tokens: int) -> float:
+        """예상 대기 시간 + 관측된 평균 응답 시간 (작을수록 좋음)"""
+        return route.rate_limiter.wait_time(estimated_tokens) + route.latency
+
+    def choose(self, estimated_tokens: int) -> Route:
+        """
+        요청을 보낼 경로 선택
+
+        모델 우선순위대로 쉬고 있지 않은 경로 중 점수가 가장 좋은 경로를 고르고,
+        기본 모델 경로가 모두 포화(대기 시간이 saturation_wait 초과)되었으면
+        다음 모델로 넘어갑니다. 모든 경로가 쉬는 중이면 가장 먼저 풀리는 경로를 기다립니다.
+
+        Args:
+            estimated_tokens (int): 이번 요청의 예상 토큰 수
+
+        Returns:
+            Route: 선택된 경로
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                best = None
+                for model_name in self.model_names:
+                    candidates = [r for r in self.routes
+                                  if r.model_name == model_name and r.cooldown_until <= now]
+                    if not candidates:
+                        continue
+                    route = min(candidates, key=lambda r: self._score(r, estimated_tokens))
+                    if route.rate_limiter.wait_time(estimated_tokens) <= self.saturation_wait:
+                        return route
+                    if best is None or self._score(route, estimated_tokens) < self._score(best, estimated_tokens):
+                        best = route
+                if best is not None:
+                    # 모든 모델이 포화 상태면 가장 빨리 처리될 경로에서 기다림
+                    return best
+                wait = min(r.cooldown_until for r in self.routes) - now
+
+            print(f"모든 API 키가 할당량 대기 중입니다. {wait:.0f}초 후 다시 시도합니다.")
+            time.sleep(max(0.1, wait))
+
+    def acquire(self, estimated_tokens: int) -> Route:
+        """
+        경로를 고르고 그 경로의 속도 제한 권한을 얻을 때까지 대기
+
+        Args:
+            estimated_tokens (int): 이번 요청의 예상 토큰 수
+
+        Returns:
+            Route: 요청을 보낼 경로
+        """
+        route = self.choose(estimated_tokens)
+        route.rate_limiter.acquire(estimated_tokens)
+        with self.lock:
+            route.requests += 1
+            if route.model_name != self.model_names[0]:
+                self.failovers += 1
+        return route
+
+    def report_success(self, route: Route, latency: float, tokens: int = 0):
+        """
+        성공한 요청 기록 (응답 시간은 지수 이동 평균으로 반영)
+
+        Args:
+            route (Route): 요청을 보낸 경로
+            latency (float): 응답 시간(초)
+            tokens (int): 사용한 토큰 수
+        """
+        with self.lock:
+            route.latency = latency if route.successes == 0 else route.latency * 0.8 + latency * 0.2
+            route.successes += 1
+            route.tokens += tokens
+            route.consecutive_quota_errors = 0
+
+    def report_error(self, route: Route, error: Exception):
+        """
+        실패한 요청 기록 (할당량 오류면 경로를 쉬게 함, 연속으로 나면 쉬는 시간을 늘림)
+
+        Args:
+            route (Route): 요청을 보낸 경로
+            error (Exception): 발생한 예외
+        """
+        kind = classify_error(error)
+        with self.lock:
+            route.errors[kind] = route.errors.get(kind, 0) + 1
+            if kind != ERROR_QUOTA:
+                return
+            route.consecutive_quota_errors += 1
+            cooldown = min(600.0, self.cooldown_seconds * 2 ** (route.consecutive_quota_errors - 1))
+            cooldown = max(cooldown, retry_after_seconds(error) or 0)
+            route.cooldown_until = time.monotonic() + cooldown
+            route.cooldowns += 1
+        print(f"{route.name} 할당량 소진: {cooldown:.0f}초 동안 다른 키/모델을 사용합니다.")
+
+    def describe(self) -> str:
+        """시작 시 출력할 라우터 설정 요약"""
+        keys = len(self.routes) // len(self.model_names)
+        return (f"{self.backend.name} 백엔드, API 키 {keys}개 × 모델 {', '.join(self.model_names)}, "
+                f"경로별 분당 {self.requests_per_minute}회 / {self.tokens_per_minute}토큰")
+
+    def print_stats(self):
+        """키/모델별 요청, 오류, 토큰, 평균 응답 시간 출력"""
+        with self.lock:
+            routes = [r for r in self.routes if r.requests]
+            if not routes:
+                return
+            print("\n=== API 키/모델별 사용량 ===")
+            print(f"{'경로':<36} | {'요청':>5} | {'성공':>5} | {'토큰':>8} | {'응답':>6} | 오류")
+            print("-" * 82)
+            for route in routes:
+                errors = ", ".join(f"{kind} {count}" for kind, count in route.errors.items()) or "-"
+                print(f"{route.name:<36} | {route.requests:>5} | {route.successes:>5} | {route.tokens:>8} | "
+                      f"{route.latency:>5.1f}s | {errors}")
+
+            for label, key in (("키별", lambda r: r.key_label), ("모델별", lambda r: r.model_name)):
+                totals: Dict[str, List[int]] = {}
+                for route in routes:
+                    total = totals.setdefault(key(route), [0, 0, 0])
+                    total[0] += route.requests
+                    total[1] += route.successes
+                    total[2] += route.cooldowns
+                print(f"{label}: " + ", ".join(
+                    f"{name} 요청 {r}회/성공 {s}회/쉼 {c}회" for name, (r, s, c) in totals.items()
+                ))
+            if self.failovers:
+                print(f"기본 모델 포화로 다음 모델을 사용한 요청: {self.failovers}회")
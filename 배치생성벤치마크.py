@@ -0,0 +1,94 @@
+"""
+배치 크기별 글당 토큰 사용량과 소요 시간 비교 벤치마크 (실제 Gemini API 호출)
+
+사용법:
+    export GOOGLE_API_KEY='your-api-key'
+    python 배치생성벤치마크.py                    # 배치 크기 1, 4, 8 비교
+    python 배치생성벤치마크.py --titles 16 --batch-sizes 1 8
+"""
+
+import argparse
+import os
+import time
+
+from 블로그글AI완성하기 import BlogContentGenerator
+from 응답캐시 import ResponseCache
+
+SAMPLE_TITLES = [
+    "2024년 최신 부업 추천 - 집에서 월 100만원 벌기",
+    "다이어트 성공 후기 - 3개월 만에 10kg 감량한 비법",
+    "ChatGPT 활용법 완벽 가이드 - 업무 효율 200% 향상",
+    "부동산 투자 초보자를 위한 완벽 가이드",
+    "코딩 독학 로드맵 - 6개월 만에 개발자 되기",
+    "겨울철 난방비 절약 꿀팁 총정리",
+    "초보 캠핑 준비물 체크리스트",
+    "직장인 재테크 시작하는 법",
+]
+
+
+def run_benchmark(api_key: str, titles: list, batch_size: int) -> dict:
+    """
+    주어진 배치 크기로 제목 목록 전체를 생성하고 사용량 측정
+
+    Args:
+        api_key (str): Gemini API 키
+        titles (list): 블로그 제목 목록
+        batch_size (int): 한 번의 요청에 묶을 제목 수
+
+    Returns:
+        dict: 글 수, 전체 토큰, 소요 시간(초), 개별 요청 전환 횟수
+    """
+    # 캐시를 끄고 순차 실행하여 요청당 비용만 비교
+    generator = BlogContentGenerator(
+        api_key, max_workers=1, cache=ResponseCache(enabled=False), batch_size=batch_size
+    )
+
+    started = time.perf_counter()
+    posts = 0
+    for i in range(0, len(titles), batch_size):
+        chunk = titles[i:i + batch_size]
+        contents = None
+        if len(chunk) > 1:
+            contents = generator.generate_blog_contents_batch(chunk)
+        if contents is None:
+            contents = [generator.generate_blog_content(title) for title in chunk]
+        posts += len(contents)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "posts": posts,
+        "tokens": generator.tokens_used,
+        "seconds": elapsed,
+        "fallbacks": generator.batch_fallbacks,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 생성 벤치마크")
+    parser.add_argument("--titles", type=int, default=8, help="생성할 글 수 (기본값: 8)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8],
+                        help="비교할 배치 크기 목록 (기본값: 1 4 8)")
+    args = parser.parse_args()
+
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        print("오류: GOOGLE_API_KEY 환경변수가 설정되지 않았습니다.")
+        return
+
+    titles = [SAMPLE_TITLES[i % len(SAMPLE_TITLES)] for i in range(args.titles)]
+
+    results = []
+    for batch_size in args.batch_sizes:
+        print(f"\n배치 크기 {batch_size} 측정 중...")
+        results.append((batch_size, run_benchmark(api_key, titles, batch_size)))
+
+    print(f"\n{'배치 크기':>8} | {'글당 토큰':>9} | {'글당 시간':>9} | {'개별 전환':>8}")
+    print("-" * 46)
+    for batch_size, result in results:
+        posts = max(1, result["posts"])
+        print(f"{batch_size:>8} | {result['tokens'] / posts:>9.0f} | "
+              f"{result['seconds'] / posts:>8.2f}s | {result['fallbacks']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""
+생성된 본문을 API 호출 없이 한꺼번에 검사하는 품질 게이트
+
+본문 열 전체를 pandas/numpy 배열 연산으로 한 번에 검사합니다 (API 호출 없음).
+검사 항목: 길이(목표 1000~1500자), 서론-본론-결론을 나눌 만한 문단 수, 끝이 잘린 문장,
+같은 문장 반복 비율, 금지 표현. 통과하지 못한 행은 재생성 대기열 파일에 기록하고
+생성기(--regenerate-queue)가 그 행만 문제를 알려 주는 프롬프트로 다시 생성합니다.
+
+사용법 (시트 전체 검사 후 재생성 대기열 기록):
+    python 본문품질검사.py --excel posting.xlsx
+    python 블로그글AI완성하기.py --excel posting.xlsx --regenerate-queue
+"""
+
+import argparse
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from 체크포인트저널 import CheckpointJournal
+from 엑셀스트리밍 import StreamingExcelReader
+
+# 프롬프트에서 요구하는 길이 (블로그글AI완성하기.TARGET_MIN_CHARS/TARGET_MAX_CHARS와 같음)
+TARGET_MIN_CHARS = 1000
+TARGET_MAX_CHARS = 1500
+# 목표 길이에서 이만큼 벗어나야 실패로 봄 (조금 짧거나 긴 글까지 다시 생성하지 않도록)
+LENGTH_TOLERANCE = 0.2
+
+# 실패 사유
+REASON_EMPTY = "본문 없음"
+REASON_SHORT = "너무 짧음"
+REASON_LONG = "너무 김"
+REASON_STRUCTURE = "문단 부족"
+REASON_TRUNCATED = "끝이 잘림"
+REASON_REPEATED = "문장 반복"
+REASON_BANNED = "금지 표현"
+
+# 다시 생성할 때 프롬프트에 덧붙이는 사유별 요구사항
+REPAIR_INSTRUCTIONS = {
+    REASON_EMPTY: "본문을 빠짐없이 작성",
+    REASON_SHORT: f"분량을 {TARGET_MIN_CHARS}-{TARGET_MAX_CHARS}자로 충분히 채울 것",
+    REASON_LONG: f"분량을 {TARGET_MAX_CHARS}자 이내로 줄일 것",
+    REASON_STRUCTURE: "서론, 본론, 결론을 빈 줄로 구분된 문단으로 나눌 것",
+    REASON_TRUNCATED: "마지막 문장까지 끝맺을 것",
+    REASON_REPEATED: "같은 문장을 되풀이하지 말 것",
+    REASON_BANNED: "AI임을 밝히거나 사과하는 말, 작성 안내 문구를 넣지 말 것",
+}
+
+# 모델이 본문 대신 넣는 흔한 문구 (본문에 그대로 게시되면 안 됨)
+DEFAULT_BANNED_PHRASES = (
+    "AI 언어 모델",
+    "언어 모델로서",
+    "저는 AI",
+    "인공지능으로서",
+    "죄송하지만",
+    "죄송합니다만",
+    "도와드릴 수 없",
+    "As an AI",
+    "as an AI",
+    "블로그 본문:",
+    "본문을 작성해 드리겠습니다",
+    "[제목]",
+    "(여기에",
+    "Lorem ipsum",
+)
+
+# 문장 끝으로 보고 줄바꿈으로 바꾼 뒤 나누는 문장부호+공백 (정규식보다 빠른 문자열 치환 사용)
+SENTENCE_BREAKS = (". ", "? ", "! ")
+# 문장으로 끝났다고 볼 수 있는 마지막 글자 (문장부호, 닫는 괄호/따옴표, 종결 어미, 이모지)
+ENDING_CHARS = r"[.!?。…~)\]」』\"'”’다요죠까니음함임\U0001F300-\U0001FAFF]"
+
+
+def load_banned_phrases(path: str) -> List[str]:
+    """
+    금지 표현 파일 읽기 (한 줄에 하나, #으로 시작하는 줄은 주석)
+
+    Args:
+        path (str): 금지 표현 파일 경로
+
+    Returns:
+        List[str]: 금지 표현 목록
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+class QualityGate:
+    def __init__(self, min_chars: int = int(TARGET_MIN_CHARS * (1 - LENGTH_TOLERANCE)),
+                 max_chars: int = int(TARGET_MAX_CHARS * (1 + LENGTH_TOLERANCE)),
+                 min_paragraphs: int = 3, max_repeated_ratio: float = 0.2,
+                 banned_phrases: Iterable[str] = DEFAULT_BANNED_PHRASES):
+        """
+        본문 품질 게이트 초기화
+
+        Args:
+            min_chars (int): 최소 길이 (앞뒤 공백 제외)
+            max_chars (int): 최대 길이
+            min_paragraphs (int): 최소 문단 수 (서론-본론-결론이면 3개 이상)
+            max_repeated_ratio (float): 허용하는 반복 문장 비율 (0~1)
+            banned_phrases (Iterable[str]): 금지 표현 목록 (대소문자 구분)
+        """
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.min_paragraphs = min_paragraphs
+        self.max_repeated_ratio = max_repeated_ratio
+        self.banned_phrases = [phrase for phrase in banned_phrases if phrase]
+        # 금지 표현 전체를 정규식 하나로 묶어 본문마다 한 번만 훑음
+        # (IGNORECASE를 쓰면 한글 본문에서 몇 배 느려지므로 대소문자는 목록에서 따로 지정)
+        self.banned_pattern = (
+            re.compile("|".join(re.escape(phrase) for phrase in self.banned_phrases))
+            if self.banned_phrases else None
+        )
+
+        self.checked = 0
+        self.failed = 0
+        self.reason_counts: Dict[str, int] = {}
+
+    @staticmethod
+    def count_sentences(text: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        본문별 문장 수와 반복된 문장 수 계산
+
+        문장부호 뒤 공백을 줄바꿈으로 바꿔 본문 열 전체를 문장 단위 Series로 펼친 뒤(explode)
+        같은 행 안에서 중복된 문장을 duplicated()로 찾고 행별로 셉니다.
+
+        Args:
+            text (pd.Series): 공백을 정리한 본문 (0부터 시작하는 인덱스)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (문장 수, 반복된 문장 수)
+        """
+        lines = text
+        for mark in SENTENCE_BREAKS:
+            lines = lines.str.replace(mark, mark[0] + "\n", regex=False)
+        sentences = lines.str.split("\n").explode()
+        sentences = sentences[sentences.to_numpy() != ""]
+
+        # 문장 문자열 대신 (행, 문장 해시)로 중복을 비교 (문자열 열보다 몇 배 빠르고,
+        # 64비트 해시라 서로 다른 문장이 같은 값이 될 일은 사실상 없음)
+        hashes = np.fromiter(map(hash, sentences.to_numpy()), dtype=np.int64, count=len(sentences))
+        repeated = pd.DataFrame({"row": sentences.index.to_numpy(), "hash": hashes}).duplicated()
+        counts = pd.Series(repeated.to_numpy(), index=sentences.index).groupby(level=0).agg(["size", "sum"])
+        counts = counts.reindex(text.index, fill_value=0)
+        return counts["size"].to_numpy(), counts["sum"].to_numpy()
+
+    def check(self, bodies: Iterable) -> pd.DataFrame:
+        """
+        본문 여러 개를 한꺼번에 검사
+
+        Args:
+            bodies (Iterable): 본문 목록 또는 Series (None/NaN은 빈 본문)
+
+        Returns:
+            pd.DataFrame: 입력과 같은 순서의 검사 결과
+                (chars, paragraphs, repeated_ratio, reasons; reasons가 빈 문자열이면 통과)
+        """
+        original = bodies if isinstance(bodies, pd.Series) else pd.Series(list(bodies), dtype=object)
+        text = original.reset_index(drop=True).fillna("").astype(str).str.strip()
+
+        chars = text.str.len().to_numpy()
+        empty = chars == 0
+
+        # 빈 줄로 나눈 문단 수 (빈 줄이 없는 행만 줄바꿈 하나로 나눈 문단으로 다시 셈)
+        paragraphs = text.str.count("\n\n").to_numpy() + 1
+        single = (paragraphs == 1) & ~empty
+        if single.any():
+            paragraphs[single] = text[single].str.count("\n").to_numpy() + 1
+        paragraphs[empty] = 0
+
+        sentences, repeated = self.count_sentences(text)
+        repeated_ratio = repeated / np.maximum(sentences, 1)
+
+        # 마지막 글자만 잘라 검사 (본문 전체에 $ 정규식을 돌리지 않음)
+        finished = text.str[-1:].str.match(ENDING_CHARS).to_numpy()
+        checks = [
+            (REASON_EMPTY, empty),
+            (REASON_SHORT, ~empty & (chars < self.min_chars)),
+            (REASON_LONG, chars > self.max_chars),
+            (REASON_STRUCTURE, ~empty & (paragraphs < self.min_paragraphs)),
+            (REASON_TRUNCATED, ~empty & ~finished),
+            (REASON_REPEATED, repeated_ratio > self.max_repeated_ratio),
+        ]
+        if self.banned_pattern is not None:
+            checks.append((REASON_BANNED, text.str.contains(self.banned_pattern, regex=True).to_numpy()))
+
+        # 사유별 불리언 배열을 "사유, 사유" 문자열로 합침
+        reasons = np.full(len(text), "", dtype=object)
+        for reason, mask in checks:
+            reasons = np.where(mask, np.where(reasons == "", reason, reasons + ", " + reason), reasons)
+
+        result = pd.DataFrame({
+            "chars": chars,
+            "paragraphs": paragraphs,
+            "repeated_ratio": repeated_ratio.round(3),
+            "reasons": reasons,
+        }, index=original.index)
+
+        self.checked += len(result)
+        self.failed += int(np.count_nonzero(reasons != ""))
+        for reason, mask in checks:
+            count = int(np.count_nonzero(mask))
+            if count:
+                self.reason_counts[reason] = self.reason_counts.get(reason, 0) + count
+        return result
+
+    def failures(self, body: Optional[str]) -> List[str]:
+        """
+        본문 하나의 실패 사유 (생성 직후 검사용)
+
+        Args:
+            body (Optional[str]): 본문
+
+        Returns:
+            List[str]: 실패 사유 목록 (통과하면 빈 목록)
+        """
+        reasons = self.check([body])["reasons"].iloc[0]
+        return reasons.split(", ") if reasons else []
+
+    def stats(self) -> str:
+        """
+        검사 통계 문자열
+
+        Returns:
+            str: 검사/실패 수와 사유별 건수
+        """
+        summary = f"검사 {self.checked}개, 실패 {self.failed}개"
+        if self.reason_counts:
+            summary += " (" + ", ".join(f"{reason} {count}" for reason, count in self.reason_counts.items()) + ")"
+        return summary
+
+
+def repair_instruction(reasons: Iterable[str]) -> str:
+    """
+    실패 사유를 다시 생성할 때 프롬프트에 넣을 요구사항으로 변환
+
+    Args:
+        reasons (Iterable[str]): 실패 사유 목록
+
+    Returns:
+        str: 쉼표로 이은 요구사항
+    """
+    return ", ".join(REPAIR_INSTRUCTIONS.get(reason, reason) for reason in reasons)
+
+
+def regeneration_queue_path(excel_file: str) -> str:
+    """
+    시트의 재생성 대기열 파일 경로
+
+    Args:
+        excel_file (str): Excel 파일 경로
+
+    Returns:
+        str: 재생성 대기열 파일 경로 (예: posting.xlsx.regenerate.jsonl)
+    """
+    return f"{excel_file}.regenerate.jsonl"
+
+
+def save_regeneration_queue(excel_file: str, failures: Dict[int, Tuple[str, List[str]]],
+                            repair_attempts: Optional[Dict[int, int]] = None):
+    """
+    다시 생성할 행을 대기열 파일에 기록 (기존 대기열은 덮어씀)
+
+    체크포인트 저널 형식을 그대로 쓰고 content에 실패 사유, repairs에 지금까지 다시 생성한 횟수를 넣습니다.
+
+    Args:
+        excel_file (str): Excel 파일 경로
+        failures (Dict[int, Tuple[str, List[str]]]): DataFrame 인덱스별 (제목, 실패 사유 목록)
+        repair_attempts (Optional[Dict[int, int]]): DataFrame 인덱스별 다시 생성한 횟수
+    """
+    repair_attempts = repair_attempts or {}
+    journal = CheckpointJournal(regeneration_queue_path(excel_file))
+    journal.open(reset=True)
+    try:
+        for index in sorted(failures):
+            title, reasons = failures[index]
+            journal.append(index, title, ", ".join(reasons), repairs=repair_attempts.get(index, 0))
+    finally:
+        journal.close()
+
+
+def load_regeneration_queue(excel_file: str) -> Dict[int, Tuple[str, List[str]]]:
+    """
+    재생성 대기열 읽기
+
+    Args:
+        excel_file (str): Excel 파일 경로
+
+    Returns:
+        Dict[int, Tuple[str, List[str]]]: DataFrame 인덱스별 (제목, 실패 사유 목록)
+    """
+    entries = CheckpointJournal(regeneration_queue_path(excel_file)).load()
+    return {
+        index: (entry["title"], [reason for reason in entry["content"].split(", ") if reason])
+        for index, entry in entries.items()
+    }
+
+
+def load_repair_attempts(excel_file: str) -> Dict[int, int]:
+    """
+    재생성 대기열에 기록된 행별 다시 생성 횟수 읽기
+
+    Args:
+        excel_file (str): Excel 파일 경로
+
+    Returns:
+        Dict[int, int]: DataFrame 인덱스별 다시 생성한 횟수 (횟수를 기록하지 않은 대기열이면 0)
+    """
+    entries = CheckpointJournal(regeneration_queue_path(excel_file)).load()
+    return {index: int(entry.get("repairs", 0)) for index, entry in entries.items()}
+
+
+def check_sheet(excel_file: str, gate: QualityGate) -> pd.DataFrame:
+    """
+    시트의 본문 열 전체 검사 (제목이 없는 행은 제외)
+
+    Args:
+        excel_file (str): Excel 파일 경로
+        gate (QualityGate): 품질 게이트
+
+    Returns:
+        pd.DataFrame: DataFrame 인덱스별 제목과 검사 결과
+    """
+    indexes, titles, bodies = [], [], []
+    for row_number, values in StreamingExcelReader(excel_file).iter_values():
+        title = values[0] if len(values) > 0 else None
+        if title is None or str(title).strip() == "":
+            continue
+        indexes.append(row_number - 2)
+        titles.append(str(title))
+        bodies.append(values[1] if len(values) > 1 else None)
+
+    result = gate.check(pd.Series(bodies, index=indexes, dtype=object))
+    result.insert(0, "title", titles)
+    return result
+
+
+def parse_args():
+    """
+    명령행 인자 파싱
+    """
+    parser = argparse.ArgumentParser(description="생성된 본문 품질 검사와 재생성 대기열 기록")
+    parser.add_argument("--excel", default="posting.xlsx",
+                        help="제목/본문 Excel 파일 (기본값: posting.xlsx)")
+    parser.add_argument("--min-chars", type=int, default=int(TARGET_MIN_CHARS * (1 - LENGTH_TOLERANCE)),
+                        help="최소 본문 길이 (기본값: %(default)s)")
+    parser.add_argument("--max-chars", type=int, default=int(TARGET_MAX_CHARS * (1 + LENGTH_TOLERANCE)),
+                        help="최대 본문 길이 (기본값: %(default)s)")
+    parser.add_argument("--min-paragraphs", type=int, default=3,
+                        help="최소 문단 수 (기본값: 3)")
+    parser.add_argument("--max-repeated", type=float, default=0.2,
+                        help="허용하는 반복 문장 비율 (기본값: 0.2)")
+    parser.add_argument("--banned", default=None,
+                        help="금지 표현 파일 (한 줄에 하나, 없으면 기본 목록)")
+    parser.add_argument("--include-empty", action="store_true",
+                        help="본문이 없는 행도 대기열에 넣음 (기본값: 아직 생성하지 않은 행으로 보고 제외)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="결과만 출력하고 재생성 대기열 파일은 쓰지 않음")
+    return parser.parse_args()
+
+
+def main():
+    """
+    메인 실행 함수
+    """
+    args = parse_args()
+    gate = QualityGate(
+        min_chars=args.min_chars,
+        max_chars=args.max_chars,
+        min_paragraphs=args.min_paragraphs,
+        max_repeated_ratio=args.max_repeated,
+        banned_phrases=load_banned_phrases(args.banned) if args.banned else DEFAULT_BANNED_PHRASES,
+    )
+
+    try:
+        started = time.perf_counter()
+        result = check_sheet(args.excel, gate)
+        elapsed = time.perf_counter() - started
+    except FileNotFoundError:
+        print(f"오류: {args.excel} 파일을 찾을 수 없습니다.")
+        return
+
+    failed = result[result["reasons"] != ""]
+    if not args.include_empty:
+        failed = failed[failed["chars"] > 0]
+
+    print(f"{args.excel}: {gate.stats()} ({elapsed:.2f}초, 시트 읽기 포함)")
+    for index, row in failed.head(20).iterrows():
+        print(f"  {index + 2}행 {row['title']}: {row['reasons']} "
+              f"({row['chars']}자, 문단 {row['paragraphs']}개, 반복 {row['repeated_ratio']:.0%})")
+    if len(failed) > 20:
+        print(f"  ... 외 {len(failed) - 20}개")
+
+    if args.dry_run:
+        return
+    # 다시 검사해도 지난 대기열의 재생성 횟수는 이어 감 (같은 프롬프트를 반복하지 않도록)
+    save_regeneration_queue(args.excel, {
+        index: (row["title"], row["reasons"].split(", ")) for index, row in failed.iterrows()
+    }, load_repair_attempts(args.excel))
+    print(f"재생성 대기열에 {len(failed)}개 행을 기록했습니다: {regeneration_queue_path(args.excel)}")
+    if len(failed):
+        print(f"다시 생성: python 블로그글AI완성하기.py --excel {args.excel} --regenerate-queue")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+아주 큰 제목 시트를 행 구간(샤드)으로 나눠 여러 프로세스에서 본문을 생성하는 실행기
+
+BlogContentGenerator 하나는 파이썬 인터프리터 하나에서 돌기 때문에 JSON 파싱, 프롬프트 작성,
+Excel 읽기/쓰기가 CPU 코어 하나에 묶입니다. 이 실행기는 posting.xlsx(또는 시트가 여러 개 든 폴더)를
+정해진 행 수의 샤드 시트로 나누고, 샤드마다 별도 프로세스에서 스트리밍 모드로 생성합니다.
+
+- 샤드마다 자기 저널(shard_0001.xlsx.journal.jsonl)과 로그가 있어 중단되면 그 샤드만 이어서 처리합니다.
+- (API 키, 모델) 경로별 속도 제한은 공유 메모리에 두어 모든 프로세스가 하나의 할당량을 나눠 씁니다.
+- 한 샤드가 실패해도 나머지 샤드는 계속 처리하고, 끝나면 원래 행 순서대로 하나의 시트로 합칩니다.
+
+사용법:
+    python 분할생성실행기.py --excel posting.xlsx --rows-per-shard 1000 --processes 8
+    python 분할생성실행기.py --excel sheets/ --output posting_merged.xlsx     # 폴더 안의 시트를 순서대로 합침
+    python 분할생성실행기.py --excel posting.xlsx --mock                     # 모의 백엔드로 처리량 측정
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from 엑셀스트리밍 import HEADER, StreamingExcelReader, StreamingExcelWriter
+from 모델라우터 import ModelRouter
+from 속도제한기 import create_shared_quota
+
+MANIFEST_NAME = "manifest.json"
+
+# 자식 프로세스에서 쓰는 공유 속도 제한 상태 (init_worker가 설정)
+_shared_quota: Optional[Dict[str, Tuple]] = None
+
+
+def natural_key(path: str) -> list:
+    """posting_2.xlsx가 posting_10.xlsx보다 앞에 오도록 숫자를 숫자로 비교하는 정렬 키"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", os.path.basename(path))]
+
+
+def list_sources(path: str) -> List[str]:
+    """
+    처리할 시트 목록 (파일이면 그 파일, 폴더면 안의 .xlsx를 이름의 숫자 순서대로)
+
+    Args:
+        path (str): Excel 파일 또는 폴더
+
+    Returns:
+        List[str]: 시트 경로 목록
+    """
+    if not os.path.isdir(path):
+        return [path]
+    sources = [os.path.join(path, name) for name in os.listdir(path)
+               if name.endswith(".xlsx") and not name.startswith("~$")]
+    return sorted(sources, key=natural_key)
+
+
+def init_worker(shared_quota: Dict[str, Tuple]):
+    """자식 프로세스 초기화 (공유 속도 제한 상태 보관)"""
+    global _shared_quota
+    _shared_quota = shared_quota
+
+
+def count_filled(path: str) -> int:
+    """본문이 채워진 행 수"""
+    return sum(1 for _, title, body in StreamingExcelReader(path).iter_rows()
+               if title and body is not None and str(body).strip() != "")
+
+
+def run_shard(shard: dict, options: dict) -> dict:
+    """
+    샤드 하나를 생성 (자식 프로세스에서 실행, 출력은 샤드 로그 파일로)
+
+    샤드 저널로 이어하기 하므로 다시 실행하면 완료된 행은 API를 호출하지 않습니다.
+    응답 캐시도 샤드마다 따로 두어 프로세스끼리 SQLite 잠금을 다투지 않게 합니다.
+
+    Args:
+        shard (dict): 샤드 정보 (name, path, titles)
+        options (dict): 생성기 설정
+
+    Returns:
+        dict: name, filled, elapsed, error
+    """
+    from 블로그글AI완성하기 import BlogContentGenerator
+    from 실행추적 import Tracer
+    from 응답캐시 import ResponseCache
+
+    started = time.perf_counter()
+    result = {"name": shard["name"], "filled": 0, "elapsed": 0.0, "error": None}
+    try:
+        with open(f"{shard['path']}.log", "a", encoding="utf-8") as log, contextlib.redirect_stdout(log):
+            backend = None
+            if options["mock"]:
+                from 생성백엔드 import MockBackend
+                backend = MockBackend(latency_median=options["mock_latency"], seed=None)
+
+            generator = BlogContentGenerator(
+                options["api_keys"][0],
+                max_workers=options["workers"],
+                requests_per_minute=options["rpm"],
+                tokens_per_minute=options["tpm"],
+                cache=ResponseCache(f"{shard['path']}.cache.sqlite3"),
+                tracer=Tracer(),
+                api_keys=options["api_keys"],
+                model_names=options["models"],
+                backend=backend,
+                excel_file=shard["path"],
+                shared_quota=_shared_quota,
+            )
+            generator.process_all_titles(options["api_keys"][0], resume=True, streaming=True)
+        result["filled"] = count_filled(shard["path"])
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+class ShardedRunner:
+    def __init__(self, source: str, work_dir: Optional[str] = None, rows_per_shard: int = 1000,
+                 processes: Optional[int] = None):
+        """
+        샤드 실행기 초기화
+
+        Args:
+            source (str): 제목 Excel 파일 또는 시트가 든 폴더
+            work_dir (Optional[str]): 샤드 시트/저널/로그를 둘 폴더 (None이면 "<source>.shards")
+            rows_per_shard (int): 샤드 하나의 행 수
+            processes (Optional[int]): 동시에 실행할 프로세스 수 (None이면 CPU 코어 수)
+        """
+        self.source = source
+        self.sources = list_sources(source)
+        if not self.sources:
+            raise ValueError(f"{source}에서 처리할 .xlsx 시트를 찾지 못했습니다.")
+        self.work_dir = work_dir or f"{source.rstrip(os.sep)}.shards"
+        self.rows_per_shard = max(1, rows_per_shard)
+        self.processes = processes or os.cpu_count() or 1
+        self.manifest_path = os.path.join(self.work_dir, MANIFEST_NAME)
+
+    def source_signature(self) -> List[dict]:
+        """원본 시트가 바뀌었는지 확인하기 위한 경로/크기/수정 시각"""
+        signature = []
+        for path in self.sources:
+            stat = os.stat(path)
+            signature.append({"path": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime})
+        return signature
+
+    def load_manifest(self) -> Optional[dict]:
+        """원본과 샤드 크기가 같을 때만 지난 실행의 샤드 목록 사용 (샤드 저널로 이어하기)"""
+        if not os.path.exists(self.manifest_path):
+            return None
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (manifest.get("sources") != self.source_signature()
+                or manifest.get("rows_per_shard") != self.rows_per_shard
+                or not all(os.path.exists(shard["path"]) for shard in manifest["shards"])):
+            return None
+        return manifest
+
+    def split(self) -> dict:
+        """
+        원본 시트를 행 구간별 샤드 시트로 나누기 (한 행씩 스트리밍으로 복사)
+
+        빈 행도 그대로 복사하여 샤드의 n번째 행이 원본의 몇 번째 행인지 계산으로 알 수 있게 합니다.
+
+        Returns:
+            dict: 매니페스트 (sources, rows_per_shard, shards)
+        """
+        os.makedirs(self.work_dir, exist_ok=True)
+        # 원본이 바뀌었으면 지난 샤드의 저널/캐시/로그는 쓸 수 없으므로 지움
+        for name in os.listdir(self.work_dir):
+            if name.startswith("shard_"):
+                os.remove(os.path.join(self.work_dir, name))
+
+        shards = []
+        writer = None
+        for source_position, source_path in enumerate(self.sources):
+            rows_in_shard = 0
+            for row_number, title, body in StreamingExcelReader(source_path).iter_rows():
+                if writer is None or rows_in_shard >= self.rows_per_shard:
+                    if writer is not None:
+                        writer.close()
+                    name = f"shard_{len(shards) + 1:04d}"
+                    path = os.path.join(self.work_dir, f"{name}.xlsx")
+                    shards.append({"name": name, "path": path, "source": source_position,
+                                   "start_row": row_number, "rows": 0, "titles": 0})
+                    writer = StreamingExcelWriter(path)
+                    rows_in_shard = 0
+                writer.write_row(title, body)
+                rows_in_shard += 1
+                shards[-1]["rows"] += 1
+                if title is not None and str(title).strip() != "":
+                    shards[-1]["titles"] += 1
+            # 샤드가 두 시트에 걸치지 않도록 시트가 바뀌면 새 샤드 시작
+            if writer is not None:
+                writer.close()
+                writer = None
+
+        manifest = {"sources": self.source_signature(), "rows_per_shard": self.rows_per_shard, "shards": shards}
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        return manifest
+
+    def run_shards(self, shards: List[dict], options: dict) -> List[dict]:
+        """
+        샤드를 프로세스 풀에서 실행 (실패한 샤드가 있어도 나머지는 계속)
+
+        Args:
+            shards (List[dict]): 샤드 목록
+            options (dict): 생성기 설정 (api_keys, models, workers, rpm, tpm, mock, mock_latency)
+
+        Returns:
+            List[dict]: 샤드별 결과 (run_shard 반환값)
+        """
+        route_names = ModelRouter.route_names(options["api_keys"], options["models"])
+        shared_quota = create_shared_quota(route_names, options["rpm"], options["tpm"])
+        processes = min(self.processes, len(shards))
+        print(f"샤드 {len(shards)}개를 프로세스 {processes}개로 실행합니다 "
+              f"(프로세스당 동시 호출 {options['workers']}개, 경로 {len(route_names)}개의 할당량 공유)")
+
+        results = []
+        with ProcessPoolExecutor(max_workers=processes, initializer=init_worker,
+                                 initargs=(shared_quota,)) as executor:
+            futures = {executor.submit(run_shard, shard, options): shard for shard in shards}
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    # 프로세스가 비정상 종료되면 남은 샤드도 결과를 받을 수 없음 (다시 실행하면 이어서 처리)
+                    result = {"name": shard["name"], "filled": 0, "elapsed": 0.0, "error": f"프로세스 종료: {e}"}
+                results.append(result)
+                status = "완료" if result["error"] is None and result["filled"] >= shard["titles"] else "미완료"
+                print(f"{'✓' if status == '완료' else '✗'} {shard['name']} {status}: "
+                      f"{result['filled']}/{shard['titles']}행, {result['elapsed']:.1f}초"
+                      + (f" ({result['error']})" if result["error"] else ""))
+        return results
+
+    def iter_shard_rows(self, shards: List[dict]) -> Iterator[Tuple[int, int, Optional[str], Optional[str]]]:
+        """
+        샤드 시트의 행을 (원본 번호, 원본 행 번호, 제목, 본문)으로 순서대로 생성
+
+        Args:
+            shards (List[dict]): 샤드 목록 (원본 순서)
+
+        Yields:
+            Tuple[int, int, Optional[str], Optional[str]]: 원본 번호, 원본 행 번호, 제목, 본문
+        """
+        for shard in shards:
+            for row_number, title, body in StreamingExcelReader(shard["path"]).iter_rows():
+                yield shard["source"], shard["start_row"] + row_number - 2, title, body
+
+    def merge(self, shards: List[dict], output: str) -> int:
+        """
+        샤드의 본문을 원본 행 순서대로 하나의 시트에 합쳐 저장
+
+        원본의 추가 열(포스팅 상태 등)은 그대로 두고, 제목이 같은 행의 본문만 샤드 값으로 바꿉니다.
+
+        Args:
+            shards (List[dict]): 샤드 목록
+            output (str): 저장할 Excel 파일 (원본과 같으면 임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            int: 본문이 채워진 행 수
+        """
+        header = StreamingExcelReader(self.sources[0]).read_header()
+        temp_path = f"{output}.merging.xlsx"
+        writer = StreamingExcelWriter(temp_path, header=header if len(header) >= len(HEADER) else HEADER)
+        shard_rows = self.iter_shard_rows(shards)
+        filled = 0
+
+        for source_position, source_path in enumerate(self.sources):
+            for row_number, values in StreamingExcelReader(source_path).iter_values():
+                title = values[0] if len(values) > 0 else None
+                body = values[1] if len(values) > 1 else None
+                shard_source, shard_row, shard_title, shard_body = next(shard_rows, (None, None, None, None))
+                if (shard_source, shard_row) != (source_position, row_number):
+                    writer.close()
+                    os.remove(temp_path)
+                    raise ValueError(f"{source_path} {row_number}행이 샤드와 맞지 않습니다. 원본이 실행 중에 바뀌었습니다.")
+                if shard_title == title and shard_body is not None and str(shard_body).strip() != "":
+                    body = shard_body
+                if title and body is not None and str(body).strip() != "":
+                    filled += 1
+                writer.write_row(title, body, *values[2:])
+
+        writer.close()
+        os.replace(temp_path, output)
+        return filled
+
+    def run(self, options: dict, output: Optional[str] = None):
+        """
+        나누기 → 프로세스 풀에서 생성 → 원래 순서로 합치기
+
+        Args:
+            options (dict): 생성기 설정
+            output (Optional[str]): 합친 결과 파일 (None이면 원본 파일이 하나일 때 그 파일에 덮어씀)
+        """
+        if output is None:
+            if len(self.sources) > 1 or os.path.isdir(self.source):
+                raise ValueError("폴더를 처리할 때는 --output으로 합칠 파일을 지정하세요.")
+            output = self.sources[0]
+
+        started = time.perf_counter()
+        manifest = self.load_manifest()
+        if manifest is not None:
+            print(f"지난 실행의 샤드 {len(manifest['shards'])}개를 이어서 처리합니다 ({self.work_dir})")
+        else:
+            print(f"{', '.join(self.sources)}을(를) {self.rows_per_shard}행 단위 샤드로 나누는 중...")
+            manifest = self.split()
+        shards = manifest["shards"]
+        total_titles = sum(shard["titles"] for shard in shards)
+        print(f"제목 {total_titles}개, 샤드 {len(shards)}개 ({self.work_dir})")
+
+        pending = [shard for shard in shards if count_filled(shard["path"]) < shard["titles"]]
+        results = self.run_shards(pending, options) if pending else []
+        generated_elapsed = time.perf_counter() - started
+
+        print("\n샤드 결과를 원래 행 순서대로 합치는 중...")
+        filled = self.merge(shards, output)
+        elapsed = time.perf_counter() - started
+
+        titles_by_name = {shard["name"]: shard["titles"] for shard in shards}
+        unfinished = [result["name"] for result in results
+                      if result["error"] is not None or result["filled"] < titles_by_name[result["name"]]]
+        print("\n=== 분할 실행 완료 ===")
+        print(f"본문이 채워진 행: {filled}/{total_titles}, 저장: {output}")
+        print(f"생성 {generated_elapsed:.1f}초 (초당 {sum(r['filled'] for r in results) / max(generated_elapsed, 1e-9):.1f}행), "
+              f"합치기 포함 {elapsed:.1f}초")
+        if unfinished:
+            print(f"미완료 샤드 {len(unfinished)}개: {', '.join(sorted(unfinished)[:20])} "
+                  f"(로그: {self.work_dir}/shard_*.xlsx.log, 같은 명령으로 다시 실행하면 이어서 처리)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="큰 제목 시트를 샤드로 나눠 여러 프로세스에서 본문 생성")
+    parser.add_argument("--excel", default="posting.xlsx", help="제목 Excel 파일 또는 시트가 든 폴더 (기본값: posting.xlsx)")
+    parser.add_argument("--output", default=None, help="합친 결과 파일 (기본값: 원본 파일에 덮어씀, 폴더면 필수)")
+    parser.add_argument("--work-dir", default=None, help="샤드/저널/로그 폴더 (기본값: <excel>.shards)")
+    parser.add_argument("--rows-per-shard", type=int, default=1000, help="샤드 하나의 행 수 (기본값: 1000)")
+    parser.add_argument("--processes", type=int, default=None, help="동시에 실행할 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--workers", type=int, default=4, help="프로세스당 동시 API 호출 수 (기본값: 4)")
+    parser.add_argument("--rpm", type=int, default=60, help="(키, 모델)별 분당 최대 요청 수, 모든 프로세스 합계 (기본값: 60)")
+    parser.add_argument("--tpm", type=int, default=250000,
+                        help="(키, 모델)별 분당 최대 토큰 수, 모든 프로세스 합계 (기본값: 250000)")
+    parser.add_argument("--models", nargs="+", default=["gemini-2.5-flash"],
+                        help="우선순위 순서의 모델 목록 (기본값: gemini-2.5-flash)")
+    parser.add_argument("--mock", action="store_true", help="API 대신 모의 백엔드로 실행 (처리량 측정용)")
+    parser.add_argument("--mock-latency", type=float, default=0.2, help="모의 응답 시간 중앙값(초) (기본값: 0.2)")
+    args = parser.parse_args()
+
+    api_keys = [key.strip() for key in os.getenv("GOOGLE_API_KEYS", "").split(",") if key.strip()]
+    if not api_keys and os.getenv("GOOGLE_API_KEY"):
+        api_keys = [os.getenv("GOOGLE_API_KEY")]
+    if args.mock:
+        api_keys = api_keys or ["mock-key"]
+    elif not api_keys:
+        print("오류: GOOGLE_API_KEY(또는 GOOGLE_API_KEYS) 환경변수가 설정되지 않았습니다.")
+        return
+
+    options = {
+        "api_keys": api_keys,
+        "models": args.models,
+        "workers": args.workers,
+        "rpm": args.rpm,
+        "tpm": args.tpm,
+        "mock": args.mock,
+        "mock_latency": args.mock_latency,
+    }
+    runner = ShardedRunner(args.excel, args.work_dir, args.rows_per_shard, args.processes)
+    runner.run(options, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+브라우저 프로필별 메모리 사용량 측정 및 동시 포스팅 가능 브라우저 수 추정 (Linux 전용)
+
+브라우저를 여러 개 띄워 네이버 로그인 페이지와 블로그 메인을 연 뒤, 브라우저마다
+chromedriver와 Chrome 프로세스 전체의 메모리(PSS)를 측정합니다. 남은 시스템 메모리를
+브라우저당 최대 사용량으로 나눠 이 머신에서 동시에 띄울 수 있는 포스팅 브라우저 수를
+추정합니다.
+
+사용법:
+    python 브라우저메모리벤치마크.py                       # worker 프로필 2개
+    python 브라우저메모리벤치마크.py --profiles default worker --browsers 4
+"""
+
+import argparse
+import time
+
+from 크롬프로필 import BROWSER_PROFILES, available_memory, create_chrome_driver, measure_browser_memory, release_cache_slot
+
+SAMPLE_URLS = [
+    "https://nid.naver.com/nidlogin.login",
+    "https://section.blog.naver.com/",
+]
+
+# 운영체제와 스크립트 자체를 위해 남겨둘 메모리
+RESERVED_MEMORY = 512 * 1024 * 1024
+
+
+def measure_profile(profile: str, browsers: int) -> dict:
+    """
+    한 프로필로 브라우저를 여러 개 띄워 페이지 로딩 시간과 메모리 측정
+
+    Args:
+        profile (str): 브라우저 프로필
+        browsers (int): 동시에 띄울 브라우저 수
+
+    Returns:
+        dict: 브라우저별 메모리(바이트) 목록, 평균 페이지 로딩 시간(초)
+    """
+    drivers = []
+    load_times = []
+    try:
+        for _ in range(browsers):
+            drivers.append(create_chrome_driver(profile))
+
+        for driver in drivers:
+            for url in SAMPLE_URLS:
+                started = time.perf_counter()
+                driver.get(url)
+                load_times.append(time.perf_counter() - started)
+
+        memory = [measure_browser_memory(driver) for driver in drivers]
+    finally:
+        for driver in drivers:
+            driver.quit()
+            release_cache_slot(driver.cache_slot)
+
+    return {
+        "memory": [m for m in memory if m],
+        "load_seconds": sum(load_times) / max(1, len(load_times)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 메모리 벤치마크")
+    parser.add_argument("--profiles", nargs="+", choices=BROWSER_PROFILES, default=["worker"],
+                        help="비교할 브라우저 프로필 (기본값: worker)")
+    parser.add_argument("--browsers", type=int, default=2, help="프로필마다 동시에 띄울 브라우저 수 (기본값: 2)")
+    args = parser.parse_args()
+
+    results = []
+    for profile in args.profiles:
+        print(f"{profile} 프로필 측정 중 (브라우저 {args.browsers}개)...")
+        results.append((profile, measure_profile(profile, args.browsers)))
+
+    free = available_memory()
+    print(f"\n{'프로필':<8} | {'평균 메모리':>10} | {'최대 메모리':>10} | {'페이지 로딩':>10} | {'동시 실행 가능':>12}")
+    print("-" * 66)
+    for profile, result in results:
+        if not result["memory"]:
+            print(f"{profile:<8} | 메모리를 측정할 수 없습니다 (Linux /proc 필요)")
+            continue
+        average = sum(result["memory"]) / len(result["memory"])
+        peak = max(result["memory"])
+        capacity = "-" if free is None else f"{max(0, free - RESERVED_MEMORY) // peak}개"
+        print(f"{profile:<8} | {average / 1024 / 1024:>8.0f}MB | {peak / 1024 / 1024:>8.0f}MB | "
+              f"{result['load_seconds']:>9.2f}s | {capacity:>12}")
+
+    if free is not None:
+        print(f"\n현재 사용 가능한 메모리: {free / 1024 / 1024:.0f}MB "
+              f"(여유분 {RESERVED_MEMORY // 1024 // 1024}MB 제외 후 최대 메모리 기준으로 추정)")
+
+
+if __name__ == "__main__":
+    main()
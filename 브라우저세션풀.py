@@ -0,0 +1,217 @@
+"""
+네이버 로그인 세션 저장/재사용 및 로그인된 브라우저 풀
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+# 로그인 여부를 판단하는 네이버 인증 쿠키
+AUTH_COOKIE_NAMES = ("NID_AUT", "NID_SES")
+
+
+class SessionStore:
+    def __init__(self, path: str = "naver_session.json", max_age_seconds: float = 12 * 3600):
+        """
+        로그인 세션 저장소 초기화
+
+        Args:
+            path (str): 쿠키와 localStorage를 저장할 파일 경로
+            max_age_seconds (float): 저장된 세션을 재사용할 최대 시간(초)
+        """
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.lock = threading.Lock()
+
+    def save(self, driver):
+        """
+        현재 브라우저의 쿠키와 localStorage 저장
+
+        Args:
+            driver: 로그인된 WebDriver
+        """
+        origin = driver.execute_script("return window.location.origin;")
+        local_storage = driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "  var key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        )
+        session = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": {origin: local_storage or {}},
+        }
+
+        with self.lock:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(session, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        print(f"로그인 세션 저장 완료: {self.path}")
+
+    def load(self) -> Optional[dict]:
+        """
+        저장된 세션 읽기 (만료되었으면 None)
+
+        Returns:
+            Optional[dict]: {"saved_at", "cookies", "local_storage"}
+        """
+        with self.lock:
+            if not os.path.exists(self.path):
+                return None
+            with open(self.path, "r", encoding="utf-8") as f:
+                session = json.load(f)
+
+        now = time.time()
+        if now - session.get("saved_at", 0) > self.max_age_seconds:
+            print("저장된 로그인 세션이 오래되어 사용하지 않습니다.")
+            return None
+
+        auth_cookies = [c for c in session["cookies"] if c["name"] in AUTH_COOKIE_NAMES]
+        if not auth_cookies:
+            return None
+        if any("expiry" in c and c["expiry"] <= now for c in auth_cookies):
+            print("저장된 로그인 쿠키가 만료되었습니다.")
+            return None
+
+        return session
+
+    def restore(self, driver, home_url: str = "https://www.naver.com") -> bool:
+        """
+        저장된 세션을 브라우저에 복원
+
+        Args:
+            driver: 새로 띄운 WebDriver
+            home_url (str): 쿠키를 추가하기 전에 열어 둘 같은 도메인의 페이지
+
+        Returns:
+            bool: 복원 성공 여부 (로그인 쿠키가 적용되었는지)
+        """
+        session = self.load()
+        if session is None:
+            return False
+
+        # 쿠키는 같은 도메인 페이지에 있을 때만 추가할 수 있음
+        driver.get(home_url)
+        for cookie in session["cookies"]:
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                # 다른 하위 도메인 전용 쿠키는 건너뜀
+                continue
+
+        for origin, items in session["local_storage"].items():
+            if not items:
+                continue
+            driver.get(origin)
+            driver.execute_script(
+                "var items = arguments[0];"
+                "for (var key in items) { localStorage.setItem(key, items[key]); }",
+                items,
+            )
+
+        names = {c["name"] for c in driver.get_cookies()}
+        return all(name in names for name in AUTH_COOKIE_NAMES)
+
+    def clear(self):
+        """저장된 세션 삭제 (로그인이 풀렸을 때)"""
+        with self.lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class BrowserPool:
+    def __init__(self, factory: Callable[[], object], size: int = 2):
+        """
+        로그인된 브라우저 풀 초기화
+
+        Args:
+            factory (Callable[[], object]): 로그인까지 마친 자동화 객체를 만드는 함수
+                (driver 속성과 quit() 메서드를 가진 객체, 예: NaverBlogAutomate)
+            size (int): 풀의 최대 브라우저 수
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle = queue.Queue()
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def warm_up(self, count: Optional[int] = None):
+        """
+        브라우저를 미리 띄워 로그인까지 완료해 두기
+
+        Args:
+            count (Optional[int]): 미리 띄울 수 (None이면 풀 크기만큼)
+        """
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self.lock:
+                if self.created >= count:
+                    return
+                self.created += 1
+            self.idle.put(self._create())
+
+    def _create(self):
+        """새 브라우저 생성 (실패하면 생성 수를 되돌림)"""
+        try:
+            return self.factory()
+        except Exception:
+            with self.lock:
+                self.created -= 1
+            raise
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None):
+        """
+        풀에서 브라우저를 하나 빌려 쓰고 돌려받기
+
+        작업 중 예외가 발생하면 해당 브라우저는 상태를 알 수 없으므로 종료하고
+        다음 요청 때 새로 만듭니다.
+
+        Args:
+            timeout (Optional[float]): 빈 브라우저를 기다릴 최대 시간(초)
+
+        Yields:
+            로그인된 자동화 객체
+        """
+        automate = None
+        try:
+            automate = self.idle.get_nowait()
+        except queue.Empty:
+            with self.lock:
+                can_create = self.created < self.size
+                if can_create:
+                    self.created += 1
+            automate = self._create() if can_create else self.idle.get(timeout=timeout)
+
+        try:
+            yield automate
+        except Exception:
+            self._discard(automate)
+            raise
+        else:
+            self.idle.put(automate)
+
+    def _discard(self, automate):
+        """문제가 생긴 브라우저 종료"""
+        with self.lock:
+            self.created -= 1
+        try:
+            automate.quit()
+        except Exception:
+            pass
+
+    def close_all(self):
+        """풀의 모든 브라우저 종료"""
+        while True:
+            try:
+                automate = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(automate)
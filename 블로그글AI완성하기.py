@@ -4,21 +4,168 @@ Gemini API를 사용한 블로그 글 자동 완성 스크립트
 
 import pandas as pd
 import google.generativeai as genai
+import argparse
+import json
 import os
+import re
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from 속도제한기 import estimate_tokens
+from 모델라우터 import ModelRouter
+from 생성백엔드 import GeminiBackend
+from 프롬프트템플릿 import DEFAULT_PROMPT_DIR, PromptLibrary, TokenBudget
+from 체크포인트저널 import CheckpointJournal
+from 응답캐시 import ResponseCache, make_cache_key
+from 중복본문색인 import DuplicateIndex
+from 본문품질검사 import (QualityGate, load_banned_phrases, load_regeneration_queue, regeneration_queue_path,
+                    load_repair_attempts, repair_instruction, save_regeneration_queue)
+from 엑셀스트리밍 import StreamingExcelReader, write_bodies
+from 실행추적 import Tracer
+from 재시도정책 import (RETRYABLE_ERRORS, AdaptiveConcurrency, RetryPolicy, SafetyBlockedError,
+                    classify_error)
+
+# 프롬프트에서 요구하는 본문 길이 (스트리밍 조기 종료 기준)
+TARGET_MIN_CHARS = 1000
+TARGET_MAX_CHARS = 1500
+
+# 문장 끝 (마침표/물음표/느낌표 뒤 공백) 또는 줄바꿈
+SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+def find_stop_position(text: str, min_chars: int = TARGET_MIN_CHARS,
+                       max_chars: int = TARGET_MAX_CHARS) -> Optional[int]:
+    """
+    스트리밍 중인 본문을 어디서 끊을지 결정
+    
+    최소 길이를 넘긴 뒤 처음 나오는 문단 끝(빈 줄)에서 끊고, 문단이 끝나지 않은 채
+    최대 길이를 넘기면 최대 길이 안쪽의 마지막 문장 끝에서 끊습니다.
+    
+    Args:
+        text (str): 지금까지 받은 본문
+        min_chars (int): 최소 길이
+        max_chars (int): 최대 길이
+        
+    Returns:
+        Optional[int]: 끊을 위치 (아직 끊지 않으면 None)
+    """
+    if len(text) < min_chars:
+        return None
+    
+    paragraph_end = text.find("\n\n", min_chars)
+    if paragraph_end != -1 and paragraph_end <= max_chars:
+        return paragraph_end
+    
+    if len(text) < max_chars:
+        return None
+    
+    sentence_ends = [m.end() for m in SENTENCE_END.finditer(text, 0, max_chars) if m.end() >= min_chars]
+    return sentence_ends[-1] if sentence_ends else max_chars
 
 class BlogContentGenerator:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, max_workers: int = 4,
+                 requests_per_minute: int = 60, tokens_per_minute: int = 250000,
+                 save_every: int = 100, cache: Optional[ResponseCache] = None,
+                 batch_size: int = 1, tracer: Optional[Tracer] = None,
+                 max_attempts: int = 5, final_retry: bool = True,
+                 api_keys: Optional[List[str]] = None, model_names: Optional[List[str]] = None,
+                 key_cooldown: float = 60.0, stream_output: bool = False, backend=None,
+                 duplicate_index: Optional[DuplicateIndex] = None, max_regenerations: int = 0,
+                 excel_file: str = "posting.xlsx", prompt_dir: str = DEFAULT_PROMPT_DIR,
+                 token_budget: int = 3000, context_cache_ttl: Optional[float] = 3600,
+                 shared_quota: Optional[Dict[str, Tuple]] = None,
+                 quality_gate: Optional[QualityGate] = None, max_repairs: int = 0):
         """
         Gemini API를 사용한 블로그 콘텐츠 생성기 초기화
         
         Args:
             api_key (str): Google Gemini API 키
+            max_workers (int): 동시에 실행할 API 호출 수
+            requests_per_minute (int): 분당 최대 요청 수 (API 할당량에 맞춰 설정)
+            tokens_per_minute (int): 분당 최대 토큰 수 (API 할당량에 맞춰 설정)
+            save_every (int): 몇 행 완료마다 Excel 파일을 중간 저장할지 (0이면 마지막에만 저장)
+            cache (Optional[ResponseCache]): 응답 캐시 (None이면 기본 설정으로 생성)
+            batch_size (int): 한 번의 요청에 묶어 보낼 제목 수 (1이면 제목마다 개별 요청)
+            tracer (Optional[Tracer]): 단계별 소요 시간 추적기 (None이면 메모리에만 집계)
+            max_attempts (int): 할당량/일시적 오류 시 첫 시도를 포함한 최대 시도 횟수
+            final_retry (bool): 재시도 후에도 일시적 오류로 실패한 행을 저장 전에 한 번 더 처리할지 여부
+            api_keys (Optional[List[str]]): 번갈아 사용할 API 키 목록 (None이면 api_key 하나만 사용)
+            model_names (Optional[List[str]]): 우선순위 순서의 모델 목록 (기본 모델이 포화되면 다음 모델 사용)
+            key_cooldown (float): 할당량이 소진된 키/모델을 쉬게 할 기본 시간(초)
+            stream_output (bool): 스트리밍으로 응답을 받아 목표 길이를 채우면 문장 끝에서 조기 종료
+            backend: 생성 백엔드 (None이면 실제 Gemini API, 부하 테스트에는 생성백엔드.MockBackend)
+            duplicate_index (Optional[DuplicateIndex]): 지난 실행까지 포함한 본문 중복 색인 (None이면 검사 안 함)
+            max_regenerations (int): 다른 글과 거의 같은 본문을 다른 관점으로 다시 생성할 최대 횟수 (0이면 표시만)
+            excel_file (str): 제목을 읽고 본문을 기록할 Excel 파일 (분할 시트 중 하나를 지정할 수 있음)
+            prompt_dir (str): 프롬프트 템플릿 폴더 (blog.txt, blog_batch.txt)
+            token_budget (int): 글당 입력+출력 토큰 상한 (넘으면 최대 출력 토큰을 줄이거나 요청하지 않음)
+            context_cache_ttl (Optional[float]): 긴 시스템 지시문을 컨텍스트 캐시에 둘 시간(초) (None이면 사용 안 함)
+            shared_quota (Optional[Dict[str, Tuple]]): 여러 프로세스로 나눠 실행할 때 (키, 모델) 경로별로
+                함께 쓰는 속도 제한 상태 (None이면 이 프로세스 안에서만 제한)
+            quality_gate (Optional[QualityGate]): 생성 직후 본문 품질 검사 (None이면 검사 안 함)
+            max_repairs (int): 품질 검사에 실패한 본문을 문제를 알려 주고 다시 생성할 최대 횟수 (0이면 대기열에만 기록)
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-        self.excel_file = "posting.xlsx"
+        if backend is None:
+            genai.configure(api_key=api_key)
+        self.model_names = model_names or ['gemini-2.5-flash']
+        self.excel_file = excel_file
+        self.max_output_tokens = 2000
+        self.generation_config = {
+            "max_output_tokens": self.max_output_tokens,
+            "temperature": 0.7,
+        }
+        
+        # 파일에서 읽어 공백을 줄이고 토큰 수를 미리 계산한 템플릿 (고정 지시문은 시스템 지시문으로 보냄)
+        self.prompts = PromptLibrary(prompt_dir)
+        self.blog_template = self.prompts.get("blog")
+        self.batch_template = self.prompts.get("blog_batch")
+        self.token_budget = TokenBudget(token_budget)
+        self.cache = cache if cache is not None else ResponseCache()
+        self.max_workers = max(1, max_workers)
+        # 속도 제한은 (API 키, 모델) 경로마다 따로 적용
+        self.router = ModelRouter(
+            api_keys or [api_key], self.model_names,
+            requests_per_minute, tokens_per_minute, cooldown_seconds=key_cooldown,
+            backend=backend if backend is not None else GeminiBackend(context_cache_ttl),
+            shared_quota=shared_quota,
+        )
+        self.save_every = save_every
+        self.journal = CheckpointJournal(f"{self.excel_file}.journal.jsonl")
+        self.batch_size = max(1, batch_size)
+        self.tracer = tracer if tracer is not None else Tracer()
+        
+        # 오류 종류별 재시도 (할당량 오류가 나면 동시 실행 수를 줄였다가 성공하면 천천히 늘림)
+        self.concurrency = AdaptiveConcurrency(self.max_workers)
+        self.retry_policy = RetryPolicy(max_attempts, concurrency=self.concurrency)
+        self.final_retry = final_retry
+        self.stream_output = stream_output
+        
+        # 거의 같은 본문 검사 (기준을 넘으면 다시 생성하거나 경고만 출력)
+        self.duplicate_index = duplicate_index
+        self.max_regenerations = max(0, max_regenerations)
+        
+        # 본문 품질 검사 (실패하면 사유를 프롬프트에 넣어 다시 생성하거나 재생성 대기열에 기록)
+        self.quality_gate = quality_gate
+        self.max_repairs = max(0, max_repairs)
+        # 다시 생성할 행의 프롬프트 요구사항, 다시 생성해도 통과하지 못한 행 (제목, 실패 사유)
+        self.repair_instructions: Dict[int, str] = {}
+        self.quality_failures: Dict[int, Tuple[str, List[str]]] = {}
+        # 행별로 문제를 알려 주고 다시 생성한 횟수 (지난 실행 포함, 회차마다 프롬프트가 달라짐)
+        self.repair_attempts: Dict[int, int] = {}
+        
+        # 사용량 통계 (여러 스레드에서 갱신)
+        self.stats_lock = threading.Lock()
+        self.tokens_used = 0
+        self.prompt_tokens_used = 0
+        self.cached_tokens_used = 0
+        self.usage_reports = 0
+        self.batch_fallbacks = 0
+        self.early_stops = 0
+        self.failed_counts: Dict[str, int] = {}
+        self.duplicate_rows: List[int] = []
+        self.regenerated = 0
+        self.repaired = 0
     
     def read_excel_titles(self) -> pd.DataFrame:
         """
@@ -29,7 +176,8 @@ class BlogContentGenerator:
         """
         try:
             print(f"{self.excel_file} 파일을 읽는 중...")
-            df = pd.read_excel(self.excel_file)
+            with self.tracer.span("excel.read", mode="pandas"):
+                df = pd.read_excel(self.excel_file)
             print(f"총 {len(df)} 행의 데이터를 발견했습니다.")
             
             # 첫 번째 행이 헤더인지 확인하고 제거
@@ -37,6 +185,9 @@ class BlogContentGenerator:
                 df = df.iloc[1:].reset_index(drop=True)
                 print("헤더 행을 제거했습니다.")
             
+            # 본문 열이 모두 비어 있으면 float로 읽히므로 문자열을 넣을 수 있게 object로 변환
+            df[df.columns[1]] = df[df.columns[1]].astype(object)
+            
             return df
             
         except FileNotFoundError:
@@ -46,48 +197,338 @@ class BlogContentGenerator:
             print(f"Excel 파일 읽기 오류: {e}")
             raise
     
-    def generate_blog_content(self, title: str) -> str:
+    def prompt_section(self, variant: int = 0, repair: Optional[str] = None) -> str:
+        """
+        본문 프롬프트에 쓸 템플릿 구역 선택
+        
+        Args:
+            variant (int): 다시 생성하는 횟수
+            repair (Optional[str]): 품질 검사 실패로 다시 생성할 때 덧붙일 요구사항
+            
+        Returns:
+            str: 구역 이름 (repair 구역이 없는 템플릿이면 rewrite 사용)
+        """
+        if repair and "repair" in self.blog_template.sections:
+            return "repair"
+        return "rewrite" if variant or repair else "user"
+    
+    def build_prompt(self, title: str, variant: int = 0, repair: Optional[str] = None) -> str:
+        """
+        블로그 본문 생성용 프롬프트 작성 (고정 요구사항은 템플릿의 시스템 지시문으로 따로 보냄)
+        
+        Args:
+            title (str): 블로그 제목
+            variant (int): 다시 생성하는 횟수 (0보다 크면 다른 글과 겹치지 않게 하는 요구사항 추가)
+            repair (Optional[str]): 품질 검사에 실패한 이전 본문의 문제를 고치라는 요구사항
+            
+        Returns:
+            str: Gemini API에 보낼 사용자 프롬프트
+        """
+        # 다시 생성할 때마다 프롬프트가 달라지므로 캐시된 본문 대신 새 본문을 받음
+        section = self.prompt_section(variant, repair)
+        return self.blog_template.render(section, title=title, variant=variant, issues=repair or "")
+    
+    def generate_blog_content(self, title: str, variant: int = 0, repair: Optional[str] = None) -> str:
         """
         Gemini API를 사용하여 블로그 본문 생성
         
         Args:
             title (str): 블로그 제목
+            variant (int): 중복/품질 문제로 다시 생성하는 횟수 (0이면 기본 프롬프트)
+            repair (Optional[str]): 품질 검사에 실패한 이전 본문의 문제를 고치라는 요구사항
             
         Returns:
             str: 생성된 블로그 본문
         """
-        prompt = f"""
-        다음 제목으로 블로그 포스트의 본문을 작성해주세요.
-
-        제목: {title}
-
-        요구사항:
-        1. 서론-본론-결론 구조로 작성
-        2. 독자에게 유용한 정보 제공
-        3. 자연스럽고 읽기 쉬운 문체 사용
-        4. 적절한 길이 (1000-1500자 정도)
-        5. 실용적이고 구체적인 내용 포함
-
-        블로그 본문만 작성해주세요:
-        """
+        template = self.blog_template
+        with self.tracer.span("prompt.build"):
+            prompt = self.build_prompt(title, variant, repair)
+            # 고정 부분의 토큰 수는 템플릿을 읽을 때 계산해 둠
+            input_tokens = template.system_tokens + template.estimate(
+                self.prompt_section(variant, repair), title=title, variant=variant, issues=repair or ""
+            )
+        
+        # 글당 토큰 예산 안에서 최대 출력 토큰 결정 (입력만으로 예산을 넘으면 요청하지 않음)
+        generation_config = dict(
+            self.generation_config,
+            max_output_tokens=self.token_budget.output_tokens(input_tokens, self.max_output_tokens),
+        )
+        
+        # 같은 모델·프롬프트·설정으로 생성한 적이 있으면 API를 호출하지 않음
+        # (조기 종료한 본문은 길이가 다르므로 종료 기준까지 키에 포함,
+        #  품질 검사에 실패해 다시 생성하는 본문은 캐시에서 읽지도 저장하지도 않음)
+        cache_config = generation_config
+        if self.stream_output:
+            cache_config = dict(cache_config, stop_chars=[TARGET_MIN_CHARS, TARGET_MAX_CHARS])
+        cache_text = f"{template.system}\n\n{prompt}"
+        if not repair:
+            cached = self.cached_response(cache_text, cache_config)
+            if cached is not None:
+                return cached
+        
+        # 속도 제한: 입력 토큰 + 최대 출력 토큰만큼 예약 후 실제 사용량으로 보정
+        estimated = input_tokens + generation_config["max_output_tokens"]
+        
+        def call():
+            if self.stream_output:
+                return self.call_model(prompt, generation_config, estimated, "gemini.stream_call",
+                                       read_stream=self.read_stream, system_instruction=template.system,
+                                       title=title)
+            response, model_name = self.call_model(prompt, generation_config, estimated, "gemini.call",
+                                                   system_instruction=template.system, title=title)
+            return self.extract_text(response), model_name
         
         try:
-            response = self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=2000,
-                    temperature=0.7,
-                )
-            )
-            
-            # API 응답에서 텍스트 추출
-            content = response.text
-            return content.strip()
+            # 할당량/일시적 오류는 백오프 후 재시도
+            content, model_name = self.retry_policy.call(call, label=title)
+            content = content.strip()
+            if not repair:
+                self.cache_response(model_name, cache_text, cache_config, content)
+            return content
             
         except Exception as e:
             print(f"Gemini API 호출 오류: {e}")
             raise
     
+    def build_batch_prompt(self, titles: List[str]) -> str:
+        """
+        여러 제목을 한 번에 요청하는 배치 프롬프트 작성 (요구사항과 출력 형식은 시스템 지시문으로 보냄)
+        
+        Args:
+            titles (List[str]): 블로그 제목 목록
+            
+        Returns:
+            str: Gemini API에 보낼 사용자 프롬프트
+        """
+        numbered = "\n".join(f"{i + 1}. {title}" for i, title in enumerate(titles))
+        return self.batch_template.render(count=len(titles), numbered=numbered)
+    
+    def generate_blog_contents_batch(self, titles: List[str]) -> Optional[List[str]]:
+        """
+        여러 제목의 본문을 한 번의 API 호출로 생성
+        
+        응답이 잘렸거나 JSON 배열로 해석되지 않으면 None을 반환하며,
+        이 경우 호출한 쪽에서 제목별 개별 요청으로 다시 처리합니다.
+        
+        Args:
+            titles (List[str]): 블로그 제목 목록
+            
+        Returns:
+            Optional[List[str]]: 제목 순서대로의 본문 목록 (실패 시 None)
+        """
+        template = self.batch_template
+        with self.tracer.span("prompt.build", titles=len(titles)):
+            prompt = self.build_batch_prompt(titles)
+            input_tokens = template.system_tokens + estimate_tokens(prompt)
+        generation_config = dict(
+            self.generation_config,
+            max_output_tokens=self.token_budget.output_tokens(
+                input_tokens, self.max_output_tokens * len(titles), rows=len(titles)
+            ),
+            response_mime_type="application/json",
+        )
+        
+        cache_text = f"{template.system}\n\n{prompt}"
+        cached = self.cached_response(cache_text, generation_config)
+        if cached is not None:
+            return json.loads(cached)
+        
+        estimated = input_tokens + generation_config["max_output_tokens"]
+        
+        def call():
+            return self.call_model(prompt, generation_config, estimated, "gemini.batch_call",
+                                   system_instruction=template.system, titles=len(titles))
+        
+        try:
+            response, model_name = self.retry_policy.call(call, label=f"배치 {len(titles)}개")
+            
+            # 최대 출력 토큰에 걸려 잘린 응답은 JSON이 깨져 있을 수 있으므로 사용하지 않음
+            finish_reason = response.candidates[0].finish_reason if response.candidates else None
+            if finish_reason is not None and getattr(finish_reason, "name", str(finish_reason)) == "MAX_TOKENS":
+                raise ValueError("응답이 최대 출력 토큰에서 잘렸습니다")
+            
+            contents = json.loads(self.extract_text(response))
+            if (not isinstance(contents, list) or len(contents) != len(titles)
+                    or not all(isinstance(c, str) and c.strip() for c in contents)):
+                raise ValueError(f"제목 {len(titles)}개에 맞는 본문 배열이 아닙니다")
+            
+            contents = [c.strip() for c in contents]
+            self.cache_response(model_name, cache_text, generation_config, json.dumps(contents, ensure_ascii=False))
+            return contents
+            
+        except Exception as e:
+            print(f"배치 응답 처리 실패, 제목별 개별 요청으로 전환합니다: {e}")
+            with self.stats_lock:
+                self.batch_fallbacks += 1
+            return None
+    
+    def cached_response(self, cache_text: str, config: dict) -> Optional[str]:
+        """
+        같은 프롬프트·설정으로 생성한 응답을 모델 우선순위대로 캐시에서 찾기
+        
+        응답은 실제로 답한 모델의 이름으로 저장하므로 대체 모델이 답한 응답도 찾습니다.
+        
+        Args:
+            cache_text (str): 시스템 지시문과 사용자 프롬프트
+            config (dict): 생성 설정
+            
+        Returns:
+            Optional[str]: 캐시된 응답 (없으면 None)
+        """
+        keys = [make_cache_key(model_name, cache_text, config) for model_name in self.model_names]
+        cached = self.cache.get_any(keys)
+        if cached is not None:
+            self.tracer.count("cache_hits")
+        return cached
+    
+    def cache_response(self, model_name: str, cache_text: str, config: dict, value: str):
+        """
+        응답을 답한 모델의 이름으로 캐시에 저장
+        
+        Args:
+            model_name (str): 응답한 경로의 모델 이름
+            cache_text (str): 시스템 지시문과 사용자 프롬프트
+            config (dict): 생성 설정
+            value (str): 저장할 응답
+        """
+        self.cache.put(make_cache_key(model_name, cache_text, config), value)
+    
+    def call_model(self, prompt: str, generation_config: dict, estimated: int, stage: str,
+                   read_stream: Optional[Callable] = None, system_instruction: Optional[str] = None,
+                   **attributes):
+        """
+        라우터가 고른 (API 키, 모델) 경로로 API 1회 호출
+        
+        Args:
+            prompt (str): 프롬프트
+            generation_config (dict): 생성 설정
+            estimated (int): 속도 제한에 예약할 예상 토큰 수
+            stage (str): 트레이스 단계 이름
+            read_stream (Optional[Callable]): 주어지면 스트리밍으로 호출하고 이 함수로 응답을 읽음
+                ((본문, 마지막 청크)를 반환)
+            system_instruction (Optional[str]): 모든 요청에 같은 시스템 지시문 (경로별로 붙인 모델을 재사용)
+            **attributes: 트레이스에 함께 기록할 값
+            
+        Returns:
+            Tuple: (스트리밍이 아니면 Gemini API 응답, 스트리밍이면 read_stream이 읽은 본문, 응답한 모델 이름)
+        """
+        with self.tracer.span("rate_limit.wait"):
+            route = self.router.acquire(estimated)
+        
+        with self.tracer.span(stage, key=route.key_label, model=route.model_name, **attributes) as span:
+            started = time.perf_counter()
+            try:
+                response = route.model_for(system_instruction).generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(**generation_config),
+                    stream=read_stream is not None,
+                )
+                if read_stream is None:
+                    result = usage_source = response
+                    fallback_tokens = 0
+                else:
+                    # 첫 청크는 generate_content가 받아 둔 상태
+                    span["first_chunk_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    result, usage_source = read_stream(response)
+                    fallback_tokens = estimate_tokens(system_instruction or "") + estimate_tokens(prompt) \
+                        + estimate_tokens(result)
+            except Exception as e:
+                self.router.report_error(route, e)
+                raise
+            span["tokens"] = self.record_usage(route.rate_limiter, estimated, usage_source, fallback_tokens)
+            usage = getattr(usage_source, "usage_metadata", None)
+            if usage is not None and getattr(usage, "prompt_token_count", 0):
+                span["prompt_tokens"] = usage.prompt_token_count
+                span["cached_tokens"] = getattr(usage, "cached_content_token_count", 0) or 0
+        self.router.report_success(route, time.perf_counter() - started, span["tokens"])
+        return result, route.model_name
+    
+    def read_stream(self, response) -> Tuple[str, object]:
+        """
+        스트리밍 응답을 청크가 도착하는 대로 읽고 목표 길이를 채우면 문장 끝에서 중단
+        
+        Args:
+            response: stream=True로 받은 Gemini API 응답
+            
+        Returns:
+            Tuple[str, object]: 본문, 마지막으로 받은 청크 (토큰 사용량 확인용)
+        """
+        text = ""
+        last_chunk = None
+        for chunk in response:
+            last_chunk = chunk
+            feedback = getattr(chunk, "prompt_feedback", None)
+            if feedback is not None and getattr(feedback, "block_reason", None):
+                raise SafetyBlockedError(f"프롬프트가 안전 필터에 차단되었습니다: {feedback.block_reason}")
+            if chunk.parts:
+                text += "".join(part.text for part in chunk.parts)
+            
+            stop = find_stop_position(text)
+            if stop is not None:
+                # 남은 출력을 받지 않도록 스트림 취소 (grpc 스트림에만 cancel이 있음)
+                iterator = getattr(response, "_iterator", None)
+                if hasattr(iterator, "cancel"):
+                    iterator.cancel()
+                with self.stats_lock:
+                    self.early_stops += 1
+                return text[:stop].strip(), last_chunk
+        
+        if not text.strip():
+            # 본문 없이 끝났으면 마지막 청크의 종료 사유로 오류 발생
+            self.extract_text(last_chunk)
+        return text.strip(), last_chunk
+    
+    def extract_text(self, response) -> str:
+        """
+        API 응답에서 텍스트 추출 (안전 필터에 막힌 응답은 SafetyBlockedError)
+        
+        Args:
+            response: Gemini API 응답
+            
+        Returns:
+            str: 응답 텍스트
+        """
+        feedback = getattr(response, "prompt_feedback", None)
+        if feedback is not None and getattr(feedback, "block_reason", None):
+            raise SafetyBlockedError(f"프롬프트가 안전 필터에 차단되었습니다: {feedback.block_reason}")
+        try:
+            return response.text
+        except ValueError as e:
+            # 후보가 SAFETY 등으로 중단되어 본문이 없는 경우
+            raise SafetyBlockedError(f"응답이 차단되었습니다: {e}") from e
+    
+    def record_usage(self, rate_limiter, estimated: int, response, fallback_tokens: int = 0) -> int:
+        """
+        응답의 토큰 사용량을 속도 제한기와 통계에 반영
+        
+        Args:
+            rate_limiter (RateLimiter): 요청을 보낸 경로의 속도 제한기
+            estimated (int): 요청 전에 예약한 토큰 수
+            response: Gemini API 응답 (스트리밍이면 마지막으로 받은 청크)
+            fallback_tokens (int): 응답에 사용량 정보가 없을 때 대신 쓸 추정 토큰 수
+                (스트리밍을 조기 종료하면 사용량이 담긴 마지막 청크를 받지 못할 수 있음)
+            
+        Returns:
+            int: 응답의 전체 토큰 수 (사용량 정보도 추정치도 없으면 0)
+        """
+        usage = getattr(response, "usage_metadata", None)
+        total = usage.total_token_count if usage is not None and usage.total_token_count else fallback_tokens
+        if not total:
+            return 0
+        rate_limiter.record_usage(estimated, total)
+        self.tracer.count("tokens", total)
+        
+        # 입력 토큰 중 컨텍스트 캐시에서 읽은 토큰 (프롬프트 절감 확인용)
+        prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+        cached_tokens = getattr(usage, "cached_content_token_count", 0) or 0
+        with self.stats_lock:
+            self.tokens_used += total
+            if prompt_tokens:
+                self.prompt_tokens_used += prompt_tokens
+                self.cached_tokens_used += cached_tokens
+                self.usage_reports += 1
+        return total
+    
     def save_excel(self, df: pd.DataFrame):
         """
         DataFrame을 Excel 파일로 저장
@@ -97,33 +538,304 @@ class BlogContentGenerator:
         """
         try:
             # 헤더 추가
-            header_row = pd.DataFrame([["제목", "본문"]], columns=df.columns)
+            header_row = pd.DataFrame([["제목", "본문"] + list(df.columns[2:])], columns=df.columns)
             df_with_header = pd.concat([header_row, df], ignore_index=True)
             
-            df_with_header.to_excel(self.excel_file, index=False, header=False)
+            with self.tracer.span("excel.write", rows=len(df)):
+                df_with_header.to_excel(self.excel_file, index=False, header=False)
             print(f"파일이 성공적으로 저장되었습니다: {self.excel_file}")
             
         except Exception as e:
             print(f"Excel 파일 저장 오류: {e}")
             raise
     
-    def process_all_titles(self, api_key: str):
+    def apply_journal(self, df: pd.DataFrame) -> int:
+        """
+        체크포인트 저널에 기록된 본문을 DataFrame의 B열에 반영
+        
+        Args:
+            df (pd.DataFrame): 제목과 본문이 포함된 DataFrame
+            
+        Returns:
+            int: 반영된 행 수
+        """
+        applied = 0
+        for index, entry in self.journal.load().items():
+            # 시트가 바뀌어 같은 인덱스에 다른 제목이 있으면 반영하지 않음
+            if index >= len(df) or df.iloc[index, 0] != entry["title"]:
+                continue
+            df.iloc[index, 1] = entry["content"]
+            applied += 1
+        return applied
+    
+    def run_generation(self, tasks: Iterable[Tuple[int, str]], total: Optional[int],
+                       on_result: Callable[[int, str, str], None], final_pass: bool = False) -> int:
+        """
+        작업을 스레드 풀로 동시에 처리하고 완료된 행마다 저널 기록 후 on_result 호출
+        
+        작업은 동시 실행 수의 2배까지만 미리 꺼내므로 tasks가 지연 생성기여도
+        전체 목록을 메모리에 올리지 않습니다. batch_size가 2 이상이면 제목을
+        묶어서 요청하고, 배치 응답을 쓸 수 없으면 제목별 요청으로 다시 제출합니다.
+        재시도 후에도 할당량/일시적 오류로 실패한 행은 마지막에 한 번 더 처리합니다.
+        
+        Args:
+            tasks (Iterable[Tuple[int, str]]): (DataFrame 인덱스, 제목) 목록 또는 생성기
+            total (Optional[int]): 진행률 표시에 사용할 전체 작업 수
+            on_result (Callable[[int, str, str], None]): (인덱스, 제목, 본문)을 받는 콜백
+            final_pass (bool): 실패한 행을 다시 처리하는 마지막 단계인지 여부
+            
+        Returns:
+            int: 성공적으로 처리된 행 수
+        """
+        processed_count = 0
+        max_pending = self.max_workers * 2
+        retry_later = []
+        regenerations: Dict[int, int] = {}
+        repairs: Dict[int, int] = {}
+        
+        print(f"동시 실행 수: {self.max_workers}개, 배치 크기: {self.batch_size}개, {self.router.describe()}")
+        
+        # 스레드 풀로 동시에 생성 (속도 제한은 generate_* 내부에서 처리)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            
+            def submit(chunk, variant=0):
+                # 문제를 고쳐 다시 생성할 행은 요구사항이 행마다 다르므로 배치로 묶지 않음
+                if len(chunk) > 1 and any(index in self.repair_instructions for index, _ in chunk):
+                    for item in chunk:
+                        submit([item], variant)
+                    return
+                if len(chunk) == 1:
+                    index, title = chunk[0]
+                    repair = self.repair_instructions.get(index)
+                    # 같은 문제로 여러 번 다시 생성해도 프롬프트가 달라지도록 품질 재생성 회차를 더함
+                    if repair:
+                        variant += self.repair_attempts.get(index, 0)
+                    future = executor.submit(self.generate_blog_content, title, variant, repair)
+                else:
+                    future = executor.submit(self.generate_blog_contents_batch, [title for _, title in chunk])
+                pending[future] = chunk
+            
+            def handle(future):
+                nonlocal processed_count
+                chunk = pending.pop(future)
+                
+                try:
+                    result = future.result()
+                except Exception as e:
+                    kind = classify_error(e)
+                    for index, title in chunk:
+                        print(f"✗ {index + 2}행 처리 실패 ({kind}): {e}")
+                        if kind in RETRYABLE_ERRORS and self.final_retry and not final_pass:
+                            retry_later.append((index, title))
+                        else:
+                            with self.stats_lock:
+                                self.failed_counts[kind] = self.failed_counts.get(kind, 0) + 1
+                    print("다음 행으로 넘어갑니다...")
+                    return
+                
+                # 배치 응답을 쓸 수 없으면 제목별로 다시 제출
+                if result is None:
+                    for item in chunk:
+                        submit([item])
+                    return
+                
+                contents = [result] if len(chunk) == 1 else result
+                for (index, title), content in zip(chunk, contents):
+                    row_number = index + 2  # Excel에서는 1부터 시작하고 헤더가 있으므로 +2
+                    # 품질 검사를 먼저 해서 다시 생성할 본문은 중복 색인에 넣지 않음
+                    if (self.needs_repair(index, title, content, repairs)
+                            or self.is_duplicate(index, title, content, regenerations)):
+                        submit([(index, title)], variant=regenerations.get(index, 0))
+                        continue
+                    try:
+                        # 저널에 먼저 기록해 두어 중단되어도 이 행은 다시 호출하지 않음
+                        self.journal.append(index, title, content)
+                        on_result(index, title, content)
+                        
+                        processed_count += 1
+                        print(f"✓ {row_number}행 완료 ({processed_count}/{total or '?'}): {title}")
+                    except Exception as e:
+                        print(f"✗ {row_number}행 처리 실패: {e}")
+            
+            def wait_for_slot(limit):
+                while len(pending) >= limit:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle(future)
+            
+            chunk = []
+            for task in tasks:
+                chunk.append(task)
+                if len(chunk) >= self.batch_size:
+                    submit(chunk)
+                    chunk = []
+                    wait_for_slot(max_pending)
+            if chunk:
+                submit(chunk)
+            
+            wait_for_slot(1)
+        
+        # 저장하기 전에 일시적 오류로 비어 있는 행을 한 번 더 처리
+        if retry_later:
+            print(f"\n할당량/일시적 오류로 실패한 {len(retry_later)}개 행을 다시 시도합니다...")
+            processed_count += self.run_generation(retry_later, len(retry_later), on_result, final_pass=True)
+        
+        return processed_count
+    
+    def is_duplicate(self, index: int, title: str, content: str, regenerations: Dict[int, int]) -> bool:
+        """
+        본문이 색인의 다른 글과 거의 같은지 검사하고 다시 생성할지 결정
+        
+        다시 생성하지 않는 본문(중복이 아니거나 재생성 횟수를 다 쓴 본문)은 색인에 추가합니다.
+        
+        Args:
+            index (int): DataFrame 인덱스
+            title (str): 글 제목
+            content (str): 생성된 본문
+            regenerations (Dict[int, int]): 행별 재생성 횟수 (다시 생성하면 1 증가)
+            
+        Returns:
+            bool: True이면 호출한 쪽에서 이 행을 다시 생성해야 함
+        """
+        if self.duplicate_index is None:
+            return False
+        
+        with self.tracer.span("dedup.check"):
+            match = self.duplicate_index.find_similar(title, content)
+        if match is not None:
+            similar_title, similarity = match
+            attempts = regenerations.get(index, 0)
+            if attempts < self.max_regenerations:
+                regenerations[index] = attempts + 1
+                with self.stats_lock:
+                    self.regenerated += 1
+                print(f"↻ {index + 2}행 본문이 '{similar_title}'와 거의 같아 다시 생성합니다 "
+                      f"(유사도 {similarity:.2f}, {attempts + 1}/{self.max_regenerations})")
+                return True
+            with self.stats_lock:
+                self.duplicate_rows.append(index + 2)
+            print(f"! {index + 2}행 본문이 '{similar_title}'와 거의 같습니다 (유사도 {similarity:.2f})")
+        
+        self.duplicate_index.add(title, content)
+        return False
+    
+    def needs_repair(self, index: int, title: str, content: str, repairs: Dict[int, int]) -> bool:
+        """
+        본문 품질 검사 후 문제를 알려 주고 다시 생성할지 결정
+        
+        다시 생성 횟수를 다 쓰고도 통과하지 못한 행은 재생성 대기열(quality_failures)에 남깁니다.
+        
+        Args:
+            index (int): DataFrame 인덱스
+            title (str): 글 제목
+            content (str): 생성된 본문
+            repairs (Dict[int, int]): 행별 품질 재생성 횟수 (다시 생성하면 1 증가)
+            
+        Returns:
+            bool: True이면 호출한 쪽에서 이 행을 다시 생성해야 함
+        """
+        if self.quality_gate is None:
+            return False
+        
+        with self.tracer.span("quality.check"):
+            reasons = self.quality_gate.failures(content)
+        if not reasons:
+            self.repair_instructions.pop(index, None)
+            self.repair_attempts.pop(index, None)
+            self.quality_failures.pop(index, None)
+            return False
+        
+        attempts = repairs.get(index, 0)
+        if attempts < self.max_repairs:
+            repairs[index] = attempts + 1
+            self.schedule_repair(index, reasons)
+            with self.stats_lock:
+                self.repaired += 1
+            print(f"↻ {index + 2}행 본문이 품질 검사를 통과하지 못해 다시 생성합니다 "
+                  f"({', '.join(reasons)}, {attempts + 1}/{self.max_repairs})")
+            return True
+        
+        self.repair_instructions.pop(index, None)
+        self.quality_failures[index] = (title, reasons)
+        print(f"! {index + 2}행 본문이 품질 검사를 통과하지 못했습니다 ({', '.join(reasons)})")
+        return False
+    
+    def schedule_repair(self, index: int, reasons: List[str]):
+        """
+        다음 생성에서 실패 사유를 알려 주도록 요구사항을 정하고 재생성 회차를 올림
+        
+        Args:
+            index (int): DataFrame 인덱스
+            reasons (List[str]): 품질 검사 실패 사유
+        """
+        self.repair_instructions[index] = repair_instruction(reasons)
+        self.repair_attempts[index] = self.repair_attempts.get(index, 0) + 1
+    
+    def load_quality_failures(self, resume: bool):
+        """
+        지난 실행의 재생성 대기열 불러오기 (이번 실행에서 통과한 행은 대기열에서 빠짐)
+        
+        Args:
+            resume (bool): False이면 모든 행을 새로 생성하므로 지난 대기열을 버림
+        """
+        if self.quality_gate is not None:
+            self.quality_failures = load_regeneration_queue(self.excel_file) if resume else {}
+            self.repair_attempts = load_repair_attempts(self.excel_file) if resume else {}
+    
+    def save_quality_failures(self):
+        """
+        품질 검사를 통과하지 못한 행을 재생성 대기열 파일에 기록
+        """
+        if self.quality_gate is None:
+            return
+        save_regeneration_queue(self.excel_file, self.quality_failures, self.repair_attempts)
+        if self.quality_failures:
+            print(f"재생성 대기열에 {len(self.quality_failures)}개 행을 기록했습니다: "
+                  f"{regeneration_queue_path(self.excel_file)} (--regenerate-queue로 다시 생성)")
+    
+    def index_existing_body(self, title: str, body):
+        """
+        시트에 이미 있는 본문을 중복 색인에 추가 (이어하기로 건너뛰는 행)
+        
+        Args:
+            title (str): 글 제목
+            body: 시트의 본문 값
+        """
+        if self.duplicate_index is not None and body is not None and str(body).strip() != "":
+            self.duplicate_index.add(str(title), str(body))
+    
+    def process_all_titles(self, api_key: str, resume: bool = False, streaming: bool = False):
         """
         모든 제목에 대해 블로그 본문을 생성하고 Excel에 저장
         
         Args:
             api_key (str): Claude API 키
+            resume (bool): True이면 본문이 이미 있거나 저널에 기록된 행은 건너뛰고 이어서 처리
+            streaming (bool): True이면 시트 전체를 DataFrame으로 올리지 않고 한 행씩 처리
         """
+        if streaming:
+            self.process_all_titles_streaming(resume)
+            return
+        
         try:
             # Excel 파일 읽기
             df = self.read_excel_titles()
             
+            # 이어하기: 이전 실행의 저널 내용을 먼저 반영
+            if resume:
+                restored = self.apply_journal(df)
+                print(f"저널에서 {restored}개 행을 복원했습니다: {self.journal.path}")
+            self.load_quality_failures(resume)
+            
             # A열(제목)이 비어있지 않은 행들만 처리
             total_rows = len(df[df.iloc[:, 0].notna() & (df.iloc[:, 0] != "")])
             print(f"처리할 제목 수: {total_rows}개")
             
-            processed_count = 0
+            skipped_count = 0
             
+            # (DataFrame 인덱스, 제목) 작업 목록 준비
+            tasks = []
             for index, row in df.iterrows():
                 title = row.iloc[0] if pd.notna(row.iloc[0]) else ""
                 
@@ -131,43 +843,289 @@ class BlogContentGenerator:
                 if not title or title.strip() == "":
                     continue
                 
-                row_number = index + 2  # Excel에서는 1부터 시작하고 헤더가 있으므로 +2
-                print(f"현재 {row_number}행: {title}")
-                
-                try:
-                    # Gemini API로 본문 생성
-                    content = self.generate_blog_content(title)
-                    
-                    # DataFrame의 B열에 본문 저장
-                    df.iloc[index, 1] = content
-                    
-                    processed_count += 1
-                    print(f"✓ {row_number}행 완료 ({processed_count}/{total_rows})")
-                    
-                    # API 호출 간격 조절 (Rate limiting 방지)
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"✗ {row_number}행 처리 실패: {e}")
-                    print("다음 행으로 넘어갑니다...")
+                # 이어하기: 본문이 이미 있는 행은 건너뛰기
+                if resume and pd.notna(row.iloc[1]) and str(row.iloc[1]).strip() != "":
+                    self.index_existing_body(title, row.iloc[1])
+                    skipped_count += 1
                     continue
+                
+                tasks.append((index, title))
+            
+            if resume:
+                print(f"이미 완료된 {skipped_count}개 행을 건너뛰고 {len(tasks)}개 행을 처리합니다.")
+            
+            completed = 0
+            
+            def on_result(index, title, content):
+                nonlocal completed
+                # DataFrame의 B열에 본문 저장 (완료 순서와 무관하게 원래 행에 기록)
+                df.iloc[index, 1] = content
+                completed += 1
+                
+                # 주기적으로 Excel 파일 중간 저장
+                if self.save_every and completed % self.save_every == 0:
+                    self.save_excel(df)
+            
+            # 새로 시작하면 저널을 비우고, 이어하기면 기존 저널 뒤에 추가
+            self.journal.open(reset=not resume)
+            try:
+                processed_count = self.run_generation(tasks, len(tasks), on_result)
+            finally:
+                self.journal.close()
             
             # 수정된 데이터를 Excel 파일에 저장
             print("\n모든 처리가 완료되었습니다. 파일을 저장하는 중...")
             self.save_excel(df)
+            self.save_quality_failures()
+            
+            self.print_summary(processed_count, len(tasks), skipped_count, total_rows, resume)
+            
+        except Exception as e:
+            print(f"전체 프로세스 실행 중 오류 발생: {e}")
+    
+    def process_all_titles_streaming(self, resume: bool = False):
+        """
+        스트리밍 모드: 시트를 한 행씩 읽어 생성하고 결과는 저널에만 기록한 뒤,
+        마지막에 원본 시트와 저널을 한 행씩 합쳐 저장 (시트 크기와 무관하게 메모리 일정)
+        
+        Args:
+            resume (bool): True이면 본문이 이미 있거나 저널에 기록된 행은 건너뛰고 이어서 처리
+        """
+        try:
+            print(f"{self.excel_file} 파일을 스트리밍으로 읽는 중...")
+            reader = StreamingExcelReader(self.excel_file)
+            with self.tracer.span("excel.read", mode="streaming"):
+                total_rows = reader.count_rows()
+            print(f"총 {total_rows} 행의 데이터를 발견했습니다.")
+            
+            # 이어하기: 저널에 기록된 행은 본문 없이 위치만 확인
+            done_offsets = self.journal.index_offsets() if resume else {}
+            if resume:
+                print(f"저널에 기록된 행: {len(done_offsets)}개 ({self.journal.path})")
+            self.load_quality_failures(resume)
+            
+            skipped_count = 0
+            task_count = 0
+            
+            def iter_tasks():
+                nonlocal skipped_count, task_count
+                for row_number, title, body in reader.iter_rows():
+                    if title is None or str(title).strip() == "":
+                        continue
+                    
+                    index = row_number - 2
+                    if resume and (index in done_offsets or (body is not None and str(body).strip() != "")):
+                        self.index_existing_body(title, body)
+                        skipped_count += 1
+                        continue
+                    
+                    task_count += 1
+                    yield index, str(title)
+            
+            # 새로 시작하면 저널을 비우고, 이어하기면 기존 저널 뒤에 추가
+            self.journal.open(reset=not resume)
+            try:
+                processed_count = self.run_generation(iter_tasks(), total_rows, lambda *_: None)
+            finally:
+                self.journal.close()
             
-            print(f"\n=== 처리 완료 ===")
-            print(f"성공적으로 처리된 행: {processed_count}/{total_rows}")
+            print("\n모든 처리가 완료되었습니다. 저널의 본문을 파일에 기록하는 중...")
+            self.write_journal_bodies()
+            self.save_quality_failures()
+            
+            self.print_summary(processed_count, task_count, skipped_count, total_rows, resume)
+            
+        except Exception as e:
+            print(f"전체 프로세스 실행 중 오류 발생: {e}")
+    
+    def process_regeneration_queue(self):
+        """
+        재생성 대기열의 행만 실패 사유를 알려 주는 프롬프트로 다시 생성
+        
+        대기열은 생성 중 품질 검사 또는 본문품질검사.py로 시트 전체를 검사해 만듭니다.
+        결과는 저널 뒤에 추가한 뒤 원본 시트에 한 행씩 합쳐 저장하고,
+        다시 생성해도 통과하지 못한 행만 대기열에 남깁니다.
+        """
+        try:
+            self.quality_failures = load_regeneration_queue(self.excel_file)
+            self.repair_attempts = load_repair_attempts(self.excel_file)
+            if not self.quality_failures:
+                print(f"재생성 대기열이 비어 있습니다: {regeneration_queue_path(self.excel_file)}")
+                return
+            print(f"재생성 대기열: {len(self.quality_failures)}개 행 ({regeneration_queue_path(self.excel_file)})")
+            
+            # 대기열을 만든 뒤 시트가 바뀌어 같은 행에 다른 제목이 있으면 다시 생성하지 않음
+            tasks = []
+            for row_number, title, _ in StreamingExcelReader(self.excel_file).iter_rows():
+                index = row_number - 2
+                queued = self.quality_failures.get(index)
+                if queued is None:
+                    continue
+                if title is None or str(title) != queued[0]:
+                    print(f"{row_number}행 제목이 바뀌어 대기열에서 뺍니다: {queued[0]}")
+                    del self.quality_failures[index]
+                    continue
+                self.schedule_repair(index, queued[1])
+                tasks.append((index, queued[0]))
+            
+            # 지난 실행의 저널은 지우지 않고 뒤에 추가 (같은 행은 마지막 기록이 반영됨)
+            self.journal.open(reset=False)
+            try:
+                processed_count = self.run_generation(tasks, len(tasks), lambda *_: None)
+            finally:
+                self.journal.close()
+            
+            print("\n다시 생성이 끝났습니다. 저널의 본문을 파일에 기록하는 중...")
+            self.write_journal_bodies()
+            self.save_quality_failures()
+            
+            self.print_summary(processed_count, len(tasks), 0, len(tasks), False)
             
         except Exception as e:
             print(f"전체 프로세스 실행 중 오류 발생: {e}")
+    
+    def write_journal_bodies(self) -> int:
+        """
+        저널의 본문을 원본 시트와 한 행씩 합쳐 저장 (본문 전체를 메모리에 올리지 않음)
+        
+        Returns:
+            int: 본문을 기록한 행 수
+        """
+        offsets = self.journal.index_offsets()
+        
+        def get_body(row_number, title):
+            offset = offsets.get(row_number - 2)
+            if offset is None:
+                return None
+            entry = self.journal.read_entry(offset)
+            # 시트가 바뀌어 같은 행에 다른 제목이 있으면 반영하지 않음
+            return entry["content"] if entry["title"] == title else None
+        
+        with self.tracer.span("excel.write", mode="streaming") as span:
+            updated = write_bodies(self.excel_file, get_body)
+            span["rows"] = updated
+        print(f"파일이 성공적으로 저장되었습니다: {self.excel_file} (본문 {updated}개 기록)")
+        return updated
+    
+    def print_summary(self, processed_count: int, task_count: int, skipped_count: int,
+                      total_rows: int, resume: bool):
+        """
+        처리 결과 요약 출력
+        
+        Args:
+            processed_count (int): 이번 실행에서 성공한 행 수
+            task_count (int): 이번 실행에서 처리하려던 행 수
+            skipped_count (int): 이어하기로 건너뛴 행 수
+            total_rows (int): 전체 행 수
+            resume (bool): 이어하기 모드 여부
+        """
+        print(f"\n=== 처리 완료 ===")
+        print(f"성공적으로 처리된 행: {processed_count}/{task_count}")
+        print(f"응답 캐시: {self.cache.stats()}")
+        print(f"API 오류: {self.retry_policy.stats()}")
+        self.router.print_stats()
+        if self.failed_counts:
+            print("최종 실패 행: " + ", ".join(f"{kind} {count}개" for kind, count in self.failed_counts.items()))
+        print(f"사용 토큰: {self.tokens_used}개"
+              + (f" (글당 {self.tokens_used / processed_count:.0f}개)" if processed_count else ""))
+        if self.usage_reports:
+            print(f"입력 토큰: 요청당 {self.prompt_tokens_used / self.usage_reports:.0f}개 "
+                  f"(컨텍스트 캐시 {self.cached_tokens_used / self.usage_reports:.0f}개), "
+                  f"프롬프트 템플릿: {self.prompts.describe()}")
+        if self.stream_output:
+            print(f"스트리밍 조기 종료: {self.early_stops}회 (목표 {TARGET_MIN_CHARS}~{TARGET_MAX_CHARS}자)")
+        if self.duplicate_index is not None:
+            print(f"중복 검사: {self.duplicate_index.stats()}, 다시 생성 {self.regenerated}회")
+            if self.duplicate_rows:
+                rows = ", ".join(str(row) for row in sorted(self.duplicate_rows)[:20])
+                more = f" 외 {len(self.duplicate_rows) - 20}개" if len(self.duplicate_rows) > 20 else ""
+                print(f"중복 의심으로 남은 행: {rows}{more} (게시 전에 확인하세요)")
+        if self.quality_gate is not None:
+            print(f"품질 검사: {self.quality_gate.stats()}, 다시 생성 {self.repaired}회")
+            if self.quality_failures:
+                rows = ", ".join(str(index + 2) for index in sorted(self.quality_failures)[:20])
+                more = f" 외 {len(self.quality_failures) - 20}개" if len(self.quality_failures) > 20 else ""
+                print(f"품질 검사 실패로 남은 행: {rows}{more} (게시 전에 확인하세요)")
+        if self.batch_size > 1:
+            print(f"배치 크기: {self.batch_size}개, 개별 요청으로 전환된 배치: {self.batch_fallbacks}회")
+        if resume:
+            print(f"이전 실행에서 완료된 행: {skipped_count}/{total_rows}")
+        self.tracer.print_summary(processed_count)
+
+def parse_args():
+    """
+    명령행 인자 파싱
+    """
+    parser = argparse.ArgumentParser(description="Gemini API를 사용한 블로그 글 자동 완성")
+    parser.add_argument("--excel", default="posting.xlsx",
+                        help="제목/본문 Excel 파일 (기본값: posting.xlsx, 분할 시트면 posting_1.xlsx 등)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="동시에 실행할 API 호출 수 (기본값: 4)")
+    parser.add_argument("--rpm", type=int, default=60,
+                        help="API 키/모델별 분당 최대 요청 수 (기본값: 60)")
+    parser.add_argument("--tpm", type=int, default=250000,
+                        help="API 키/모델별 분당 최대 토큰 수 (기본값: 250000)")
+    parser.add_argument("--resume", action="store_true",
+                        help="본문이 이미 있거나 저널에 기록된 행은 건너뛰고 이어서 처리")
+    parser.add_argument("--save-every", type=int, default=100,
+                        help="몇 행 완료마다 Excel 파일을 중간 저장할지 (0이면 마지막에만 저장, 스트리밍 모드는 저널만 사용)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="대용량 시트용: DataFrame 대신 한 행씩 읽고 쓰기 (메모리 사용량 일정)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="응답 캐시를 사용하지 않고 항상 API 호출")
+    parser.add_argument("--cache-ttl-days", type=float, default=30,
+                        help="캐시 항목 유효 기간(일) (기본값: 30)")
+    parser.add_argument("--cache-max-mb", type=int, default=200,
+                        help="캐시 최대 크기(MB) (기본값: 200)")
+    parser.add_argument("--batch-size", type=int, default=1,
+                        help="한 번의 요청에 묶어 보낼 제목 수 (기본값: 1, 짧은 제목이 많을 때 4~8 권장)")
+    parser.add_argument("--stream-output", action="store_true",
+                        help=f"응답을 스트리밍으로 받아 {TARGET_MIN_CHARS}~{TARGET_MAX_CHARS}자를 채우면 문장 끝에서 중단 "
+                             "(배치 요청에는 적용되지 않음)")
+    parser.add_argument("--models", nargs="+", default=["gemini-2.5-flash"],
+                        help="우선순위 순서의 모델 목록 (기본값: gemini-2.5-flash, 예: gemini-2.5-flash gemini-2.0-flash)")
+    parser.add_argument("--key-cooldown", type=float, default=60,
+                        help="할당량이 소진된 키/모델을 쉬게 할 기본 시간(초) (기본값: 60)")
+    parser.add_argument("--max-attempts", type=int, default=5,
+                        help="할당량/일시적 오류 시 최대 시도 횟수 (기본값: 5)")
+    parser.add_argument("--no-final-retry", action="store_true",
+                        help="저장 전에 실패한 행을 한 번 더 처리하지 않음")
+    parser.add_argument("--dedup", choices=["off", "flag", "regenerate"], default="flag",
+                        help="다른 글과 거의 같은 본문 처리 (off: 검사 안 함, flag: 경고만, regenerate: 다시 생성) (기본값: flag)")
+    parser.add_argument("--dedup-threshold", type=float, default=0.8,
+                        help="중복으로 볼 본문 유사도 (0~1, 기본값: 0.8)")
+    parser.add_argument("--dedup-index", default=".body_index.sqlite3",
+                        help="지난 실행의 본문까지 저장하는 중복 색인 파일 (기본값: .body_index.sqlite3)")
+    parser.add_argument("--max-regenerations", type=int, default=2,
+                        help="--dedup regenerate에서 행마다 다시 생성할 최대 횟수 (기본값: 2)")
+    parser.add_argument("--quality-gate", choices=["off", "flag", "regenerate"], default="flag",
+                        help="생성 직후 본문 품질 검사 (off: 검사 안 함, flag: 재생성 대기열에만 기록, "
+                             "regenerate: 문제를 알려 주고 다시 생성) (기본값: flag)")
+    parser.add_argument("--max-repairs", type=int, default=1,
+                        help="--quality-gate regenerate에서 행마다 다시 생성할 최대 횟수 (기본값: 1)")
+    parser.add_argument("--banned", default=None,
+                        help="품질 검사 금지 표현 파일 (한 줄에 하나, 없으면 기본 목록)")
+    parser.add_argument("--regenerate-queue", action="store_true",
+                        help="재생성 대기열(시트이름.regenerate.jsonl)에 있는 행만 실패 사유를 알려 주고 다시 생성")
+    parser.add_argument("--prompts", default=DEFAULT_PROMPT_DIR,
+                        help="프롬프트 템플릿 폴더 (기본값: prompts/, blog.txt와 blog_batch.txt 필요)")
+    parser.add_argument("--token-budget", type=int, default=3000,
+                        help="글당 입력+출력 토큰 상한 (기본값: 3000)")
+    parser.add_argument("--context-cache-ttl", type=float, default=3600,
+                        help="긴 시스템 지시문을 컨텍스트 캐시에 둘 시간(초) (기본값: 3600, 0이면 사용 안 함)")
+    parser.add_argument("--trace", default="run_trace.jsonl",
+                        help="단계별 소요 시간을 기록할 JSONL 파일 (기본값: run_trace.jsonl, 빈 문자열이면 기록 안 함)")
+    return parser.parse_args()
 
 def main():
     """
     메인 실행 함수
     """
-    # Gemini API 키 설정 (환경변수에서 읽기)
-    api_key = os.getenv("GOOGLE_API_KEY")
+    args = parse_args()
+    
+    # Gemini API 키 설정 (환경변수에서 읽기, 여러 개면 GOOGLE_API_KEYS에 쉼표로 구분)
+    api_keys = [key.strip() for key in os.getenv("GOOGLE_API_KEYS", "").split(",") if key.strip()]
+    api_key = api_keys[0] if api_keys else os.getenv("GOOGLE_API_KEY")
     
     if not api_key:
         print("오류: GOOGLE_API_KEY 환경변수가 설정되지 않았습니다.")
@@ -184,8 +1142,50 @@ def main():
             return
     
     # 블로그 콘텐츠 생성기 실행
-    generator = BlogContentGenerator(api_key)
-    generator.process_all_titles(api_key)
+    tracer = Tracer(args.trace or None)
+    duplicate_index = None
+    if args.dedup != "off":
+        duplicate_index = DuplicateIndex(args.dedup_index, threshold=args.dedup_threshold)
+    quality_gate = None
+    if args.quality_gate != "off" or args.regenerate_queue:
+        quality_gate = QualityGate(banned_phrases=load_banned_phrases(args.banned)) if args.banned else QualityGate()
+    generator = BlogContentGenerator(
+        api_key,
+        max_workers=args.workers,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        save_every=args.save_every,
+        cache=ResponseCache(
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            ttl_seconds=args.cache_ttl_days * 24 * 3600,
+            enabled=not args.no_cache,
+        ),
+        batch_size=args.batch_size,
+        tracer=tracer,
+        max_attempts=args.max_attempts,
+        final_retry=not args.no_final_retry,
+        api_keys=api_keys or None,
+        model_names=args.models,
+        key_cooldown=args.key_cooldown,
+        stream_output=args.stream_output,
+        duplicate_index=duplicate_index,
+        max_regenerations=args.max_regenerations if args.dedup == "regenerate" else 0,
+        excel_file=args.excel,
+        prompt_dir=args.prompts,
+        token_budget=args.token_budget,
+        context_cache_ttl=args.context_cache_ttl or None,
+        quality_gate=quality_gate,
+        max_repairs=args.max_repairs if args.quality_gate == "regenerate" or args.regenerate_queue else 0,
+    )
+    try:
+        if args.regenerate_queue:
+            generator.process_regeneration_queue()
+        else:
+            generator.process_all_titles(api_key, resume=args.resume, streaming=args.streaming)
+    finally:
+        tracer.close()
+        if duplicate_index is not None:
+            duplicate_index.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,65 +2,246 @@
 네이버 블로그 자동 포스팅 스크립트
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import TimeoutException
 import pyperclip
+import threading
 import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from 브라우저세션풀 import AUTH_COOKIE_NAMES, SessionStore
+from 셀렉터캐시 import FIND_FIRST_SCRIPT, SelectorRegistry
+from 실행추적 import Tracer
+from 페이지스냅샷 import SnapshotBaseline, take_snapshot
+from 크롬프로필 import BROWSER_PROFILES, create_chrome_driver, measure_browser_memory, release_cache_slot
+
+# 클립보드는 프로세스 전체가 공유하므로 여러 브라우저가 동시에 붙여넣지 않도록 잠금
+CLIPBOARD_LOCK = threading.Lock()
+
+DEFAULT_TITLE = "제목텍스트"
+DEFAULT_CONTENT = "\n".join(["안녕하세요. 내용을 입력하고 있습니다."] * 5)
+
+# 텍스트 입력 방식
+#   insert: CDP Input.insertText로 한 줄씩 한 번에 입력 (가장 빠르고 클립보드를 쓰지 않음)
+#   paste:  클립보드에 복사 후 Ctrl+V로 한 줄씩 붙여넣기
+#   human:  사람처럼 한 글자씩 0.03초 간격으로 입력 (가장 느림)
+TYPING_MODES = ("insert", "paste", "human")
+
+# 단계별 최대 대기 시간(초) - 고정 대기 대신 조건이 충족되는 즉시 다음 단계로 진행
+STEP_TIMEOUTS = {
+    "login": 15,      # 로그인 버튼 클릭 후 인증 쿠키가 생길 때까지
+    "navigate": 20,   # 글쓰기 페이지 로딩 및 iframe 생성까지
+    "editor": 15,     # iframe 안에서 에디터가 그려질 때까지
+    "focus": 5,       # 입력창 클릭 후 커서가 들어갈 때까지
+    "popup": 2,       # 팝업 닫기 버튼을 누른 뒤 팝업이 사라질 때까지
+    "save": 10,       # 저장 버튼 클릭 후 저장 완료 표시까지
+    "element": 10,    # 후보 셀렉터 중 하나에 맞는 요소가 나타날 때까지
+}
+
+# 에디터가 준비되었음을 나타내는 요소
+EDITOR_READY_SELECTOR = ".se-section-documentTitle, .se-section-text, [contenteditable='true']"
+
+# 저장 완료 시 나타나는 알림 요소
+SAVE_CONFIRM_SELECTOR = ".se-toast-popup, [class*='toast'], [class*='Toast']"
+
+# 접속할 네이버 페이지 주소 (로컬 모의 사이트로 성능 측정할 때는 naver_urls로 바꿔 넘김)
+NAVER_URLS = {
+    "home": "https://www.naver.com",
+    "login": "https://nid.naver.com/nidlogin.login",
+    "write": "https://blog.naver.com/GoBlogWrite.naver",
+}
+
+# 페이지 구조 검사에서 기준과 비교할 셀렉터 (사라지면 셀렉터 변경으로 경고)
+LOGIN_WATCH_SELECTORS = ["#id", "#pw", ".btn_login"]
+EDITOR_WATCH_SELECTORS = ["#mainFrame", ".se-section-documentTitle", ".se-section-text", ".save_btn__bzc5B"]
+
+# 현재 포커스가 입력 가능한 요소에 있는지 확인하는 스크립트
+FOCUS_CHECK_SCRIPT = """
+var el = document.activeElement;
+return !!el && (el.isContentEditable || el.tagName === 'INPUT' || el.tagName === 'TEXTAREA');
+"""
 
 class NaverBlogAutomate:
-    def __init__(self):
+    def __init__(self, session_store: Optional[SessionStore] = None, typing_mode: str = "insert",
+                 selector_registry: Optional[SelectorRegistry] = None, browser_profile: str = "default",
+                 tracer: Optional[Tracer] = None, naver_urls: Optional[Dict[str, str]] = None,
+                 dom_baseline: Optional[SnapshotBaseline] = None):
+        # 접속할 페이지 주소 (home, login, write)
+        self.urls = {**NAVER_URLS, **(naver_urls or {})}
+        
+        # 로그인 세션 저장소 (None이면 매번 새로 로그인)
+        self.session_store = session_store
+        
+        # 단계별로 성공한 셀렉터 기록 (여러 브라우저가 함께 쓰려면 같은 객체를 넘김)
+        self.selector_registry = selector_registry or SelectorRegistry()
+        # 이번 글에서 단계별로 요소를 찾은 셀렉터 (다음 동작이 실패하면 강등)
+        self.matched_selectors: Dict[str, Optional[str]] = {}
+        
+        # 텍스트 입력 방식
+        if typing_mode not in TYPING_MODES:
+            raise ValueError(f"지원하지 않는 입력 방식입니다: {typing_mode} (가능: {', '.join(TYPING_MODES)})")
+        self.typing_mode = typing_mode
+        
         # 네이버 계정 정보
         self.naver_id = "termpro2000"
         self.naver_password = "yhsABOqaz"
         
-        # Chrome 드라이버 설정
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Chrome 드라이버 설정 (worker: 이미지/폰트/분석 스크립트를 막은 헤드리스 브라우저)
+        if browser_profile not in BROWSER_PROFILES:
+            raise ValueError(f"지원하지 않는 브라우저 프로필입니다: {browser_profile} (가능: {', '.join(BROWSER_PROFILES)})")
+        self.browser_profile = browser_profile
+        self.driver = create_chrome_driver(browser_profile)
         
         # 대기 객체 설정
         self.wait = WebDriverWait(self.driver, 20)
+        
+        # 단계별 소요 시간 추적 (여러 브라우저가 함께 집계하려면 같은 객체를 넘김)
+        self.tracer = tracer if tracer is not None else Tracer()
+        
+        # 페이지 구조 기준 스냅샷 (None이면 구조 검사를 하지 않음)
+        self.dom_baseline = dom_baseline
+    
+    def wait_for(self, step: str, condition, message: str) -> bool:
+        """
+        단계별 제한 시간 안에서 조건이 충족될 때까지 대기
+        
+        Args:
+            step (str): STEP_TIMEOUTS의 단계 이름
+            condition: WebDriverWait.until에 넘길 조건
+            message (str): 제한 시간 초과 시 출력할 메시지
+            
+        Returns:
+            bool: 조건 충족 여부 (시간 초과 시 False)
+        """
+        try:
+            WebDriverWait(self.driver, STEP_TIMEOUTS[step], poll_frequency=0.1).until(condition)
+            return True
+        except TimeoutException:
+            print(f"{message} ({STEP_TIMEOUTS[step]}초 초과)")
+            return False
+    
+    def find_first(self, step: str, selectors: List[str], require_visible: bool = True):
+        """
+        후보 셀렉터 중 맞는 요소를 한 번의 스크립트 실행으로 찾기
+        
+        지난번에 성공한 셀렉터부터 순서대로 확인하며, 모든 후보를 매 폴링마다 함께
+        확인하므로 틀린 셀렉터 하나 때문에 전체 제한 시간을 기다리지 않습니다.
+        
+        Args:
+            step (str): 셀렉터 기록에 사용할 단계 이름
+            selectors (List[str]): 후보 CSS 셀렉터
+            require_visible (bool): 화면에 보이고 활성화된 요소만 찾을지 여부
+            
+        Returns:
+            Tuple[Optional[str], Optional[WebElement]]: 찾은 셀렉터와 요소 (못 찾으면 None, None)
+        """
+        ordered = self.selector_registry.order(step, selectors)
+        result = {}
+        
+        def probe(driver):
+            result.update(driver.execute_script(FIND_FIRST_SCRIPT, ordered, require_visible))
+            return result["index"] >= 0
+        
+        self.wait_for("element", probe, f"{step} 요소를 찾을 수 없습니다")
+        
+        index = result.get("index", -1)
+        invalid = {ordered[i] for i in result.get("invalid", [])}
+        if index < 0:
+            self.matched_selectors[step] = None
+            self.selector_registry.record(step, None, ordered, first_try=False)
+            return None, None
+        
+        # 찾은 셀렉터보다 앞에서 실패한 셀렉터와 문법 오류 셀렉터는 강등
+        missed = [selector for i, selector in enumerate(ordered) if i < index or selector in invalid]
+        self.matched_selectors[step] = ordered[index]
+        self.selector_registry.record(step, ordered[index], missed, first_try=index == 0)
+        return ordered[index], result["element"]
+    
+    def demote_selector(self, step: str):
+        """
+        단계에서 찾은 요소로 다음 동작이 실패했을 때 그 셀렉터를 강등 (엉뚱한 요소를 찾았을 수 있음)
+        
+        Args:
+            step (str): 셀렉터 기록에 사용한 단계 이름
+        """
+        self.selector_registry.demote(step, self.matched_selectors.pop(step, None))
+    
+    @contextmanager
+    def timed_step(self, step: str):
+        """
+        단계 소요 시간 측정
+        
+        Args:
+            step (str): 단계 이름 (login, navigate, iframe, popups, title, content, save)
+        """
+        with self.tracer.span(f"selenium.{step}"):
+            yield
+    
+    def check_page(self, page: str, selectors: List[str]):
+        """
+        현재 페이지 구조를 한 번의 스크립트 실행으로 수집해 기준 스냅샷과 비교
+        
+        Args:
+            page (str): 페이지 이름 (login, editor)
+            selectors (List[str]): 기준과 비교할 감시 셀렉터
+        """
+        if self.dom_baseline is None:
+            return
+        try:
+            with self.timed_step("dom_check"):
+                self.dom_baseline.check(page, take_snapshot(self.driver, selectors))
+        except Exception as e:
+            print(f"페이지 구조 검사 실패: {e}")
+    
+    def paste_credential(self, element, value: str, message: str):
+        """
+        로그인 입력창에 값 붙여넣기 (키 입력 탐지를 피하기 위해 한 번에 입력)
+        
+        헤드리스 브라우저는 OS 클립보드를 읽지 못하므로 CDP로 직접 삽입합니다.
+        
+        Args:
+            element: 포커스된 입력창
+            value (str): 입력할 값
+            message (str): 입력 확인 실패 시 출력할 메시지
+        """
+        if self.browser_profile == "worker":
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": value})
+            self.wait_for("focus", lambda d: element.get_attribute("value"), message)
+            return
+        
+        # 클립보드에 복사 후 붙여넣기
+        with CLIPBOARD_LOCK:
+            pyperclip.copy(value)
+            element.send_keys(Keys.CONTROL + 'v')
+            # 붙여넣기가 반영된 뒤에 클립보드를 넘겨줌
+            self.wait_for("focus", lambda d: element.get_attribute("value"), message)
     
     def login_to_naver(self):
         """네이버 로그인 수행"""
         try:
             # 네이버 로그인 페이지 접속
             print("네이버 로그인 페이지 접속...")
-            self.driver.get("https://nid.naver.com/nidlogin.login")
-            
-            # 페이지 로딩 대기
-            time.sleep(2)
+            self.driver.get(self.urls["login"])
             
-            # 아이디 입력창 클릭 및 입력
+            # 아이디 입력창 클릭 및 입력 (입력창이 클릭 가능해질 때까지 대기)
             print("아이디 입력 중...")
             id_input = self.wait.until(EC.element_to_be_clickable((By.ID, "id")))
+            self.check_page("login", LOGIN_WATCH_SELECTORS)
             id_input.click()
             
-            # 클립보드에 아이디 복사 후 붙여넣기
-            pyperclip.copy(self.naver_id)
-            id_input.send_keys(Keys.CONTROL + 'v')
-            
-            time.sleep(1)
+            self.paste_credential(id_input, self.naver_id, "아이디 입력 확인 실패")
             
             # 비밀번호 입력창 클릭 및 입력
             print("비밀번호 입력 중...")
             pw_input = self.wait.until(EC.element_to_be_clickable((By.ID, "pw")))
             pw_input.click()
             
-            # 클립보드에 비밀번호 복사 후 붙여넣기
-            pyperclip.copy(self.naver_password)
-            pw_input.send_keys(Keys.CONTROL + 'v')
-            
-            time.sleep(1)
+            self.paste_credential(pw_input, self.naver_password, "비밀번호 입력 확인 실패")
             
             # 로그인 버튼 클릭
             print("로그인 버튼 클릭...")
@@ -74,36 +255,113 @@ class NaverBlogAutomate:
             ]
             
             login_clicked = False
-            for selector in login_selectors:
+            selector, login_btn = self.find_first("login_button", login_selectors)
+            if login_btn is not None:
                 try:
-                    login_btn = self.driver.find_element(By.CSS_SELECTOR, selector)
                     login_btn.click()
                     print(f"로그인 버튼 클릭 성공! (셀렉터: {selector})")
                     login_clicked = True
-                    break
-                except:
-                    continue
+                except Exception as e:
+                    print(f"로그인 버튼 클릭 실패: {e}")
             
             if not login_clicked:
                 print("로그인 버튼을 찾을 수 없습니다.")
             
-            # 로그인 완료 대기
-            time.sleep(2)
-            print("로그인 완료!")
+            # 로그인 완료 대기 (인증 쿠키가 생기거나 로그인 페이지를 벗어날 때까지)
+            if self.wait_for(
+                "login",
+                lambda d: self.is_logged_in() or "nidlogin" not in d.current_url,
+                "로그인 완료를 확인하지 못했습니다. 보안 문자나 2단계 인증을 확인하세요",
+            ):
+                print("로그인 완료!")
             
         except Exception as e:
             print(f"로그인 중 오류 발생: {e}")
             raise
     
+    def type_text(self, text: str):
+        """
+        포커스된 입력창에 텍스트 입력 (typing_mode에 따라 방식 선택, 줄바꿈 없는 한 줄 기준)
+        
+        Args:
+            text (str): 입력할 텍스트
+        """
+        if not text:
+            return
+        
+        if self.typing_mode == "insert":
+            # 키 이벤트 없이 현재 커서 위치에 텍스트 삽입 (WebDriver 왕복 1회)
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+        
+        elif self.typing_mode == "paste":
+            with CLIPBOARD_LOCK:
+                pyperclip.copy(text)
+                ActionChains(self.driver).key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
+        
+        else:
+            # ActionChains를 사용하여 한 글자씩 입력
+            actions = ActionChains(self.driver)
+            for char in text:
+                actions.send_keys(char)
+                actions.perform()
+                time.sleep(0.03)
+    
+    def type_lines(self, text: str, show_progress: bool = False):
+        """
+        여러 줄 텍스트 입력 (줄마다 type_text 후 Enter)
+        
+        Args:
+            text (str): 입력할 텍스트
+            show_progress (bool): 줄마다 진행 상황 출력 여부
+        """
+        lines = text.split("\n")
+        
+        for line_num, line in enumerate(lines):
+            if show_progress:
+                print(f"{line_num + 1}/{len(lines)}줄 입력 중...")
+            self.type_text(line)
+            
+            # 줄바꿈 (마지막 줄이 아닌 경우)
+            if line_num < len(lines) - 1:
+                ActionChains(self.driver).send_keys(Keys.RETURN).perform()
+                if self.typing_mode == "human":
+                    time.sleep(0.03)
+    
+    def is_logged_in(self) -> bool:
+        """네이버 인증 쿠키가 있는지 확인"""
+        names = {cookie["name"] for cookie in self.driver.get_cookies()}
+        return all(name in names for name in AUTH_COOKIE_NAMES)
+    
+    def ensure_logged_in(self):
+        """저장된 세션이 있으면 복원하고, 없거나 만료되었으면 로그인 후 세션 저장"""
+        if self.session_store is not None:
+            try:
+                if self.session_store.restore(self.driver, self.urls["home"]):
+                    print("저장된 로그인 세션으로 복원 완료!")
+                    return
+            except Exception as e:
+                print(f"로그인 세션 복원 실패: {e}")
+        
+        with self.timed_step("login"):
+            self.login_to_naver()
+        
+        if self.session_store is not None and self.is_logged_in():
+            self.session_store.save(self.driver)
+    
     def navigate_to_blog_write(self):
         """블로그 글쓰기 페이지로 이동"""
         try:
             print("블로그 글쓰기 페이지로 이동...")
-            self.driver.get("https://blog.naver.com/GoBlogWrite.naver")
+            self.driver.get(self.urls["write"])
             
-            # 페이지 로딩 대기
-            time.sleep(3)
-            print("블로그 글쓰기 페이지 이동 완료!")
+            # 페이지 로딩 및 에디터 iframe 생성 대기
+            if self.wait_for(
+                "navigate",
+                lambda d: d.execute_script("return document.readyState") == "complete"
+                and d.find_elements(By.CSS_SELECTOR, "iframe"),
+                "글쓰기 페이지 로딩을 확인하지 못했습니다",
+            ):
+                print("블로그 글쓰기 페이지 이동 완료!")
             
         except Exception as e:
             print(f"블로그 페이지 이동 중 오류 발생: {e}")
@@ -117,18 +375,19 @@ class NaverBlogAutomate:
             iframe_selectors = ["#mainFrame", "iframe[name='mainFrame']", "iframe"]
             
             iframe_found = False
-            for selector in iframe_selectors:
-                try:
-                    print(f"iframe 셀렉터 시도: {selector}")
-                    main_frame = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    self.driver.switch_to.frame(main_frame)
-                    time.sleep(2)
-                    print(f"iframe 전환 완료! (셀렉터: {selector})")
-                    iframe_found = True
-                    break
-                except:
-                    print(f"셀렉터 {selector} 실패, 다음 시도...")
-                    continue
+            selector, main_frame = self.find_first("iframe", iframe_selectors, require_visible=False)
+            if main_frame is not None:
+                self.driver.switch_to.frame(main_frame)
+                print(f"iframe 전환 완료! (셀렉터: {selector})")
+                
+                # iframe 안에서 에디터가 그려질 때까지 대기
+                if not self.wait_for(
+                    "editor",
+                    EC.presence_of_element_located((By.CSS_SELECTOR, EDITOR_READY_SELECTOR)),
+                    "에디터 로딩을 확인하지 못했습니다",
+                ):
+                    self.demote_selector("iframe")
+                iframe_found = True
             
             if not iframe_found:
                 print("iframe을 찾을 수 없습니다. 기본 창에서 계속 진행...")
@@ -148,7 +407,7 @@ class NaverBlogAutomate:
                 if cancel_button:
                     cancel_button.click()
                     print("첫 번째 팝업 닫기 완료")
-                    time.sleep(1)
+                    self.wait_for("popup", EC.invisibility_of_element(cancel_button), "첫 번째 팝업이 닫히지 않았습니다")
             except:
                 print("첫 번째 팝업이 없거나 이미 닫혀있음")
             
@@ -158,15 +417,24 @@ class NaverBlogAutomate:
                 if help_close_button:
                     help_close_button.click()
                     print("두 번째 팝업 닫기 완료")
-                    time.sleep(1)
+                    self.wait_for("popup", EC.invisibility_of_element(help_close_button), "두 번째 팝업이 닫히지 않았습니다")
             except:
                 print("두 번째 팝업이 없거나 이미 닫혀있음")
                 
         except Exception as e:
             print(f"팝업 닫기 중 오류 발생: {e}")
     
-    def input_title(self):
-        """제목 입력"""
+    def input_title(self, title: str = DEFAULT_TITLE) -> bool:
+        """
+        제목 입력
+        
+        Args:
+            title (str): 입력할 제목
+            
+        Returns:
+            bool: 입력 성공 여부
+        """
+        title_found = False
         try:
             print("제목 입력 중...")
             # 여러 가능한 제목 셀렉터 시도
@@ -179,38 +447,35 @@ class NaverBlogAutomate:
                 "input[name='title']"
             ]
             
-            title_found = False
-            for selector in title_selectors:
-                try:
-                    print(f"제목 셀렉터 시도: {selector}")
-                    title_element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    title_element.click()
-                    time.sleep(1)
-                    
-                    # ActionChains를 사용하여 한 글자씩 입력
-                    actions = ActionChains(self.driver)
-                    title_text = "제목텍스트"
-                    
-                    for char in title_text:
-                        actions.send_keys(char)
-                        actions.perform()
-                        time.sleep(0.03)
-                    
-                    print(f"제목 입력 완료! (셀렉터: {selector})")
-                    title_found = True
-                    break
-                except:
-                    print(f"셀렉터 {selector} 실패, 다음 시도...")
-                    continue
+            selector, title_element = self.find_first("title", title_selectors)
+            if title_element is not None:
+                title_element.click()
+                self.wait_for("focus", lambda d: d.execute_script(FOCUS_CHECK_SCRIPT), "제목 입력창 포커스 확인 실패")
+                
+                self.type_text(title)
+                
+                print(f"제목 입력 완료! (셀렉터: {selector})")
+                title_found = True
             
             if not title_found:
                 print("제목 입력창을 찾을 수 없습니다.")
             
         except Exception as e:
             print(f"제목 입력 중 오류 발생: {e}")
+        
+        return title_found
     
-    def input_content(self):
-        """본문 입력"""
+    def input_content(self, content: str = DEFAULT_CONTENT) -> bool:
+        """
+        본문 입력
+        
+        Args:
+            content (str): 입력할 본문 (줄바꿈은 Enter로 입력)
+            
+        Returns:
+            bool: 입력 성공 여부
+        """
+        content_found = False
         try:
             print("본문 입력 중...")
             # 여러 가능한 본문 셀렉터 시도
@@ -223,48 +488,33 @@ class NaverBlogAutomate:
                 ".editor-content"
             ]
             
-            content_found = False
-            for selector in content_selectors:
-                try:
-                    print(f"본문 셀렉터 시도: {selector}")
-                    content_element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    content_element.click()
-                    time.sleep(1)
-                    
-                    # 5줄의 동일한 내용 입력
-                    content_text = "안녕하세요. 내용을 입력하고 있습니다."
-                    
-                    for line_num in range(5):
-                        print(f"{line_num + 1}줄 입력 중...")
-                        actions = ActionChains(self.driver)
-                        
-                        # 한 글자씩 입력
-                        for char in content_text:
-                            actions.send_keys(char)
-                            actions.perform()
-                            time.sleep(0.03)
-                        
-                        # 줄바꿈 (마지막 줄이 아닌 경우)
-                        if line_num < 4:
-                            actions.send_keys(Keys.RETURN)
-                            actions.perform()
-                            time.sleep(0.03)
-                    
-                    print(f"본문 입력 완료! (셀렉터: {selector})")
-                    content_found = True
-                    break
-                except:
-                    print(f"셀렉터 {selector} 실패, 다음 시도...")
-                    continue
+            selector, content_element = self.find_first("content", content_selectors)
+            if content_element is not None:
+                content_element.click()
+                self.wait_for("focus", lambda d: d.execute_script(FOCUS_CHECK_SCRIPT), "본문 입력창 포커스 확인 실패")
+                
+                # 한 줄씩 입력 (사람처럼 입력할 때만 줄별 진행 상황 출력)
+                self.type_lines(content, show_progress=self.typing_mode == "human")
+                
+                print(f"본문 입력 완료! (셀렉터: {selector})")
+                content_found = True
             
             if not content_found:
                 print("본문 입력창을 찾을 수 없습니다.")
             
         except Exception as e:
             print(f"본문 입력 중 오류 발생: {e}")
+        
+        return content_found
     
-    def save_post(self):
-        """포스트 저장"""
+    def save_post(self) -> bool:
+        """
+        포스트 저장
+        
+        Returns:
+            bool: 저장 완료 확인 여부 (버튼을 눌렀어도 저장 완료 표시가 없으면 False)
+        """
+        saved = False
         try:
             print("저장 버튼 클릭...")
             # 여러 가능한 저장 버튼 셀렉터 시도
@@ -277,66 +527,136 @@ class NaverBlogAutomate:
                 "#save-btn"
             ]
             
-            save_found = False
-            for selector in save_selectors:
-                try:
-                    print(f"저장 버튼 셀렉터 시도: {selector}")
-                    save_button = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-                    save_button.click()
-                    time.sleep(2)
+            selector, save_button = self.find_first("save", save_selectors)
+            if save_button is not None:
+                save_button.click()
+                
+                # 저장 완료 알림이 뜨거나 저장 버튼이 다시 그려질 때까지 대기
+                # (확인하지 못하면 실패로 돌려 게시완료로 기록되지 않고 다시 시도되게 함)
+                saved = self.wait_for(
+                    "save",
+                    EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, SAVE_CONFIRM_SELECTOR)),
+                        EC.staleness_of(save_button),
+                    ),
+                    "저장 완료 표시를 확인하지 못했습니다",
+                )
+                if saved:
                     print(f"포스트 저장 완료! (셀렉터: {selector})")
-                    save_found = True
-                    break
-                except:
-                    print(f"셀렉터 {selector} 실패, 다음 시도...")
-                    continue
-            
-            if not save_found:
+            else:
                 print("저장 버튼을 찾을 수 없습니다.")
             
         except Exception as e:
             print(f"저장 중 오류 발생: {e}")
+        
+        return saved
     
     def debug_page_structure(self):
-        """페이지 구조 디버깅"""
+        """페이지 구조 디버깅 (iframe 안쪽까지 한 번의 스크립트 실행으로 수집)"""
         try:
             print("현재 페이지 구조 분석 중...")
+            snapshot = take_snapshot(self.driver, EDITOR_WATCH_SELECTORS)
+            print(snapshot.summary())
             
-            # 모든 input 요소 찾기
-            inputs = self.driver.find_elements(By.TAG_NAME, "input")
+            # 모든 input 요소
+            inputs = snapshot.find(tag="input")
             print(f"Input 요소 개수: {len(inputs)}")
             for i, inp in enumerate(inputs[:5]):  # 처음 5개만 출력
-                print(f"Input {i}: class='{inp.get_attribute('class')}', placeholder='{inp.get_attribute('placeholder')}', name='{inp.get_attribute('name')}'")
+                print(f"Input {i}: class='{' '.join(inp['classes'])}', placeholder='{inp['placeholder']}', name='{inp['name']}' ({inp['frame']})")
             
-            # 모든 button 요소 찾기
-            buttons = self.driver.find_elements(By.TAG_NAME, "button")
+            # 모든 button 요소
+            buttons = snapshot.find(tag="button")
             print(f"Button 요소 개수: {len(buttons)}")
             for i, btn in enumerate(buttons[:5]):  # 처음 5개만 출력
-                print(f"Button {i}: class='{btn.get_attribute('class')}', text='{btn.text}'")
+                print(f"Button {i}: class='{' '.join(btn['classes'])}', text='{btn['text']}' ({btn['frame']})")
             
-            # 모든 textarea 요소 찾기
-            textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
+            # 모든 textarea 요소
+            textareas = snapshot.find(tag="textarea")
             print(f"Textarea 요소 개수: {len(textareas)}")
             for i, ta in enumerate(textareas[:5]):  # 처음 5개만 출력
-                print(f"Textarea {i}: class='{ta.get_attribute('class')}', placeholder='{ta.get_attribute('placeholder')}'")
+                print(f"Textarea {i}: class='{' '.join(ta['classes'])}', placeholder='{ta['placeholder']}' ({ta['frame']})")
+            
+            print(f"감시 셀렉터: {snapshot.selector_counts()}")
                 
         except Exception as e:
             print(f"페이지 구조 분석 중 오류: {e}")
 
+    def write_post(self, title: str = DEFAULT_TITLE, content: str = DEFAULT_CONTENT):
+        """
+        로그인된 상태에서 글 하나 작성 후 저장 (같은 브라우저로 반복 호출 가능)
+        
+        Args:
+            title (str): 글 제목
+            content (str): 글 본문
+            
+        Raises:
+            RuntimeError: 제목/본문 입력창이나 저장 버튼을 찾지 못한 경우
+        """
+        try:
+            with self.timed_step("navigate"):
+                self.navigate_to_blog_write()
+            with self.timed_step("iframe"):
+                self.switch_to_main_frame()
+            self.check_page("editor", EDITOR_WATCH_SELECTORS)
+            with self.timed_step("popups"):
+                self.close_popups()
+            with self.timed_step("title"):
+                if not self.input_title(title):
+                    self.demote_selector("title")
+                    raise RuntimeError("제목 입력 실패")
+            with self.timed_step("content"):
+                if not self.input_content(content):
+                    self.demote_selector("content")
+                    raise RuntimeError("본문 입력 실패")
+            with self.timed_step("save"):
+                if not self.save_post():
+                    self.demote_selector("save")
+                    raise RuntimeError("저장 실패")
+        finally:
+            # 다음 글 작성을 위해 iframe에서 빠져나옴
+            self.driver.switch_to.default_content()
+    
+    def memory_usage(self) -> Optional[int]:
+        """
+        이 브라우저(chromedriver와 Chrome 프로세스 전체)의 메모리 사용량
+        
+        Returns:
+            Optional[int]: 바이트 단위 사용량 (Linux가 아니면 None)
+        """
+        return measure_browser_memory(self.driver)
+    
+    def quit(self):
+        """브라우저 종료"""
+        try:
+            # 성공 횟수처럼 바로 저장하지 않은 셀렉터 기록을 파일에 반영
+            self.selector_registry.save()
+            self.driver.quit()
+        finally:
+            release_cache_slot(getattr(self.driver, "cache_slot", None))
+
     def run(self):
         """자동화 실행"""
         try:
-            self.login_to_naver()
-            self.navigate_to_blog_write()
+            self.ensure_logged_in()
+            with self.timed_step("navigate"):
+                self.navigate_to_blog_write()
             
             # 페이지 구조 디버깅
             self.debug_page_structure()
             
-            self.switch_to_main_frame()
-            self.close_popups()
-            self.input_title()
-            self.input_content()
-            self.save_post()
+            with self.timed_step("iframe"):
+                self.switch_to_main_frame()
+            with self.timed_step("popups"):
+                self.close_popups()
+            with self.timed_step("title"):
+                self.input_title()
+            with self.timed_step("content"):
+                self.input_content()
+            with self.timed_step("save"):
+                self.save_post()
+            
+            self.tracer.print_summary()
+            self.selector_registry.print_stats()
             
             print("블로그 자동 포스팅 완료! 브라우저가 열린 상태로 유지됩니다.")
             
@@ -347,9 +667,40 @@ class NaverBlogAutomate:
             print(f"실행 중 오류 발생: {e}")
         
         finally:
-            self.driver.quit()
+            self.quit()
+
+def create_logged_in_automate(session_store: SessionStore, typing_mode: str = "insert",
+                              selector_registry: Optional[SelectorRegistry] = None,
+                              browser_profile: str = "default",
+                              tracer: Optional[Tracer] = None,
+                              naver_urls: Optional[Dict[str, str]] = None,
+                              dom_baseline: Optional[SnapshotBaseline] = None) -> NaverBlogAutomate:
+    """
+    로그인까지 마친 자동화 객체 생성 (BrowserPool의 factory로 사용)
+    
+    Args:
+        session_store (SessionStore): 로그인 세션 저장소
+        typing_mode (str): 텍스트 입력 방식 (insert, paste, human)
+        selector_registry (Optional[SelectorRegistry]): 브라우저끼리 공유할 셀렉터 기록
+        browser_profile (str): 브라우저 프로필 (default, worker)
+        tracer (Optional[Tracer]): 브라우저끼리 공유할 소요 시간 추적기
+        naver_urls (Optional[Dict[str, str]]): 기본 주소 대신 접속할 페이지 주소 (모의 사이트용)
+        dom_baseline (Optional[SnapshotBaseline]): 브라우저끼리 공유할 페이지 구조 기준 스냅샷
+        
+    Returns:
+        NaverBlogAutomate: 로그인된 자동화 객체
+    """
+    automate = NaverBlogAutomate(session_store, typing_mode=typing_mode, selector_registry=selector_registry,
+                                 browser_profile=browser_profile, tracer=tracer, naver_urls=naver_urls, dom_baseline=dom_baseline)
+    try:
+        automate.ensure_logged_in()
+    except Exception:
+        automate.quit()
+        raise
+    return automate
 
 if __name__ == "__main__":
-    # 블로그 자동화 실행
-    blog_auto = NaverBlogAutomate()
+    # 블로그 자동화 실행 (저장된 로그인 세션이 있으면 재사용)
+    # 사람처럼 한 글자씩 입력하려면 typing_mode="human"
+    blog_auto = NaverBlogAutomate(SessionStore())
     blog_auto.run()
\ No newline at end of file
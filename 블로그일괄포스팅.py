@@ -0,0 +1,374 @@
+"""
+posting.xlsx의 (제목, 본문)을 네이버 블로그에 일괄 포스팅하는 스크립트
+
+블로그글AI완성하기.py로 본문을 채운 시트를 한 행씩 읽어 여러 브라우저로 동시에
+포스팅하고, 행마다 포스팅 상태(C열)를 기록합니다. 다시 실행하면 게시완료된 행은
+건너뛰고 나머지만 처리합니다.
+
+--mock-site를 주면 실제 네이버 대신 로컬 모의 사이트(네이버모의사이트.py)에 합성 글을
+포스팅하여 분당 포스팅 수, 단계별 소요 시간, 브라우저 메모리를 측정합니다.
+"""
+
+import argparse
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from 브라우저세션풀 import BrowserPool, SessionStore
+from 블로그글쓰기자동화 import TYPING_MODES, create_logged_in_automate
+from 셀렉터캐시 import SelectorRegistry
+from 실행추적 import Tracer
+from 페이지스냅샷 import SnapshotBaseline
+from 크롬프로필 import BROWSER_PROFILES
+from 엑셀스트리밍 import HEADER, STATUS_HEADER, StreamingExcelReader, rewrite_sheet
+from 체크포인트저널 import CheckpointJournal
+
+STATUS_POSTED = "게시완료"
+STATUS_FAILED = "실패"
+STATUS_SKIPPED = "건너뜀"
+
+
+class BlogBulkPublisher:
+    def __init__(self, excel_file: str = "posting.xlsx", workers: int = 2,
+                 queue_size: Optional[int] = None, session_store: Optional[SessionStore] = None,
+                 typing_mode: str = "insert", browser_profile: str = "worker",
+                 tracer: Optional[Tracer] = None, selector_registry: Optional[SelectorRegistry] = None,
+                 naver_urls: Optional[Dict[str, str]] = None,
+                 dom_baseline: Optional[SnapshotBaseline] = None):
+        """
+        일괄 포스팅 실행기 초기화
+
+        Args:
+            excel_file (str): 제목/본문이 들어 있는 Excel 파일
+            workers (int): 동시에 사용할 브라우저 수
+            queue_size (Optional[int]): 대기열 최대 길이 (None이면 브라우저 수의 2배)
+            session_store (Optional[SessionStore]): 로그인 세션 저장소 (None이면 기본값 사용)
+            typing_mode (str): 텍스트 입력 방식 (insert, paste, human)
+            browser_profile (str): 브라우저 프로필 (worker: 헤드리스, default: 창 표시)
+            tracer (Optional[Tracer]): 단계별 소요 시간 추적기 (None이면 메모리에만 집계)
+            selector_registry (Optional[SelectorRegistry]): 셀렉터 기록 (None이면 기본 파일 사용)
+            naver_urls (Optional[Dict[str, str]]): 기본 네이버 주소 대신 접속할 페이지 주소
+            dom_baseline (Optional[SnapshotBaseline]): 글마다 페이지 구조를 비교할 기준 스냅샷 (None이면 검사 안 함)
+        """
+        self.excel_file = excel_file
+        self.workers = max(1, workers)
+        self.queue_size = queue_size or self.workers * 2
+        self.session_store = session_store or SessionStore()
+        self.typing_mode = typing_mode
+        self.browser_profile = browser_profile
+        self.selector_registry = selector_registry or SelectorRegistry()
+        self.naver_urls = naver_urls
+        self.dom_baseline = dom_baseline
+        self.tracer = tracer if tracer is not None else Tracer()
+
+        # 행별 포스팅 상태 저널 (content 필드에 상태 기록, 마지막 기록이 최신 상태)
+        self.status_journal = CheckpointJournal(f"{self.excel_file}.publish.jsonl")
+        self.counts = {STATUS_POSTED: 0, STATUS_FAILED: 0, STATUS_SKIPPED: 0}
+        self.counts_lock = threading.Lock()
+        
+        # 포스팅 직후 측정한 브라우저별 메모리 (바이트)
+        self.memory_samples: List[int] = []
+        
+        # 첫 글이 게시된 시각 (time.perf_counter 기준, 파이프라인의 첫 글 지연 측정용)
+        self.first_posted_at: Optional[float] = None
+
+    def load_statuses(self) -> Dict[int, str]:
+        """
+        지난 실행에서 시트에 반영되지 못한 상태 저널 읽기
+
+        Returns:
+            Dict[int, str]: DataFrame 인덱스(행 번호 - 2)별 상태
+        """
+        return {index: entry["content"] for index, entry in self.status_journal.load().items()}
+
+    def record_status(self, index: int, title: str, status: str):
+        """
+        행의 포스팅 상태를 저널에 기록
+
+        Args:
+            index (int): DataFrame 인덱스 (행 번호 - 2)
+            title (str): 글 제목
+            status (str): 포스팅 상태
+        """
+        self.status_journal.append(index, title, status)
+        with self.counts_lock:
+            self.counts[status] += 1
+            if status == STATUS_POSTED and self.first_posted_at is None:
+                self.first_posted_at = time.perf_counter()
+
+    def collect_memory(self, automate):
+        """
+        포스팅을 마친 브라우저의 메모리 사용량 기록
+
+        Args:
+            automate: 포스팅을 마친 NaverBlogAutomate
+        """
+        memory = automate.memory_usage()
+        if memory:
+            with self.counts_lock:
+                self.memory_samples.append(memory)
+
+    def iter_pending_rows(self, journal_statuses: Dict[int, str]) -> Iterator[Tuple[int, str, str]]:
+        """
+        아직 게시되지 않은 (인덱스, 제목, 본문)을 한 행씩 생성
+
+        본문이 비어 있는 행은 건너뜀으로 기록하고 넘어갑니다.
+
+        Args:
+            journal_statuses (Dict[int, str]): 저널에 기록된 상태
+
+        Yields:
+            Tuple[int, str, str]: 인덱스, 제목, 본문
+        """
+        reader = StreamingExcelReader(self.excel_file)
+        for row_number, values in reader.iter_values():
+            title = values[0] if len(values) > 0 else None
+            body = values[1] if len(values) > 1 else None
+            status = values[2] if len(values) > 2 else None
+            index = row_number - 2
+
+            if title is None or str(title).strip() == "":
+                continue
+
+            if journal_statuses.get(index, status) == STATUS_POSTED:
+                continue
+
+            if body is None or str(body).strip() == "":
+                print(f"- {row_number}행 건너뜀 (본문 없음): {title}")
+                self.record_status(index, str(title), STATUS_SKIPPED)
+                continue
+
+            yield index, str(title), str(body)
+
+    def worker(self, pool: BrowserPool, work_queue: queue.Queue):
+        """
+        대기열에서 행을 꺼내 포스팅 (None을 받으면 종료)
+
+        Args:
+            pool (BrowserPool): 로그인된 브라우저 풀
+            work_queue (queue.Queue): (인덱스, 제목, 본문) 대기열
+        """
+        while True:
+            item = work_queue.get()
+            if item is None:
+                break
+
+            index, title, body = item
+            row_number = index + 2
+            try:
+                with self.tracer.span("publish.row", row=row_number), pool.checkout() as automate:
+                    try:
+                        automate.write_post(title, body)
+                    finally:
+                        self.collect_memory(automate)
+                self.record_status(index, title, STATUS_POSTED)
+                print(f"✓ {row_number}행 포스팅 완료: {title}")
+            except Exception as e:
+                self.record_status(index, title, STATUS_FAILED)
+                print(f"✗ {row_number}행 포스팅 실패: {e}")
+
+    def write_statuses(self):
+        """저널의 상태를 시트의 포스팅상태 열에 반영하고 저널 비우기"""
+        statuses = self.load_statuses()
+        if not statuses:
+            return
+
+        header = list(StreamingExcelReader(self.excel_file).read_header())
+        header += [None] * (len(HEADER) + 1 - len(header))
+        if header[len(HEADER)] is None:
+            header[len(HEADER)] = STATUS_HEADER
+
+        def update_row(row_number, values):
+            status = statuses.get(row_number - 2)
+            if status is None:
+                return None
+            values[2] = status
+            return values
+
+        with self.tracer.span("excel.write", rows=len(statuses)):
+            rewrite_sheet(self.excel_file, update_row, header=header)
+
+        # 시트에 반영했으므로 저널은 비움
+        self.status_journal.open(reset=True)
+        self.status_journal.close()
+        print(f"포스팅 상태를 저장했습니다: {self.excel_file}")
+
+    def create_pool(self) -> BrowserPool:
+        """로그인된 브라우저를 만들어 빌려주는 풀 생성 (브라우저는 warm_up이나 checkout 때 생성)"""
+        return BrowserPool(
+            lambda: create_logged_in_automate(
+                self.session_store, self.typing_mode, self.selector_registry, self.browser_profile, self.tracer,
+                naver_urls=self.naver_urls, dom_baseline=self.dom_baseline,
+            ),
+            size=self.workers
+        )
+
+    def start_workers(self, pool: BrowserPool, work_queue: queue.Queue) -> List[threading.Thread]:
+        """
+        포스팅 작업자 스레드 시작
+
+        Args:
+            pool (BrowserPool): 로그인된 브라우저 풀
+            work_queue (queue.Queue): (인덱스, 제목, 본문) 대기열 (작업자 수만큼 None을 넣으면 종료)
+
+        Returns:
+            List[threading.Thread]: 시작된 스레드
+        """
+        threads = [
+            threading.Thread(target=self.worker, args=(pool, work_queue), daemon=True)
+            for _ in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def run(self):
+        """일괄 포스팅 실행"""
+        print(f"{self.excel_file} 일괄 포스팅 시작 "
+              f"(브라우저 {self.workers}개, 대기열 {self.queue_size}개, 프로필 {self.browser_profile})")
+
+        journal_statuses = self.load_statuses()
+        pool = self.create_pool()
+        work_queue = queue.Queue(maxsize=self.queue_size)
+
+        self.status_journal.open()
+        try:
+            # 첫 로그인이 세션을 저장하므로 나머지 브라우저는 세션 복원으로 빠르게 준비됨
+            pool.warm_up()
+
+            threads = self.start_workers(pool, work_queue)
+
+            # 대기열이 가득 차면 put이 막히므로 시트를 필요한 만큼만 읽음
+            for item in self.iter_pending_rows(journal_statuses):
+                work_queue.put(item)
+
+            for _ in threads:
+                work_queue.put(None)
+            for thread in threads:
+                thread.join()
+
+        finally:
+            self.status_journal.close()
+            pool.close_all()
+            self.write_statuses()
+
+        self.print_summary()
+
+    def print_summary(self, trace_summary: bool = True):
+        """
+        포스팅 결과, 단계별 소요 시간, 브라우저 메모리, 셀렉터 통계 출력
+
+        Args:
+            trace_summary (bool): 단계별 소요 시간도 출력할지 여부 (추적기를 함께 쓰는 쪽에서 따로 출력하면 False)
+        """
+        print("\n=== 일괄 포스팅 완료 ===")
+        print(f"게시완료: {self.counts[STATUS_POSTED]}개, "
+              f"실패: {self.counts[STATUS_FAILED]}개, "
+              f"건너뜀: {self.counts[STATUS_SKIPPED]}개")
+        if trace_summary:
+            self.tracer.print_summary(self.counts[STATUS_POSTED])
+        if self.memory_samples:
+            average = sum(self.memory_samples) / len(self.memory_samples) / 1024 / 1024
+            print(f"\n브라우저당 메모리: 평균 {average:.0f}MB, 최대 {max(self.memory_samples) / 1024 / 1024:.0f}MB")
+        self.selector_registry.print_stats()
+        if self.dom_baseline is not None:
+            print(f"페이지 구조 검사: {self.dom_baseline.stats()}")
+
+
+def run_mock_benchmark(posts: int, workers: int, typing_mode: str, browser_profile: str,
+                       render_delay: float, popups: bool, tracer: Tracer):
+    """
+    로컬 모의 사이트에 합성 글을 포스팅하여 처리량 측정
+
+    세션, 셀렉터 기록, 시트는 임시 디렉터리에 만들므로 실제 실행 기록에 섞이지 않습니다.
+
+    Args:
+        posts (int): 포스팅할 합성 글 수
+        workers (int): 동시에 사용할 브라우저 수
+        typing_mode (str): 텍스트 입력 방식
+        browser_profile (str): 브라우저 프로필
+        render_delay (float): 모의 에디터 렌더링 지연(초)
+        popups (bool): 모의 에디터에 팝업을 띄울지 여부
+        tracer (Tracer): 단계별 소요 시간 추적기
+    """
+    from 네이버모의사이트 import MockNaverSite
+    from 엑셀스트리밍 import StreamingExcelWriter
+
+    site = MockNaverSite(render_delay=render_delay, popups=popups).start()
+    print(f"모의 사이트 시작: {site.base_url} (에디터 렌더링 {render_delay}초, 팝업 {'있음' if popups else '없음'})")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        excel_file = os.path.join(temp_dir, "posting.xlsx")
+        writer = StreamingExcelWriter(excel_file)
+        for i in range(posts):
+            body = "\n".join(f"벤치마크 본문 {i + 1}번 글의 {line + 1}번째 줄입니다." for line in range(20))
+            writer.write_row(f"벤치마크 제목 {i + 1}", body)
+        writer.close()
+
+        publisher = BlogBulkPublisher(
+            excel_file, workers=workers, typing_mode=typing_mode, browser_profile=browser_profile,
+            session_store=SessionStore(os.path.join(temp_dir, "session.json")),
+            tracer=tracer, selector_registry=SelectorRegistry(os.path.join(temp_dir, "selectors.json")),
+            naver_urls=site.urls, dom_baseline=SnapshotBaseline(os.path.join(temp_dir, "dom_baseline.json")),
+        )
+        started = time.perf_counter()
+        try:
+            publisher.run()
+        finally:
+            elapsed = time.perf_counter() - started
+            site.stop()
+
+    posted = publisher.counts[STATUS_POSTED]
+    print("\n=== 모의 사이트 벤치마크 ===")
+    print(f"포스팅: {posted}/{posts}개, 사이트에 저장된 글: {len(site.posts)}개")
+    print(f"소요 시간: {elapsed:.1f}초 (브라우저 준비 포함), 분당 포스팅: {posted / elapsed * 60:.1f}개")
+    print(f"정적 리소스 요청: {site.asset_requests}회 (worker 프로필은 이미지/폰트/분석 스크립트를 막음)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="posting.xlsx 일괄 포스팅")
+    parser.add_argument("--excel", default="posting.xlsx", help="제목/본문 Excel 파일 (기본값: posting.xlsx)")
+    parser.add_argument("--workers", type=int, default=2, help="동시에 사용할 브라우저 수 (기본값: 2)")
+    parser.add_argument("--queue-size", type=int, default=None,
+                        help="대기열 최대 길이 (기본값: 브라우저 수의 2배)")
+    parser.add_argument("--typing-mode", choices=TYPING_MODES, default="insert",
+                        help="텍스트 입력 방식 (기본값: insert, 사람처럼 입력하려면 human)")
+    parser.add_argument("--browser-profile", choices=BROWSER_PROFILES, default="worker",
+                        help="브라우저 프로필 (기본값: worker 헤드리스, 창을 보려면 default)")
+    parser.add_argument("--trace", default="publish_trace.jsonl",
+                        help="단계별 소요 시간을 기록할 JSONL 파일 (기본값: publish_trace.jsonl, 빈 문자열이면 기록 안 함)")
+    parser.add_argument("--dom-baseline", default="dom_baseline.json",
+                        help="글마다 페이지 구조를 비교할 기준 스냅샷 파일 (기본값: dom_baseline.json, 빈 문자열이면 검사 안 함)")
+    parser.add_argument("--mock-site", action="store_true",
+                        help="실제 네이버 대신 로컬 모의 사이트에 합성 글을 포스팅하여 성능 측정")
+    parser.add_argument("--mock-posts", type=int, default=20, help="모의 사이트에 포스팅할 글 수 (기본값: 20)")
+    parser.add_argument("--mock-render-delay", type=float, default=0.5,
+                        help="모의 에디터 렌더링 지연(초) (기본값: 0.5)")
+    parser.add_argument("--mock-no-popups", action="store_true", help="모의 에디터에 팝업을 띄우지 않음")
+    args = parser.parse_args()
+
+    tracer = Tracer(args.trace or None)
+    if args.mock_site:
+        try:
+            run_mock_benchmark(args.mock_posts, args.workers, args.typing_mode, args.browser_profile,
+                               args.mock_render_delay, not args.mock_no_popups, tracer)
+        finally:
+            tracer.close()
+        return
+
+    publisher = BlogBulkPublisher(
+        args.excel, workers=args.workers, queue_size=args.queue_size, typing_mode=args.typing_mode,
+        browser_profile=args.browser_profile, tracer=tracer,
+        dom_baseline=SnapshotBaseline(args.dom_baseline) if args.dom_baseline else None,
+    )
+    try:
+        publisher.run()
+    finally:
+        tracer.close()
+
+
+if __name__ == "__main__":
+    main()
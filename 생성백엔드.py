@@ -0,0 +1,379 @@
+"""
+BlogContentGenerator가 사용하는 텍스트 생성 백엔드
+
+GeminiBackend는 실제 Gemini API 모델을, MockBackend는 API 할당량 없이 부하 테스트를 할 수
+있도록 지연 시간 분포, 오류 주입, 결정적 본문 출력을 흉내 내는 로컬 모델을 만듭니다.
+두 백엔드 모두 create_model(api_key, model_name, system_instruction)이 반환하는 객체의
+generate_content(prompt, generation_config=..., stream=...)만 사용합니다.
+"""
+
+import datetime
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from typing import List, Optional
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from google.api_core import exceptions as api_exceptions
+from google.generativeai import caching
+
+from 속도제한기 import estimate_tokens
+
+# 배치 프롬프트의 "1. 제목" 형태 번호 목록
+NUMBERED_TITLE = re.compile(r"^\s*\d+\.\s+(.+)$", re.MULTILINE)
+
+# 모의 본문 문장 = 주어 + 서술어 (조합마다 다른 문장이 되어 한 본문 안에서 문장이 반복되지 않음)
+MOCK_SUBJECTS = [
+    "{title}의 기본 개념은",
+    "처음 시작할 때 고려할 점은",
+    "비용과 시간 계획은",
+    "자주 하는 실수를 피하는 방법은",
+    "전문가들이 추천하는 순서는",
+    "실제 사례에서 얻은 교훈은",
+    "준비물과 확인 목록은",
+    "꾸준히 이어 가는 요령은",
+    "초보자가 놓치기 쉬운 부분은",
+    "결과를 점검하는 기준은",
+]
+MOCK_PREDICATES = [
+    "차근차근 이해해 두면 큰 도움이 됩니다.",
+    "생각보다 어렵지 않게 익힐 수 있습니다.",
+    "상황에 맞게 조금씩 조정하는 것이 좋습니다.",
+    "미리 정리해 두면 시행착오를 줄일 수 있습니다.",
+    "구체적인 예시와 함께 살펴보면 이해가 빠릅니다.",
+    "작은 부분부터 실천해 보는 것이 중요합니다.",
+    "꼼꼼히 비교해 보면 더 현명한 선택을 할 수 있습니다.",
+    "주변의 경험담을 참고하면 훨씬 수월해집니다.",
+]
+# 모의 본문의 문단 수 (서론-본론-결론)
+MOCK_PARAGRAPHS = 3
+
+# 명시적 컨텍스트 캐시를 만들 수 있는 최소 토큰 수 (이보다 짧은 시스템 지시문은 그대로 보냄)
+CONTEXT_CACHE_MIN_TOKENS = 1024
+
+# 모델의 비공개 _client를 바꿔 API 키별 클라이언트를 붙이는 방식을 확인한 google-generativeai 버전 범위
+# ([이상, 미만) 주.부 버전)
+CLIENT_OVERRIDE_VERSIONS = ((0, 7), (0, 9))
+
+_client_override_warned = threading.Event()
+
+
+def client_override_supported() -> bool:
+    """
+    설치된 google-generativeai가 모델별 클라이언트 지정을 확인한 버전인지 확인
+
+    Returns:
+        bool: 모델의 _client와 CachedContent 내부 함수를 그대로 쓸 수 있으면 True
+    """
+    version = tuple(int(part) for part in re.findall(r"\d+", genai.__version__)[:2])
+    low, high = CLIENT_OVERRIDE_VERSIONS
+    return low <= version < high
+
+
+def bind_api_key(model, api_key: str):
+    """
+    모델에 API 키를 지정한 클라이언트를 붙임
+
+    genai.configure는 전역 설정이라 키를 하나만 쓸 수 있으므로 비공개 속성인 _client를
+    바꿉니다. 확인하지 않은 버전에서는 한 번만 경고하고 전역 클라이언트를 그대로 씁니다.
+
+    Args:
+        model (genai.GenerativeModel): 생성 모델
+        api_key (str): Gemini API 키
+
+    Returns:
+        genai.GenerativeModel: 클라이언트를 붙인 모델
+    """
+    if not client_override_supported() or not hasattr(model, "_client"):
+        if not _client_override_warned.is_set():
+            _client_override_warned.set()
+            print(f"google-generativeai {genai.__version__}에서는 API 키별 클라이언트를 지정할 수 없어 "
+                  f"genai.configure로 설정한 키만 사용합니다")
+        return model
+    model._client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+    return model
+
+
+class GeminiBackend:
+    name = "gemini"
+
+    def __init__(self, context_cache_ttl: Optional[float] = 3600):
+        """
+        Gemini 백엔드 초기화
+
+        Args:
+            context_cache_ttl (Optional[float]): 시스템 지시문을 컨텍스트 캐시에 올려 둘 시간(초)
+                (None이면 컨텍스트 캐시를 쓰지 않음)
+        """
+        self.context_cache_ttl = context_cache_ttl
+
+    def create_model(self, api_key: str, model_name: str, system_instruction: Optional[str] = None):
+        """
+        API 키를 지정한 Gemini 모델 생성
+
+        모델마다 키를 지정한 클라이언트를 붙입니다 (bind_api_key). 시스템 지시문이 컨텍스트 캐시 최소 길이를 넘으면 캐시에 올려
+        요청마다 다시 보내지 않고, 짧으면 시스템 지시문으로만 보냅니다.
+
+        Args:
+            api_key (str): Gemini API 키
+            model_name (str): 모델 이름
+            system_instruction (Optional[str]): 모든 요청에 같은 시스템 지시문
+
+        Returns:
+            genai.GenerativeModel: 생성 모델 (context_cached 속성에 캐시 사용 여부)
+        """
+        if (system_instruction and self.context_cache_ttl and client_override_supported()
+                and estimate_tokens(system_instruction) >= CONTEXT_CACHE_MIN_TOKENS):
+            try:
+                model = bind_api_key(genai.GenerativeModel.from_cached_content(
+                    self.create_cached_content(api_key, model_name, system_instruction)
+                ), api_key)
+                model.context_cached = True
+                return model
+            except Exception as e:
+                print(f"컨텍스트 캐시를 만들지 못해 시스템 지시문으로 보냅니다 ({model_name}): {e}")
+
+        model = bind_api_key(genai.GenerativeModel(model_name, system_instruction=system_instruction), api_key)
+        model.context_cached = False
+        return model
+
+    def create_cached_content(self, api_key: str, model_name: str, system_instruction: str):
+        """
+        API 키의 클라이언트로 시스템 지시문 컨텍스트 캐시 생성 (전역 클라이언트는 키를 하나만 씀)
+
+        CachedContent의 내부 함수를 쓰므로 client_override_supported()인 버전에서만 호출합니다.
+
+        Args:
+            api_key (str): Gemini API 키
+            model_name (str): 모델 이름
+            system_instruction (str): 캐시에 올릴 시스템 지시문
+
+        Returns:
+            caching.CachedContent: 생성된 캐시
+        """
+        request = caching.CachedContent._prepare_create_request(
+            model=model_name,
+            system_instruction=system_instruction,
+            ttl=datetime.timedelta(seconds=self.context_cache_ttl),
+        )
+        client = glm.CacheServiceClient(client_options={"api_key": api_key})
+        return caching.CachedContent._from_obj(client.create_cached_content(request))
+
+
+class _Part:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FinishReason:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _Candidate:
+    def __init__(self, finish_reason: str):
+        self.finish_reason = _FinishReason(finish_reason)
+
+
+class _Usage:
+    def __init__(self, total_token_count: int, prompt_token_count: int = 0):
+        self.total_token_count = total_token_count
+        self.prompt_token_count = prompt_token_count
+        self.cached_content_token_count = 0
+
+
+class MockResponse:
+    def __init__(self, text: str, total_tokens: int, finish_reason: str = "STOP", prompt_tokens: int = 0):
+        """
+        Gemini 응답에서 생성기가 사용하는 속성만 흉내 낸 응답
+
+        Args:
+            text (str): 응답 텍스트
+            total_tokens (int): 사용 토큰 수 (0이면 사용량 정보 없음)
+            finish_reason (str): 종료 사유
+            prompt_tokens (int): 사용 토큰 중 입력 토큰 수
+        """
+        self.text = text
+        self.parts = [_Part(text)] if text else []
+        self.candidates = [_Candidate(finish_reason)]
+        self.usage_metadata = _Usage(total_tokens, prompt_tokens) if total_tokens else None
+        self.prompt_feedback = None
+
+
+class MockStream:
+    def __init__(self, chunks: List[str], chunk_delay: float, total_tokens: int, prompt_tokens: int = 0):
+        """
+        청크를 일정 간격으로 내보내는 스트리밍 응답 (마지막 청크에만 사용량 포함)
+
+        Args:
+            chunks (List[str]): 청크 텍스트 목록
+            chunk_delay (float): 청크 사이 지연 시간(초)
+            total_tokens (int): 마지막 청크에 담을 사용 토큰 수
+            prompt_tokens (int): 사용 토큰 중 입력 토큰 수
+        """
+        self.chunks = chunks
+        self.chunk_delay = chunk_delay
+        self.total_tokens = total_tokens
+        self.prompt_tokens = prompt_tokens
+        self.cancelled = False
+
+    def __iter__(self):
+        for i, chunk in enumerate(self.chunks):
+            if self.cancelled:
+                return
+            if i > 0:
+                time.sleep(self.chunk_delay)
+            last = i == len(self.chunks) - 1
+            yield MockResponse(chunk, self.total_tokens if last else 0,
+                               prompt_tokens=self.prompt_tokens if last else 0)
+
+    @property
+    def _iterator(self):
+        # 생성기의 조기 종료가 cancel()을 호출할 수 있도록 자기 자신을 노출
+        return self
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class MockModel:
+    def __init__(self, backend: "MockBackend", model_name: str, system_instruction: Optional[str] = None):
+        self.backend = backend
+        self.model_name = model_name
+        self.system_instruction = system_instruction or ""
+        self.context_cached = False
+
+    def generate_content(self, prompt: str, generation_config=None, stream: bool = False):
+        """
+        지연 시간을 흉내 낸 뒤 프롬프트에서 결정적으로 만든 본문 반환 (설정한 확률로 오류 발생)
+
+        Args:
+            prompt (str): 프롬프트
+            generation_config: 생성 설정 (response_mime_type이 JSON이면 배치 응답 생성)
+            stream (bool): 스트리밍 응답 여부
+
+        Returns:
+            MockResponse 또는 MockStream
+        """
+        backend = self.backend
+        latency = backend.sample_latency()
+        error = backend.sample_error()
+
+        if error == "timeout":
+            time.sleep(backend.timeout)
+            raise api_exceptions.DeadlineExceeded("mock: 요청 시간 초과")
+        time.sleep(latency if not stream else latency * 0.2)
+        if error == "quota":
+            raise api_exceptions.ResourceExhausted("mock: Quota exceeded. Please retry in 1s.")
+        if error == "server":
+            raise api_exceptions.InternalServerError("mock: 내부 서버 오류")
+
+        mime_type = getattr(generation_config, "response_mime_type", None)
+        if mime_type == "application/json":
+            titles = NUMBERED_TITLE.findall(prompt.split("요구사항")[0])
+            text = json.dumps([backend.make_body(title) for title in titles], ensure_ascii=False)
+        else:
+            text = backend.make_body(prompt)
+
+        # 시스템 지시문도 요청마다 입력 토큰으로 계산 (컨텍스트 캐시 없음)
+        prompt_tokens = (len(self.system_instruction) + len(prompt)) // 2
+        total_tokens = prompt_tokens + len(text) // 2
+        if not stream:
+            return MockResponse(text, total_tokens, prompt_tokens=prompt_tokens)
+
+        size = backend.chunk_chars
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        return MockStream(chunks, latency * 0.8 / max(1, len(chunks) - 1), total_tokens, prompt_tokens)
+
+
+class MockBackend:
+    name = "mock"
+
+    def __init__(self, latency_median: float = 0.8, latency_sigma: float = 0.5,
+                 quota_rate: float = 0.0, server_error_rate: float = 0.0, timeout_rate: float = 0.0,
+                 timeout: float = 5.0, body_chars: int = 1400, chunk_chars: int = 120,
+                 seed: Optional[int] = 0):
+        """
+        로컬 모의 백엔드 초기화
+
+        Args:
+            latency_median (float): 응답 시간 중앙값(초), 로그정규분포로 뽑음
+            latency_sigma (float): 로그정규분포의 sigma (클수록 꼬리 지연이 길어짐)
+            quota_rate (float): 429 할당량 오류 확률
+            server_error_rate (float): 500 서버 오류 확률
+            timeout_rate (float): 시간 초과 오류 확률 (timeout 초만큼 기다린 뒤 발생)
+            timeout (float): 시간 초과 오류까지 걸리는 시간(초)
+            body_chars (int): 생성할 본문의 최대 길이 (문장 단위로 채움)
+            chunk_chars (int): 스트리밍 청크 길이
+            seed (Optional[int]): 지연 시간/오류 난수 시드 (None이면 매번 다름)
+        """
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.quota_rate = quota_rate
+        self.server_error_rate = server_error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout = timeout
+        self.body_chars = body_chars
+        self.chunk_chars = chunk_chars
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def create_model(self, api_key: str, model_name: str, system_instruction: Optional[str] = None) -> MockModel:
+        """모의 모델 생성 (API 키는 사용하지 않음)"""
+        return MockModel(self, model_name, system_instruction)
+
+    def sample_latency(self) -> float:
+        """로그정규분포에서 응답 시간 추출"""
+        if self.latency_median <= 0:
+            return 0.0
+        with self.lock:
+            return self.random.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+
+    def sample_error(self) -> Optional[str]:
+        """설정한 확률에 따라 주입할 오류 종류 추출 (없으면 None)"""
+        with self.lock:
+            roll = self.random.random()
+        for kind, rate in (("quota", self.quota_rate), ("server", self.server_error_rate),
+                           ("timeout", self.timeout_rate)):
+            if roll < rate:
+                return kind
+            roll -= rate
+        return None
+
+    def make_body(self, seed_text: str) -> str:
+        """
+        같은 입력이면 항상 같은 본문을 만드는 결정적 텍스트 생성
+
+        Args:
+            seed_text (str): 프롬프트 또는 제목
+
+        Returns:
+            str: 빈 줄로 나눈 세 문단, 반복 없는 문장, 마침표로 끝나는 합성 본문 (body_chars 이하)
+        """
+        match = re.search(r"제목:\s*(.+)", seed_text)
+        title = match.group(1).strip() if match else seed_text.strip()[:40]
+        digest = hashlib.sha256(seed_text.encode("utf-8")).digest()
+        local_random = random.Random(digest)
+
+        pairs = [(subject, predicate) for subject in MOCK_SUBJECTS for predicate in MOCK_PREDICATES]
+        local_random.shuffle(pairs)
+
+        # 문장 사이 공백/문단 사이 빈 줄까지 넉넉히 2자로 세어 body_chars를 넘지 않게 채움
+        sentences = []
+        length = 0
+        for subject, predicate in pairs:
+            sentence = f"{subject.format(title=title)} {predicate}"
+            if length + len(sentence) + 2 > self.body_chars:
+                break
+            sentences.append(sentence)
+            length += len(sentence) + 2
+
+        per_paragraph = max(1, -(-len(sentences) // MOCK_PARAGRAPHS))
+        return "\n\n".join(
+            " ".join(sentences[i:i + per_paragraph]) for i in range(0, len(sentences), per_paragraph)
+        )
@@ -0,0 +1,190 @@
+"""
+모의 백엔드로 process_all_titles 전체를 실행하는 처리량 벤치마크 (API 할당량 사용 안 함)
+
+합성 제목 시트(기본 100, 1천, 1만 행)를 만들어 BlogContentGenerator를 MockBackend로
+실행하고 초당 처리 행 수, 최대 메모리, API 호출 지연 시간 p50/p95/p99를 비교합니다.
+동시 실행, 재시도, 캐시 경로가 느려지거나 행을 빠뜨리는지 확인하는 용도입니다.
+채워진 본문은 기본 품질 게이트로 검사합니다 (모의 본문이 통과하지 못하면 재생성 트래픽을 재게 됨).
+
+사용법:
+    python 생성파이프라인벤치마크.py
+    python 생성파이프라인벤치마크.py --rows 1000 --workers 16 --latency 0.2 --quota-rate 0.05
+    python 생성파이프라인벤치마크.py --rows 1000 --cache      # 같은 시트를 두 번 실행해 캐시 적중 확인
+"""
+
+import argparse
+import contextlib
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple
+
+from 본문품질검사 import QualityGate, check_sheet
+from 엑셀스트리밍 import StreamingExcelReader, StreamingExcelWriter
+from 실행추적 import percentile
+
+
+def create_title_sheet(path: str, rows: int):
+    """본문이 비어 있는 합성 제목 시트 생성"""
+    writer = StreamingExcelWriter(path)
+    for row_number in range(2, rows + 2):
+        writer.write_row(f"합성 제목 {row_number} - 테스트용 블로그 글", None)
+    writer.close()
+
+
+def count_filled(path: str) -> int:
+    """본문이 채워진 행 수"""
+    return sum(1 for _, _, body in StreamingExcelReader(path).iter_rows() if body)
+
+
+def count_quality_failures(path: str) -> Tuple[int, Dict[str, int]]:
+    """
+    채워진 본문을 기본 품질 게이트로 검사 (비어 있는 행은 제외)
+
+    Args:
+        path (str): 시트 경로
+
+    Returns:
+        Tuple[int, Dict[str, int]]: (통과하지 못한 행 수, 실패 사유별 행 수)
+    """
+    result = check_sheet(path, QualityGate())
+    failed = result.loc[(result["chars"] > 0) & (result["reasons"] != ""), "reasons"]
+    return len(failed), failed.str.split(", ").explode().value_counts().to_dict()
+
+
+def run_once(work_dir: str, options: dict) -> dict:
+    """
+    작업 디렉터리에서 process_all_titles를 한 번 실행하고 측정
+
+    Args:
+        work_dir (str): posting.xlsx가 있는 디렉터리 (저널/캐시도 여기에 생성)
+        options (dict): 벤치마크 옵션
+
+    Returns:
+        dict: 처리 행 수, 소요 시간(초), 최대 메모리(MB), 지연 시간 목록, 캐시 적중 수, 품질 실패 사유별 행 수
+    """
+    from 블로그글AI완성하기 import BlogContentGenerator
+    from 생성백엔드 import MockBackend
+    from 실행추적 import Tracer
+    from 응답캐시 import ResponseCache
+
+    os.chdir(work_dir)
+    backend = MockBackend(
+        latency_median=options["latency"],
+        latency_sigma=options["sigma"],
+        quota_rate=options["quota_rate"],
+        server_error_rate=options["server_error_rate"],
+        timeout_rate=options["timeout_rate"],
+        timeout=options["timeout"],
+    )
+    tracer = Tracer()
+    generator = BlogContentGenerator(
+        "mock-key",
+        max_workers=options["workers"],
+        requests_per_minute=options["rpm"],
+        tokens_per_minute=options["tpm"],
+        save_every=0,
+        cache=ResponseCache(os.path.join(work_dir, "cache.sqlite3"), enabled=options["cache"]),
+        batch_size=options["batch_size"],
+        tracer=tracer,
+        stream_output=options["stream_output"],
+        backend=backend,
+    )
+    # 재시도 대기를 짧게 하여 오류 주입 시에도 벤치마크가 오래 걸리지 않게 함
+    generator.retry_policy.base_delay = 0.05
+    generator.retry_policy.max_delay = 1.0
+    generator.router.cooldown_seconds = 0.5
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generator.process_all_titles("mock-key", resume=options["resume"], streaming=options["excel_streaming"])
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    quality_failed, quality_reasons = count_quality_failures("posting.xlsx")
+
+    latencies = []
+    for stage in ("gemini.call", "gemini.stream_call", "gemini.batch_call"):
+        latencies.extend(tracer.durations.get(stage, []))
+
+    return {
+        "filled": count_filled("posting.xlsx"),
+        "seconds": elapsed,
+        "peak_mb": peak / 1024 / 1024,
+        "latencies": sorted(latencies),
+        "cache_hits": int(tracer.counters.get("cache_hits", 0)),
+        "errors": generator.retry_policy.stats(),
+        "quality_failed": quality_failed,
+        "quality_reasons": quality_reasons,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 백엔드 생성 파이프라인 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="합성 시트의 행 수 목록 (기본값: 100 1000 10000)")
+    parser.add_argument("--workers", type=int, default=16, help="동시 실행 수 (기본값: 16)")
+    parser.add_argument("--rpm", type=int, default=1000000, help="분당 최대 요청 수 (기본값: 사실상 무제한)")
+    parser.add_argument("--tpm", type=int, default=1000000000, help="분당 최대 토큰 수 (기본값: 사실상 무제한)")
+    parser.add_argument("--latency", type=float, default=0.05, help="모의 응답 시간 중앙값(초) (기본값: 0.05)")
+    parser.add_argument("--sigma", type=float, default=0.5, help="응답 시간 로그정규분포 sigma (기본값: 0.5)")
+    parser.add_argument("--quota-rate", type=float, default=0.0, help="429 오류 확률 (기본값: 0)")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="500 오류 확률 (기본값: 0)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="시간 초과 오류 확률 (기본값: 0)")
+    parser.add_argument("--timeout", type=float, default=0.5, help="시간 초과 오류까지의 시간(초) (기본값: 0.5)")
+    parser.add_argument("--batch-size", type=int, default=1, help="배치 크기 (기본값: 1)")
+    parser.add_argument("--stream-output", action="store_true", help="스트리밍 생성과 조기 종료 사용")
+    parser.add_argument("--excel-streaming", action="store_true", help="시트를 스트리밍 모드로 처리")
+    parser.add_argument("--cache", action="store_true",
+                        help="응답 캐시를 켜고 같은 시트를 한 번 더 실행 (두 번째 실행은 모두 캐시 적중이어야 함)")
+    args = parser.parse_args()
+
+    options = {
+        "workers": args.workers, "rpm": args.rpm, "tpm": args.tpm,
+        "latency": args.latency, "sigma": args.sigma,
+        "quota_rate": args.quota_rate, "server_error_rate": args.server_error_rate,
+        "timeout_rate": args.timeout_rate, "timeout": args.timeout,
+        "batch_size": args.batch_size, "stream_output": args.stream_output,
+        "excel_streaming": args.excel_streaming, "cache": args.cache, "resume": False,
+    }
+
+    # 측정마다 새 프로세스를 사용해 이전 실행의 메모리가 섞이지 않도록 함
+    context = multiprocessing.get_context("spawn")
+
+    print(f"{'행 수':>7} | {'실행':<5} | {'채워진 행':>9} | {'초당 행':>8} | {'최대 메모리':>10} | "
+          f"{'p50':>6} | {'p95':>6} | {'p99':>6} | 캐시 적중 | 품질 실패 | API 오류")
+    print("-" * 122)
+
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            create_title_sheet(os.path.join(temp_dir, "posting.xlsx"), rows)
+
+            runs = ["첫 실행", "재실행"] if args.cache else ["첫 실행"]
+            for run_name in runs:
+                if run_name == "재실행":
+                    # 본문을 비운 시트로 다시 실행해 API 대신 캐시에서 채워지는지 확인
+                    create_title_sheet(os.path.join(temp_dir, "posting.xlsx"), rows)
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(run_once, temp_dir, options).result()
+
+                latencies = result["latencies"]
+                print(f"{rows:>7} | {run_name:<5} | {result['filled']:>9} | "
+                      f"{result['filled'] / result['seconds']:>8.1f} | {result['peak_mb']:>8.1f}MB | "
+                      f"{percentile(latencies, 50):>6.3f} | {percentile(latencies, 95):>6.3f} | "
+                      f"{percentile(latencies, 99):>6.3f} | {result['cache_hits']:>9} | "
+                      f"{result['quality_failed']:>9} | {result['errors']}")
+                if result["filled"] < rows:
+                    print(f"  경고: {rows - result['filled']}개 행이 비어 있습니다.")
+                if result["quality_failed"]:
+                    reasons = ", ".join(f"{reason} {count}" for reason, count in result["quality_reasons"].items())
+                    print(f"  경고: {result['quality_failed']}개 행이 품질 검사를 통과하지 못했습니다 ({reasons}).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,433 @@
+"""
+본문 생성(Gemini)과 포스팅(Selenium)을 한 번에 실행하는 파이프라인
+
+지금까지는 블로그글AI완성하기.py가 시트 전체를 채우고 저장한 뒤에야 블로그일괄포스팅.py로
+포스팅할 수 있었습니다. 파이프라인은 두 단계를 크기가 정해진 대기열로 잇습니다.
+본문이 생성되는 즉시 대기열에 들어가 포스팅되고, 포스팅이 밀려 대기열이 가득 차면 생성 쪽이
+새 요청을 보내지 않고 기다립니다(역압). 단계마다 작업자 수를 따로 정하므로 전체 시간은
+느린 단계의 시간에 가까워지고, 첫 글은 시트 전체가 아니라 한 행이 생성된 뒤 바로 게시됩니다.
+
+시트에 본문이 이미 있는 행은 생성하지 않고 바로 포스팅하며, 게시완료된 행은 건너뜁니다.
+품질 검사를 켜면 검사를 통과하지 못한 본문(기존 본문 포함)은 게시하지 않고
+다시 생성하거나 재생성 대기열에 남깁니다.
+본문과 포스팅 상태는 각 단계의 저널에 먼저 기록되고 마지막에 시트에 반영됩니다.
+
+사용법:
+    python 생성포스팅파이프라인.py --gen-workers 4 --publish-workers 2
+    python 생성포스팅파이프라인.py --mock --mock-rows 20    # 모의 백엔드 + 로컬 모의 사이트로 측정
+"""
+
+import argparse
+import os
+import queue
+import tempfile
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from 블로그글AI완성하기 import BlogContentGenerator
+from 본문품질검사 import QualityGate, load_banned_phrases
+from 블로그글쓰기자동화 import TYPING_MODES
+from 블로그일괄포스팅 import STATUS_POSTED, BlogBulkPublisher
+from 브라우저세션풀 import SessionStore
+from 셀렉터캐시 import SelectorRegistry
+from 실행추적 import Tracer
+from 응답캐시 import ResponseCache
+from 엑셀스트리밍 import StreamingExcelReader, StreamingExcelWriter
+from 중복본문색인 import DuplicateIndex
+from 크롬프로필 import BROWSER_PROFILES
+from 페이지스냅샷 import SnapshotBaseline
+
+
+class GeneratePublishPipeline:
+    def __init__(self, generator: BlogContentGenerator, publisher: BlogBulkPublisher,
+                 queue_size: Optional[int] = None):
+        """
+        생성-포스팅 파이프라인 초기화
+
+        Args:
+            generator (BlogContentGenerator): 본문 생성 단계 (작업자 수는 generator.max_workers)
+            publisher (BlogBulkPublisher): 포스팅 단계 (브라우저 수는 publisher.workers)
+            queue_size (Optional[int]): 생성된 본문이 포스팅을 기다리는 대기열 길이 (None이면 브라우저 수의 2배)
+        """
+        if generator.excel_file != publisher.excel_file:
+            raise ValueError(f"생성 단계({generator.excel_file})와 포스팅 단계({publisher.excel_file})의 "
+                             "Excel 파일이 다릅니다.")
+        self.generator = generator
+        self.publisher = publisher
+        self.excel_file = generator.excel_file
+        self.queue_size = queue_size or publisher.workers * 2
+        self.tracer = generator.tracer
+
+        # 오류로 중단할 때 생성 스레드가 대기열 앞에서 멈추지 않도록 알림
+        self.stop_event = threading.Event()
+        self.stats_lock = threading.Lock()
+        self.started_at = 0.0
+        self.generation_finished_at: Optional[float] = None
+        self.generation_error: Optional[BaseException] = None
+        self.generated = 0
+        self.task_count = 0
+        self.ready_count = 0
+        self.skipped_count = 0
+        self.held_count = 0
+        self.backpressure_waits = 0
+
+    def enqueue(self, publish_queue: queue.Queue, item) -> bool:
+        """
+        포스팅 대기열에 넣기 (가득 차면 빈자리가 날 때까지 기다림)
+
+        기다리는 동안 생성 스레드가 멈추므로 새 요청도 보내지 않습니다.
+
+        Args:
+            publish_queue (queue.Queue): 포스팅 대기열
+            item: (인덱스, 제목, 본문) 또는 종료 신호 None
+
+        Returns:
+            bool: 넣었으면 True, 중단되어 버렸으면 False (본문은 저널에 남아 있음)
+        """
+        try:
+            publish_queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        with self.stats_lock:
+            self.backpressure_waits += 1
+        with self.tracer.span("pipeline.backpressure"):
+            while not self.stop_event.is_set():
+                try:
+                    publish_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+        return False
+
+    def iter_tasks(self, publish_queue: queue.Queue, resume: bool) -> Iterator[Tuple[int, str]]:
+        """
+        시트를 한 행씩 읽어 생성할 (인덱스, 제목) 생성
+
+        본문이 이미 있는 행(시트 또는 이어하기 저널)은 생성하지 않고 바로 포스팅 대기열에 넣습니다.
+
+        Args:
+            publish_queue (queue.Queue): 포스팅 대기열
+            resume (bool): 지난 실행의 생성 저널에 기록된 본문을 다시 쓸지 여부
+
+        Yields:
+            Tuple[int, str]: 인덱스, 제목
+        """
+        journal = self.generator.journal
+        done_offsets = journal.index_offsets() if resume else {}
+        statuses = self.publisher.load_statuses()
+
+        for row_number, values in StreamingExcelReader(self.excel_file).iter_values():
+            if self.stop_event.is_set():
+                return
+
+            title = values[0] if len(values) > 0 else None
+            body = values[1] if len(values) > 1 else None
+            status = values[2] if len(values) > 2 else None
+            index = row_number - 2
+
+            if title is None or str(title).strip() == "":
+                continue
+            title = str(title)
+
+            if statuses.get(index, status) == STATUS_POSTED:
+                self.generator.index_existing_body(title, body)
+                self.skipped_count += 1
+                continue
+
+            if body is None or str(body).strip() == "":
+                offset = done_offsets.get(index)
+                entry = journal.read_entry(offset) if offset is not None else None
+                # 시트가 바뀌어 같은 행에 다른 제목이 있으면 다시 생성
+                body = entry["content"] if entry is not None and entry["title"] == title else None
+
+            if body is not None and str(body).strip() != "":
+                reasons = self.check_existing_body(index, title, str(body))
+                if not reasons:
+                    self.generator.index_existing_body(title, body)
+                    self.ready_count += 1
+                    self.enqueue(publish_queue, (index, title, str(body)))
+                    continue
+                if self.generator.max_repairs == 0:
+                    self.held_count += 1
+                    continue
+                # 문제를 알려 주고 이 행만 다시 생성
+                self.generator.schedule_repair(index, reasons)
+
+            self.task_count += 1
+            yield index, title
+
+    def check_existing_body(self, index: int, title: str, body: str) -> List[str]:
+        """
+        시트나 저널에 이미 있는 본문을 게시하기 전에 품질 검사
+
+        Args:
+            index (int): DataFrame 인덱스
+            title (str): 글 제목
+            body (str): 본문
+
+        Returns:
+            List[str]: 실패 사유 (통과하거나 품질 검사를 끄면 빈 목록)
+        """
+        if self.generator.quality_gate is None:
+            return []
+        reasons = self.generator.quality_gate.failures(body)
+        if not reasons:
+            self.generator.quality_failures.pop(index, None)
+            return []
+        action = "다시 생성합니다" if self.generator.max_repairs else "재생성 대기열에 남깁니다"
+        print(f"! {index + 2}행 기존 본문이 품질 검사를 통과하지 못해 게시하지 않고 {action} ({', '.join(reasons)})")
+        self.generator.quality_failures[index] = (title, reasons)
+        return reasons
+
+    def on_generated(self, publish_queue: queue.Queue, index: int, title: str, content: str):
+        """
+        생성된 본문을 포스팅 대기열에 넣음 (다시 생성해도 품질 검사를 통과하지 못한 본문은 게시하지 않음)
+
+        Args:
+            publish_queue (queue.Queue): 포스팅 대기열
+            index (int): DataFrame 인덱스
+            title (str): 글 제목
+            content (str): 생성된 본문
+        """
+        if index in self.generator.quality_failures:
+            self.held_count += 1
+            print(f"{index + 2}행은 품질 검사를 통과하지 못해 게시하지 않습니다: {title}")
+            return
+        self.enqueue(publish_queue, (index, title, content))
+
+    def generate(self, publish_queue: queue.Queue, total: int, resume: bool):
+        """
+        생성 단계 (별도 스레드): 완료된 본문을 바로 포스팅 대기열에 넣고, 끝나면 종료 신호 전달
+
+        Args:
+            publish_queue (queue.Queue): 포스팅 대기열
+            total (int): 진행률 표시에 사용할 전체 행 수
+            resume (bool): 지난 실행의 생성 저널을 이어서 쓸지 여부
+        """
+        try:
+            tasks = self.iter_tasks(publish_queue, resume)
+            # 새로 시작하면 저널을 비우고, 이어하기면 기존 저널 뒤에 추가
+            self.generator.journal.open(reset=not resume)
+            try:
+                self.generated = self.generator.run_generation(
+                    tasks, total, lambda index, title, content: self.on_generated(publish_queue, index, title, content)
+                )
+            finally:
+                self.generator.journal.close()
+        except BaseException as e:
+            self.generation_error = e
+            print(f"본문 생성 단계 오류: {e}")
+        finally:
+            self.generation_finished_at = time.perf_counter()
+            for _ in range(self.publisher.workers):
+                self.enqueue(publish_queue, None)
+
+    def run(self, resume: bool = False):
+        """
+        파이프라인 실행
+
+        생성 스레드를 먼저 시작하고, 그동안 브라우저를 로그인시킨 뒤 포스팅 작업자를 시작합니다.
+        끝나면 생성된 본문과 포스팅 상태를 차례로 시트에 반영합니다.
+
+        Args:
+            resume (bool): True이면 지난 실행의 생성 저널에 기록된 본문을 다시 생성하지 않고 사용
+        """
+        total_rows = StreamingExcelReader(self.excel_file).count_rows()
+        print(f"{self.excel_file} 생성-포스팅 파이프라인 시작 (총 {total_rows}행, "
+              f"생성 {self.generator.max_workers}개, 브라우저 {self.publisher.workers}개, 대기열 {self.queue_size}개)")
+
+        self.generator.load_quality_failures(resume=True)
+        pool = self.publisher.create_pool()
+        publish_queue = queue.Queue(maxsize=self.queue_size)
+        generation = threading.Thread(target=self.generate, args=(publish_queue, total_rows, resume),
+                                      name="generation", daemon=True)
+
+        self.started_at = time.perf_counter()
+        self.publisher.status_journal.open()
+        generation.start()
+        try:
+            # 생성이 진행되는 동안 로그인 (첫 로그인이 세션을 저장하므로 나머지는 세션 복원)
+            with self.tracer.span("pipeline.warm_up"):
+                pool.warm_up()
+            threads = self.publisher.start_workers(pool, publish_queue)
+
+            generation.join()
+            for thread in threads:
+                thread.join()
+        except BaseException:
+            self.stop_event.set()
+            print("파이프라인을 중단합니다. 진행 중인 생성 요청이 끝나기를 기다리는 중...")
+            generation.join()
+            raise
+        finally:
+            self.publisher.status_journal.close()
+            pool.close_all()
+            # 본문을 먼저 기록해야 상태를 기록할 때 본문 열이 유지됨
+            self.generator.write_journal_bodies()
+            self.generator.save_quality_failures()
+            self.publisher.write_statuses()
+
+        if self.generation_error is not None:
+            raise self.generation_error
+
+        self.print_summary(total_rows, resume)
+
+    def print_summary(self, total_rows: int, resume: bool):
+        """
+        두 단계의 결과와 첫 글까지 걸린 시간, 역압 대기 횟수 출력
+
+        Args:
+            total_rows (int): 전체 행 수
+            resume (bool): 이어하기 모드 여부
+        """
+        self.generator.print_summary(self.generated, self.task_count, self.skipped_count, total_rows, resume)
+        self.publisher.print_summary(trace_summary=False)
+
+        elapsed = time.perf_counter() - self.started_at
+        print("\n=== 파이프라인 ===")
+        print(f"생성한 본문: {self.generated}/{self.task_count}개, 기존 본문으로 바로 포스팅: {self.ready_count}개, "
+              f"이미 게시완료: {self.skipped_count}개")
+        if self.generator.quality_gate is not None:
+            print(f"품질 검사로 게시하지 않은 본문: {self.held_count}개")
+        if self.publisher.first_posted_at is not None:
+            print(f"첫 글 게시까지: {self.publisher.first_posted_at - self.started_at:.1f}초")
+        if self.generation_finished_at is not None:
+            print(f"생성 단계 종료: {self.generation_finished_at - self.started_at:.1f}초, 전체: {elapsed:.1f}초")
+        print(f"대기열이 가득 차 생성이 멈춘 횟수: {self.backpressure_waits}회 (대기열 {self.queue_size}개)")
+
+
+def run_mock_pipeline(rows: int, gen_workers: int, publish_workers: int, queue_size: Optional[int],
+                      latency: float, typing_mode: str, browser_profile: str, render_delay: float,
+                      tracer: Tracer):
+    """
+    모의 생성 백엔드와 로컬 모의 사이트로 파이프라인 전체를 실행 (API 할당량과 실제 블로그 사용 안 함)
+
+    시트, 저널, 세션, 셀렉터 기록은 임시 디렉터리에 만듭니다.
+
+    Args:
+        rows (int): 합성 제목 수
+        gen_workers (int): 생성 작업자 수
+        publish_workers (int): 브라우저 수
+        queue_size (Optional[int]): 포스팅 대기열 길이
+        latency (float): 모의 생성 응답 시간 중앙값(초)
+        typing_mode (str): 텍스트 입력 방식
+        browser_profile (str): 브라우저 프로필
+        render_delay (float): 모의 에디터 렌더링 지연(초)
+        tracer (Tracer): 단계별 소요 시간 추적기
+    """
+    from 네이버모의사이트 import MockNaverSite
+    from 생성백엔드 import MockBackend
+
+    site = MockNaverSite(render_delay=render_delay).start()
+    print(f"모의 사이트 시작: {site.base_url} (모의 생성 응답 {latency}초)")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        excel_file = os.path.join(temp_dir, "posting.xlsx")
+        writer = StreamingExcelWriter(excel_file)
+        for i in range(rows):
+            writer.write_row(f"파이프라인 합성 제목 {i + 1}", None)
+        writer.close()
+
+        generator = BlogContentGenerator(
+            "mock", max_workers=gen_workers, requests_per_minute=100000, tokens_per_minute=100000000,
+            cache=ResponseCache(os.path.join(temp_dir, "cache.sqlite3")), tracer=tracer,
+            backend=MockBackend(latency_median=latency), excel_file=excel_file,
+        )
+        publisher = BlogBulkPublisher(
+            excel_file, workers=publish_workers, typing_mode=typing_mode, browser_profile=browser_profile,
+            session_store=SessionStore(os.path.join(temp_dir, "session.json")),
+            tracer=tracer, selector_registry=SelectorRegistry(os.path.join(temp_dir, "selectors.json")),
+            naver_urls=site.urls, dom_baseline=SnapshotBaseline(os.path.join(temp_dir, "dom_baseline.json")),
+        )
+        try:
+            GeneratePublishPipeline(generator, publisher, queue_size).run()
+        finally:
+            site.stop()
+
+    print(f"\n모의 사이트에 저장된 글: {len(site.posts)}/{rows}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 생성과 포스팅을 대기열로 이어서 함께 실행")
+    parser.add_argument("--excel", default="posting.xlsx", help="제목 Excel 파일 (기본값: posting.xlsx)")
+    parser.add_argument("--gen-workers", type=int, default=4, help="동시에 실행할 API 호출 수 (기본값: 4)")
+    parser.add_argument("--publish-workers", type=int, default=2, help="동시에 사용할 브라우저 수 (기본값: 2)")
+    parser.add_argument("--queue-size", type=int, default=None,
+                        help="포스팅을 기다리는 본문 대기열 길이 (기본값: 브라우저 수의 2배)")
+    parser.add_argument("--rpm", type=int, default=60, help="분당 최대 요청 수 (기본값: 60)")
+    parser.add_argument("--tpm", type=int, default=250000, help="분당 최대 토큰 수 (기본값: 250000)")
+    parser.add_argument("--models", nargs="+", default=["gemini-2.5-flash"],
+                        help="우선순위 순서의 모델 목록 (기본값: gemini-2.5-flash)")
+    parser.add_argument("--resume", action="store_true",
+                        help="지난 실행의 생성 저널에 기록된 본문을 다시 생성하지 않고 사용")
+    parser.add_argument("--dedup-index", default=".body_index.sqlite3",
+                        help="본문 중복 색인 파일 (기본값: .body_index.sqlite3, 빈 문자열이면 검사 안 함)")
+    parser.add_argument("--quality-gate", choices=["off", "flag", "regenerate"], default="flag",
+                        help="게시 전 본문 품질 검사 (off: 검사 안 함, flag: 게시하지 않고 재생성 대기열에 기록, "
+                             "regenerate: 문제를 알려 주고 다시 생성) (기본값: flag)")
+    parser.add_argument("--max-repairs", type=int, default=1,
+                        help="--quality-gate regenerate에서 행마다 다시 생성할 최대 횟수 (기본값: 1)")
+    parser.add_argument("--banned", default=None,
+                        help="품질 검사 금지 표현 파일 (한 줄에 하나, 없으면 기본 목록)")
+    parser.add_argument("--typing-mode", choices=TYPING_MODES, default="insert",
+                        help="텍스트 입력 방식 (기본값: insert)")
+    parser.add_argument("--browser-profile", choices=BROWSER_PROFILES, default="worker",
+                        help="브라우저 프로필 (기본값: worker 헤드리스)")
+    parser.add_argument("--dom-baseline", default="dom_baseline.json",
+                        help="페이지 구조 기준 스냅샷 파일 (기본값: dom_baseline.json, 빈 문자열이면 검사 안 함)")
+    parser.add_argument("--trace", default="pipeline_trace.jsonl",
+                        help="단계별 소요 시간을 기록할 JSONL 파일 (기본값: pipeline_trace.jsonl, 빈 문자열이면 기록 안 함)")
+    parser.add_argument("--mock", action="store_true",
+                        help="모의 생성 백엔드와 로컬 모의 사이트로 파이프라인 성능 측정")
+    parser.add_argument("--mock-rows", type=int, default=20, help="모의 실행의 합성 제목 수 (기본값: 20)")
+    parser.add_argument("--mock-latency", type=float, default=1.0,
+                        help="모의 생성 응답 시간 중앙값(초) (기본값: 1.0)")
+    parser.add_argument("--mock-render-delay", type=float, default=0.5,
+                        help="모의 에디터 렌더링 지연(초) (기본값: 0.5)")
+    args = parser.parse_args()
+
+    tracer = Tracer(args.trace or None)
+    if args.mock:
+        try:
+            run_mock_pipeline(args.mock_rows, args.gen_workers, args.publish_workers, args.queue_size,
+                              args.mock_latency, args.typing_mode, args.browser_profile,
+                              args.mock_render_delay, tracer)
+        finally:
+            tracer.close()
+        return
+
+    api_keys = [key.strip() for key in os.getenv("GOOGLE_API_KEYS", "").split(",") if key.strip()]
+    api_key = api_keys[0] if api_keys else os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        print("오류: GOOGLE_API_KEY 환경변수가 설정되지 않았습니다.")
+        return
+
+    duplicate_index = DuplicateIndex(args.dedup_index) if args.dedup_index else None
+    quality_gate = None
+    if args.quality_gate != "off":
+        quality_gate = QualityGate(banned_phrases=load_banned_phrases(args.banned)) if args.banned else QualityGate()
+    generator = BlogContentGenerator(
+        api_key, max_workers=args.gen_workers, requests_per_minute=args.rpm, tokens_per_minute=args.tpm,
+        tracer=tracer, api_keys=api_keys or None, model_names=args.models,
+        duplicate_index=duplicate_index, excel_file=args.excel,
+        quality_gate=quality_gate,
+        max_repairs=args.max_repairs if args.quality_gate == "regenerate" else 0,
+    )
+    publisher = BlogBulkPublisher(
+        args.excel, workers=args.publish_workers, typing_mode=args.typing_mode,
+        browser_profile=args.browser_profile, tracer=tracer,
+        dom_baseline=SnapshotBaseline(args.dom_baseline) if args.dom_baseline else None,
+    )
+    try:
+        GeneratePublishPipeline(generator, publisher, args.queue_size).run(resume=args.resume)
+    finally:
+        tracer.close()
+        if duplicate_index is not None:
+            duplicate_index.close()
+
+
+if __name__ == "__main__":
+    main()
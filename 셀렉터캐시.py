@@ -0,0 +1,186 @@
+"""
+단계별로 성공한 셀렉터를 기억하여 다음 실행 때 먼저 시도하는 셀렉터 저장소
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 후보 셀렉터를 순서대로 한 번에 확인하여 처음 찾은 (순번, 요소)를 돌려주는 스크립트
+FIND_FIRST_SCRIPT = """
+var selectors = arguments[0], requireVisible = arguments[1], invalid = [];
+for (var i = 0; i < selectors.length; i++) {
+    var elements;
+    try { elements = document.querySelectorAll(selectors[i]); }
+    catch (e) { invalid.push(i); continue; }
+    for (var j = 0; j < elements.length; j++) {
+        var el = elements[j];
+        if (!requireVisible || (el.getClientRects().length > 0 && !el.disabled)) {
+            return {index: i, element: el, invalid: invalid};
+        }
+    }
+}
+return {index: -1, element: null, invalid: invalid};
+"""
+
+
+# id/class나 요소를 가리키는 속성이 있는 셀렉터 (없으면 "iframe", "[contenteditable='true']"처럼
+# 엉뚱한 요소와도 맞을 수 있는 범용 대체 셀렉터로 봄)
+SPECIFIC_SELECTOR = re.compile(r"[#.]|\[\s*(?:id|class|name|title|placeholder|aria-label|data-[\w-]+)\b")
+
+
+def is_specific(selector: str) -> bool:
+    """
+    셀렉터가 특정 요소를 가리키는지 확인 (범용 대체 셀렉터는 성공해도 우선순위를 올리지 않음)
+
+    Args:
+        selector (str): CSS 셀렉터
+
+    Returns:
+        bool: id, class 또는 요소를 가리키는 속성이 있으면 True
+    """
+    return SPECIFIC_SELECTOR.search(selector) is not None
+
+
+class SelectorRegistry:
+    def __init__(self, path: str = "selector_registry.json"):
+        """
+        셀렉터 저장소 초기화
+
+        Args:
+            path (str): 단계별 셀렉터 성공/실패 기록 파일 경로
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.data: Dict[str, dict] = {}
+        # 파일에 아직 쓰지 않은 변경(성공 횟수 등)이 있는지 (순서가 바뀌는 변경은 바로 저장)
+        self.dirty = False
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"셀렉터 기록을 읽지 못해 새로 시작합니다: {e}")
+
+        # 이번 실행의 적중 통계 (단계 이름 -> {"lookups", "hits", "misses"})
+        self.run_stats: Dict[str, Dict[str, int]] = {}
+
+    def order(self, step: str, candidates: List[str]) -> List[str]:
+        """
+        후보 셀렉터를 시도할 순서로 정렬
+
+        마지막으로 성공한 셀렉터가 가장 먼저, 그다음은 성공이 많고 실패가 적은 순,
+        기록이 같으면 원래 순서를 따릅니다. 범용 대체 셀렉터는 항상 특정 셀렉터 뒤에 둡니다
+        (후보를 한 번에 확인하므로 특정 셀렉터가 모두 실패하면 그대로 사용됨).
+
+        Args:
+            step (str): 단계 이름 (예: title, content, save)
+            candidates (List[str]): 코드에 정의된 후보 셀렉터
+
+        Returns:
+            List[str]: 정렬된 셀렉터 목록
+        """
+        with self.lock:
+            records = self.data.get(step, {}).get("selectors", {})
+            last_success = self.data.get(step, {}).get("last_success")
+
+        def score(item):
+            position, selector = item
+            record = records.get(selector, {})
+            return (
+                # 이전 버전이 기록한 범용 셀렉터의 마지막 성공은 무시
+                0 if selector == last_success and is_specific(selector) else 1,
+                0 if is_specific(selector) else 1,
+                -(record.get("success", 0) - 2 * record.get("failure", 0)),
+                position,
+            )
+
+        return [selector for _, selector in sorted(enumerate(candidates), key=score)]
+
+    def record(self, step: str, matched: Optional[str], missed: List[str], first_try: bool):
+        """
+        조회 결과 기록
+
+        범용 대체 셀렉터로 찾은 경우는 엉뚱한 요소였을 수 있으므로 우선순위를 올리지 않습니다.
+        시도 순서가 바뀌는 변경(강등, 마지막 성공 셀렉터 변경)만 바로 파일에 저장하고,
+        성공 횟수만 늘어난 기록은 save() 때 저장합니다.
+
+        Args:
+            step (str): 단계 이름
+            matched (Optional[str]): 찾은 셀렉터 (못 찾았으면 None)
+            missed (List[str]): 확인했지만 맞는 요소가 없었던 셀렉터 (강등 대상)
+            first_try (bool): 가장 우선순위가 높은 셀렉터로 바로 찾았는지
+        """
+        with self.lock:
+            entry = self.data.setdefault(step, {"selectors": {}, "last_success": None})
+            selectors = entry["selectors"]
+
+            order_changed = bool(missed)
+            for selector in missed:
+                selectors.setdefault(selector, {"success": 0, "failure": 0})["failure"] += 1
+            if matched is not None and is_specific(matched):
+                record = selectors.setdefault(matched, {"success": 0, "failure": 0})
+                record["success"] += 1
+                record["last_success_at"] = time.time()
+                order_changed = order_changed or entry["last_success"] != matched
+                entry["last_success"] = matched
+                self.dirty = True
+
+            stats = self.run_stats.setdefault(step, {"lookups": 0, "hits": 0, "misses": 0})
+            stats["lookups"] += 1
+            if matched is None:
+                stats["misses"] += 1
+            elif first_try:
+                stats["hits"] += 1
+
+            if order_changed:
+                self._save()
+
+    def demote(self, step: str, selector: Optional[str]):
+        """
+        찾은 요소로 다음 동작(입력, 저장 등)이 실패했을 때 그 셀렉터를 강등
+
+        Args:
+            step (str): 단계 이름
+            selector (Optional[str]): 요소를 찾은 셀렉터 (None이면 무시)
+        """
+        if selector is None:
+            return
+        with self.lock:
+            entry = self.data.setdefault(step, {"selectors": {}, "last_success": None})
+            entry["selectors"].setdefault(selector, {"success": 0, "failure": 0})["failure"] += 1
+            if entry["last_success"] == selector:
+                entry["last_success"] = None
+            self._save()
+
+    def save(self):
+        """저장하지 않은 기록이 있으면 파일에 저장 (브라우저를 닫을 때 호출)"""
+        with self.lock:
+            if self.dirty:
+                self._save()
+
+    def _save(self):
+        """기록 파일 저장 (lock 안에서 호출)"""
+        self.dirty = False
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+
+    def print_stats(self):
+        """
+        이번 실행의 단계별 적중률 출력
+
+        적중률이 떨어지면 네이버 페이지 구조가 바뀌었을 가능성이 높습니다.
+        """
+        if not self.run_stats:
+            return
+        print("\n=== 셀렉터 적중률 ===")
+        with self.lock:
+            for step, stats in self.run_stats.items():
+                rate = stats["hits"] / stats["lookups"] * 100
+                print(f"{step:<9} 첫 시도 적중 {stats['hits']}/{stats['lookups']} ({rate:.0f}%), "
+                      f"찾지 못함 {stats['misses']}회, 현재 우선: {self.data.get(step, {}).get('last_success')}")
@@ -0,0 +1,249 @@
+"""
+Gemini API 호출 속도 제한 모듈 (토큰 버킷 방식)
+"""
+
+import multiprocessing
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            capacity (float): 버킷 최대 용량 (순간적으로 허용되는 최대 사용량)
+            refill_per_second (float): 초당 채워지는 양
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 버킷 채우기 (lock 안에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+
+    def reservable(self, amount: float) -> float:
+        """
+        amount를 예약할 때 실제로 버킷에서 빼는 양
+
+        용량보다 큰 요청은 용량만큼만 요구합니다 (영원히 대기하지 않도록).
+        실제 사용량으로 보정할 때도 이 양을 기준으로 되돌려줘야 합니다.
+
+        Args:
+            amount (float): 사용할 양
+
+        Returns:
+            float: 버킷에서 빼는 양
+        """
+        return min(float(amount), self.capacity)
+
+    def reserve(self, amount: float) -> float:
+        """
+        버킷에서 amount 만큼 예약하고 대기해야 할 시간 반환
+
+        버킷이 부족하면 잔량을 음수(빚)로 만들어 두고, 빚이 갚아질 때까지의
+        시간을 돌려줍니다. 호출 순서대로 대기 시간이 늘어나므로 여러 스레드가
+        동시에 호출해도 공정하게 줄을 섭니다.
+
+        Args:
+            amount (float): 사용할 양
+
+        Returns:
+            float: 대기해야 할 시간(초)
+        """
+        amount = self.reservable(amount)
+        with self.lock:
+            self._refill()
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_per_second
+
+    def wait_time(self, amount: float) -> float:
+        """
+        amount 만큼 예약한다면 기다려야 할 시간 (예약하지 않고 확인만 함)
+
+        Args:
+            amount (float): 사용할 양
+
+        Returns:
+            float: 대기해야 할 시간(초)
+        """
+        amount = self.reservable(amount)
+        with self.lock:
+            self._refill()
+            remaining = self.tokens - amount
+        return 0.0 if remaining >= 0 else -remaining / self.refill_per_second
+
+    def adjust(self, amount: float):
+        """
+        예약량과 실제 사용량의 차이를 반영 (양수면 반환, 음수면 추가 차감)
+
+        Args:
+            amount (float): 버킷에 되돌려줄 양
+        """
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class SharedTokenBucket(TokenBucket):
+    def __init__(self, capacity: float, refill_per_second: float, state, lock):
+        """
+        여러 프로세스가 공유 메모리의 잔량을 함께 쓰는 토큰 버킷
+
+        잔량과 마지막 갱신 시각을 multiprocessing.Array에 두고 프로세스 간 잠금으로 보호하므로
+        같은 API 키를 쓰는 모든 프로세스가 하나의 할당량을 나눠 씁니다. 갱신 시각은
+        time.monotonic 기준이라 같은 컴퓨터의 프로세스끼리만 공유할 수 있습니다.
+
+        Args:
+            capacity (float): 버킷 최대 용량
+            refill_per_second (float): 초당 채워지는 양
+            state: multiprocessing.Array("d", [잔량, 마지막 갱신 시각])
+            lock: multiprocessing.Lock
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.state = state
+        self.lock = lock
+
+    @property
+    def tokens(self) -> float:
+        return self.state[0]
+
+    @tokens.setter
+    def tokens(self, value: float):
+        self.state[0] = value
+
+    @property
+    def updated_at(self) -> float:
+        return self.state[1]
+
+    @updated_at.setter
+    def updated_at(self, value: float):
+        self.state[1] = value
+
+
+def create_shared_quota(route_names: Iterable[str], requests_per_minute: int,
+                        tokens_per_minute: int) -> Dict[str, Tuple]:
+    """
+    경로(API 키/모델)별로 여러 프로세스가 함께 쓸 속도 제한 상태 생성 (부모 프로세스에서 호출)
+
+    결과는 ProcessPoolExecutor의 initializer 인자로 자식 프로세스에 넘깁니다.
+
+    Args:
+        route_names (Iterable[str]): 경로 이름 (ModelRouter의 Route.name)
+        requests_per_minute (int): 경로별 분당 최대 요청 수 (모든 프로세스 합계)
+        tokens_per_minute (int): 경로별 분당 최대 토큰 수 (모든 프로세스 합계)
+
+    Returns:
+        Dict[str, Tuple]: 경로 이름별 (요청 버킷 상태, 토큰 버킷 상태, 잠금)
+    """
+    now = time.monotonic()
+    quota = {}
+    for name in route_names:
+        quota[name] = (
+            multiprocessing.Array("d", [max(1.0, requests_per_minute / 60), now], lock=False),
+            multiprocessing.Array("d", [max(1.0, tokens_per_minute / 60), now], lock=False),
+            multiprocessing.Lock(),
+        )
+    return quota
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: int = 60, tokens_per_minute: int = 250000,
+                 shared_state: Optional[Tuple] = None):
+        """
+        분당 요청 수(RPM)와 분당 토큰 수(TPM)를 동시에 제한하는 속도 제한기
+
+        Args:
+            requests_per_minute (int): 분당 최대 요청 수
+            tokens_per_minute (int): 분당 최대 토큰 수 (입력 + 출력)
+            shared_state (Optional[Tuple]): create_shared_quota가 만든 (요청 상태, 토큰 상태, 잠금)
+                (주면 다른 프로세스와 할당량을 나눠 씀)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        # 버킷 용량을 1초 분량으로 두어 실행 시작 시 요청이 한꺼번에 몰리지 않도록 함
+        request_capacity = max(1.0, requests_per_minute / 60)
+        token_capacity = max(1.0, tokens_per_minute / 60)
+        if shared_state is not None:
+            request_state, token_state, lock = shared_state
+            self.request_bucket = SharedTokenBucket(request_capacity, requests_per_minute / 60, request_state, lock)
+            self.token_bucket = SharedTokenBucket(token_capacity, tokens_per_minute / 60, token_state, lock)
+            return
+        self.request_bucket = TokenBucket(
+            capacity=request_capacity,
+            refill_per_second=requests_per_minute / 60,
+        )
+        self.token_bucket = TokenBucket(
+            capacity=token_capacity,
+            refill_per_second=tokens_per_minute / 60,
+        )
+
+    def acquire(self, estimated_tokens: int) -> float:
+        """
+        요청 1건과 예상 토큰만큼 사용 권한을 얻을 때까지 대기
+
+        Args:
+            estimated_tokens (int): 이번 요청의 예상 토큰 수
+
+        Returns:
+            float: 실제로 대기한 시간(초)
+        """
+        wait = max(
+            self.request_bucket.reserve(1),
+            self.token_bucket.reserve(estimated_tokens),
+        )
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def wait_time(self, estimated_tokens: int) -> float:
+        """
+        지금 acquire하면 기다려야 할 시간 (여러 키/모델 중 여유 있는 쪽을 고를 때 사용)
+
+        Args:
+            estimated_tokens (int): 이번 요청의 예상 토큰 수
+
+        Returns:
+            float: 대기해야 할 시간(초)
+        """
+        return max(
+            self.request_bucket.wait_time(1),
+            self.token_bucket.wait_time(estimated_tokens),
+        )
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int):
+        """
+        응답의 실제 토큰 사용량으로 예약량 보정
+
+        버킷 용량보다 큰 예상치(배치 요청)는 용량만큼만 예약되므로 그만큼만 되돌려주고,
+        실제 사용량이 예약량보다 많으면 차이를 빚으로 남겨 다음 요청이 기다리게 합니다.
+
+        Args:
+            estimated_tokens (int): acquire 시 예약한 토큰 수
+            actual_tokens (int): API가 보고한 실제 토큰 수
+        """
+        self.token_bucket.adjust(self.token_bucket.reservable(estimated_tokens) - actual_tokens)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    문자열의 토큰 수를 대략적으로 추정 (한글 기준 약 2자당 1토큰)
+
+    Args:
+        text (str): 추정할 문자열
+
+    Returns:
+        int: 예상 토큰 수
+    """
+    return len(text) // 2 + 1
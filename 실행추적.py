@@ -0,0 +1,147 @@
+"""
+단계별 소요 시간 추적 (JSONL 트레이스 기록 및 p50/p95/p99 요약)
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    정렬된 값 목록의 백분위수 (nearest-rank 방식)
+
+    Args:
+        values (List[float]): 오름차순으로 정렬된 값
+        q (float): 백분위 (0~100)
+
+    Returns:
+        float: 백분위수 (값이 없으면 0)
+    """
+    if not values:
+        return 0.0
+    rank = max(1, int(len(values) * q / 100 + 0.999999))
+    return values[min(rank, len(values)) - 1]
+
+
+class Tracer:
+    def __init__(self, path: Optional[str] = None):
+        """
+        실행 추적기 초기화
+
+        Args:
+            path (Optional[str]): 구간 기록을 한 줄씩 추가할 JSONL 파일 (None이면 메모리에만 집계)
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+        self.run_id = time.strftime("%Y%m%d-%H%M%S")
+        self.started_at = time.perf_counter()
+
+        # 단계 이름 -> 소요 시간(초) 목록, 카운터 이름 -> 누적값
+        self.durations: Dict[str, List[float]] = {}
+        self.counters: Dict[str, float] = {}
+
+        if self.path:
+            self.file = open(self.path, "a", encoding="utf-8")
+
+    @contextmanager
+    def span(self, stage: str, **attributes):
+        """
+        with 블록의 소요 시간을 한 구간으로 기록
+
+        블록 안에서 yield된 dict에 값을 넣으면 (예: 토큰 수) 트레이스에 함께 기록됩니다.
+        예외가 발생해도 구간은 error 상태로 기록되고 예외는 그대로 전달됩니다.
+
+        Args:
+            stage (str): 단계 이름 (예: gemini.call, selenium.title)
+            **attributes: 트레이스에 함께 기록할 값
+
+        Yields:
+            dict: 추가 기록용 속성 dict
+        """
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield attributes
+        except BaseException as e:
+            status = "error"
+            attributes["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - started, status=status, **attributes)
+
+    def record(self, stage: str, duration: float, status: str = "ok", **attributes):
+        """
+        이미 측정한 구간 기록
+
+        Args:
+            stage (str): 단계 이름
+            duration (float): 소요 시간(초)
+            status (str): ok 또는 error
+            **attributes: 트레이스에 함께 기록할 값
+        """
+        with self.lock:
+            self.durations.setdefault(stage, []).append(duration)
+            if self.file is None:
+                return
+            entry = {
+                "run": self.run_id,
+                "ts": round(time.time() - duration, 3),
+                "stage": stage,
+                "duration_ms": round(duration * 1000, 1),
+                "status": status,
+                "thread": threading.current_thread().name,
+            }
+            entry.update(attributes)
+            self.file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            self.file.flush()
+
+    def count(self, name: str, amount: float = 1):
+        """
+        카운터 누적 (예: tokens, cache_hits)
+
+        Args:
+            name (str): 카운터 이름
+            amount (float): 더할 값
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def print_summary(self, rows: Optional[int] = None):
+        """
+        단계별 p50/p95/p99와 토큰, 분당 처리 행 수 출력
+
+        Args:
+            rows (Optional[int]): 이번 실행에서 완료된 행 수 (None이면 처리량 생략)
+        """
+        with self.lock:
+            stages = {stage: sorted(values) for stage, values in self.durations.items()}
+            counters = dict(self.counters)
+        elapsed = time.perf_counter() - self.started_at
+        minutes = max(elapsed / 60, 1e-9)
+
+        if stages:
+            print("\n=== 단계별 소요 시간 (초) ===")
+            print(f"{'단계':<20} | {'횟수':>6} | {'p50':>7} | {'p95':>7} | {'p99':>7} | {'합계':>8}")
+            print("-" * 70)
+            for stage, values in stages.items():
+                print(f"{stage:<20} | {len(values):>6} | {percentile(values, 50):>7.2f} | "
+                      f"{percentile(values, 95):>7.2f} | {percentile(values, 99):>7.2f} | {sum(values):>8.1f}")
+
+        print(f"\n실행 시간: {elapsed:.1f}초")
+        if "tokens" in counters:
+            print(f"토큰 처리량: 분당 {counters['tokens'] / minutes:.0f}개 (전체 {counters['tokens']:.0f}개)")
+        if rows is not None:
+            print(f"처리 행: {rows}개 (분당 {rows / minutes:.1f}행)")
+        if self.path:
+            print(f"트레이스 기록: {self.path} (run={self.run_id})")
+
+    def close(self):
+        """트레이스 파일 닫기"""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
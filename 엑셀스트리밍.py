@@ -0,0 +1,200 @@
+"""
+대용량 포스팅 시트를 위한 스트리밍 Excel 읽기/쓰기 (openpyxl read-only / write-only 모드)
+"""
+
+import os
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from openpyxl import Workbook, load_workbook
+
+HEADER = ("제목", "본문")
+STATUS_HEADER = "포스팅상태"
+
+
+class StreamingExcelReader:
+    def __init__(self, path: str):
+        """
+        스트리밍 Excel 리더 초기화
+
+        Args:
+            path (str): 읽을 Excel 파일 경로
+        """
+        self.path = path
+
+    def count_rows(self) -> int:
+        """
+        헤더를 제외한 데이터 행 수
+
+        시트 크기 정보가 있으면 그대로 사용하고, 없으면 (write-only로 저장된 파일)
+        A열만 한 번 훑어서 셉니다.
+
+        Returns:
+            int: 데이터 행 수
+        """
+        wb = load_workbook(self.path, read_only=True)
+        try:
+            ws = wb.active
+            if ws.max_row and ws.max_row > 1:
+                return ws.max_row - 1
+            ws.reset_dimensions()
+            return sum(1 for _ in ws.iter_rows(min_row=2, max_col=1, values_only=True))
+        finally:
+            wb.close()
+
+    def read_header(self) -> List[str]:
+        """
+        1행(헤더) 읽기
+
+        Returns:
+            List[str]: 헤더 값 목록 (중간의 빈 칸은 None으로 두어 열 위치를 유지하고 끝의 빈 칸만 제거)
+        """
+        wb = load_workbook(self.path, read_only=True)
+        try:
+            for row in wb.active.iter_rows(max_row=1, values_only=True):
+                header = list(row)
+                while header and header[-1] is None:
+                    header.pop()
+                if len(header) >= len(HEADER):
+                    return header
+            return list(HEADER)
+        finally:
+            wb.close()
+
+    def iter_values(self) -> Iterator[Tuple[int, tuple]]:
+        """
+        (Excel 행 번호, 행 전체 값)을 한 행씩 생성 (본문 뒤의 추가 열 포함)
+
+        Yields:
+            Tuple[int, tuple]: 행 번호(2부터), 행 값
+        """
+        wb = load_workbook(self.path, read_only=True)
+        try:
+            ws = wb.active
+            for row_number, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+                yield row_number, row
+        finally:
+            wb.close()
+
+    def iter_rows(self) -> Iterator[Tuple[int, Optional[str], Optional[str]]]:
+        """
+        (Excel 행 번호, 제목, 본문)을 한 행씩 생성
+
+        1행은 헤더로 간주하여 건너뜁니다.
+
+        Yields:
+            Tuple[int, Optional[str], Optional[str]]: 행 번호(2부터), 제목, 본문
+        """
+        for row_number, row in self.iter_values():
+            title = row[0] if len(row) > 0 else None
+            body = row[1] if len(row) > 1 else None
+            yield row_number, title, body
+
+    def iter_titles(self) -> Iterator[Tuple[int, str]]:
+        """
+        제목이 있는 행만 (Excel 행 번호, 제목)으로 생성
+
+        Yields:
+            Tuple[int, str]: 행 번호, 제목
+        """
+        for row_number, title, _ in self.iter_rows():
+            if title is None or str(title).strip() == "":
+                continue
+            yield row_number, str(title)
+
+
+class StreamingExcelWriter:
+    def __init__(self, path: str, header: Sequence[str] = HEADER):
+        """
+        스트리밍 Excel 라이터 초기화 (행 순서대로만 기록 가능)
+
+        Args:
+            path (str): 저장할 Excel 파일 경로
+            header (Sequence[str]): 1행에 기록할 헤더
+        """
+        self.path = path
+        self.wb = Workbook(write_only=True)
+        self.ws = self.wb.create_sheet()
+        self.ws.append(tuple(header))
+
+    def write_row(self, title: Optional[str], body: Optional[str], *extra):
+        """
+        한 행 기록
+
+        Args:
+            title (Optional[str]): 제목
+            body (Optional[str]): 본문
+            *extra: 본문 뒤에 이어지는 추가 열 값 (예: 포스팅 상태)
+        """
+        self.ws.append((title, body) + extra)
+
+    def close(self):
+        """파일 저장 후 닫기"""
+        self.wb.save(self.path)
+        self.wb.close()
+
+
+def rewrite_sheet(source_path: str, update_row: Callable[[int, list], Optional[list]],
+                  header: Optional[Sequence[str]] = None, target_path: Optional[str] = None) -> int:
+    """
+    원본 시트를 한 행씩 읽으며 update_row가 돌려준 값으로 바꿔 다시 저장
+
+    원본과 결과 모두 스트리밍으로 처리하므로 시트 크기와 무관하게 메모리 사용량이
+    일정합니다. 결과는 임시 파일에 쓴 뒤 교체하므로 저장 중 중단되어도 원본이
+    손상되지 않습니다.
+
+    Args:
+        source_path (str): 원본 Excel 파일 경로
+        update_row (Callable[[int, list], Optional[list]]): (행 번호, 행 값 목록)을 받아
+            바뀐 행 값을 돌려주는 함수 (None이면 원본 행 유지)
+        header (Optional[Sequence[str]]): 새 헤더 (None이면 원본 헤더 유지)
+        target_path (Optional[str]): 저장 경로 (None이면 원본 덮어쓰기)
+
+    Returns:
+        int: 바뀐 행 수
+    """
+    target_path = target_path or source_path
+    temp_path = f"{target_path}.tmp.xlsx"
+
+    reader = StreamingExcelReader(source_path)
+    header = list(header) if header is not None else reader.read_header()
+    writer = StreamingExcelWriter(temp_path, header)
+    updated = 0
+    try:
+        for row_number, row in reader.iter_values():
+            values = list(row) + [None] * (len(header) - len(row))
+            new_values = update_row(row_number, values)
+            if new_values is not None:
+                values = new_values
+                updated += 1
+            writer.write_row(*values)
+        writer.close()
+        os.replace(temp_path, target_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return updated
+
+
+def write_bodies(source_path: str, get_body: Callable[[int, Optional[str]], Optional[str]],
+                 target_path: Optional[str] = None) -> int:
+    """
+    원본 시트를 한 행씩 읽으며 새 본문을 채워 다시 저장 (추가 열은 그대로 유지)
+
+    Args:
+        source_path (str): 원본 Excel 파일 경로
+        get_body (Callable[[int, Optional[str]], Optional[str]]): (행 번호, 제목)을 받아 새 본문을 돌려주는 함수
+            (None이면 원본 본문 유지)
+        target_path (Optional[str]): 저장 경로 (None이면 원본 덮어쓰기)
+
+    Returns:
+        int: 새 본문으로 채운 행 수
+    """
+    def update_row(row_number, values):
+        new_body = get_body(row_number, values[0])
+        if new_body is None:
+            return None
+        values[1] = new_body
+        return values
+
+    return rewrite_sheet(source_path, update_row, target_path=target_path)
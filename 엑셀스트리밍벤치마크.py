@@ -0,0 +1,100 @@
+"""
+pandas 방식과 스트리밍 방식의 Excel 읽기/쓰기 성능 비교 벤치마크
+
+사용법:
+    python 엑셀스트리밍벤치마크.py                # 1만 행, 10만 행 비교
+    python 엑셀스트리밍벤치마크.py --rows 5000    # 원하는 행 수 지정
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from 엑셀스트리밍 import StreamingExcelWriter, write_bodies
+
+BODY_LENGTH = 1500
+
+
+def make_body(row_number: int) -> str:
+    """행마다 다른 1500자 분량의 합성 본문 생성"""
+    sentence = f"{row_number}번째 글의 본문 문장입니다. "
+    return (sentence * (BODY_LENGTH // len(sentence) + 1))[:BODY_LENGTH]
+
+
+def create_sheet(path: str, rows: int):
+    """본문이 모두 채워진 합성 포스팅 시트 생성"""
+    writer = StreamingExcelWriter(path)
+    for row_number in range(2, rows + 2):
+        writer.write_row(f"합성 제목 {row_number}", make_body(row_number))
+    writer.close()
+
+
+def run_pandas(path: str) -> int:
+    """기존 방식: DataFrame으로 읽고 본문을 모두 교체한 뒤 save_excel로 저장"""
+    from 블로그글AI완성하기 import BlogContentGenerator
+    from 응답캐시 import ResponseCache
+
+    generator = BlogContentGenerator("benchmark", cache=ResponseCache(enabled=False))
+    generator.excel_file = path
+    df = generator.read_excel_titles()
+    df.iloc[:, 1] = [make_body(index + 2) + " (수정)" for index in range(len(df))]
+    generator.save_excel(df)
+    return len(df)
+
+
+def run_streaming(path: str) -> int:
+    """스트리밍 방식: 한 행씩 읽으면서 새 본문을 채워 저장"""
+    return write_bodies(path, lambda row_number, title: make_body(row_number) + " (수정)")
+
+
+def measure(mode: str, path: str) -> dict:
+    """
+    별도 프로세스에서 한 가지 방식을 실행하고 시간과 최대 메모리 측정
+
+    Args:
+        mode (str): "pandas" 또는 "streaming"
+        path (str): 시트 파일 경로
+
+    Returns:
+        dict: 처리 행 수, 소요 시간(초), Python 최대 할당 메모리(MB)
+    """
+    runner = run_pandas if mode == "pandas" else run_streaming
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = runner(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"rows": rows, "seconds": elapsed, "peak_mb": peak / 1024 / 1024}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel 읽기/쓰기 방식 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000],
+                        help="합성 시트의 행 수 목록 (기본값: 10000 100000)")
+    args = parser.parse_args()
+
+    # 측정마다 새 프로세스를 사용해 이전 실행의 메모리가 섞이지 않도록 함
+    context = multiprocessing.get_context("spawn")
+
+    print(f"{'행 수':>8} | {'방식':<9} | {'소요 시간':>10} | {'최대 메모리':>11}")
+    print("-" * 50)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for rows in args.rows:
+            for mode in ("pandas", "streaming"):
+                path = os.path.join(temp_dir, f"posting_{rows}_{mode}.xlsx")
+                create_sheet(path, rows)
+
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(measure, mode, path).result()
+
+                print(f"{rows:>8} | {mode:<9} | {result['seconds']:>9.1f}s | {result['peak_mb']:>9.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,165 @@
 """
 블로그 포스팅용 엑셀 파일 생성 스크립트
+
+--generate를 주면 키워드 목록과 제목 템플릿(계절어, 연도, 수식어 조합)으로 대량의 제목 시트를
+만듭니다. 제목은 한 행씩 디스크에 기록하고(메모리 일정), 해시 집합으로 중복을 거르며,
+--shards N이면 작업자마다 하나씩 쓸 수 있도록 N개의 파일로 나눠 씁니다.
 """
 
-import pandas as pd
+import argparse
+import datetime
+import hashlib
+import itertools
 import os
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from 엑셀스트리밍 import StreamingExcelWriter
+
+# 키워드 표 없이 실행할 때 쓰는 블로그 포스팅 제목 샘플
+SAMPLE_TITLES = [
+    "2024년 최신 부업 추천 - 집에서 월 100만원 벌기",
+    "다이어트 성공 후기 - 3개월 만에 10kg 감량한 비법",
+    "ChatGPT 활용법 완벽 가이드 - 업무 효율 200% 향상",
+    "부동산 투자 초보자를 위한 완벽 가이드",
+    "코딩 독학 로드맵 - 6개월 만에 개발자 되기"
+]
+
+# 대량 생성 모드의 기본 조합 재료
+DEFAULT_TEMPLATES = [
+    "{year}년 {season} {keyword} {modifier}",
+    "{keyword} {modifier} - {year}년 {season} 최신 정리",
+    "{season}에 꼭 알아야 할 {keyword} {modifier}",
+]
+DEFAULT_SEASONS = ["봄", "여름", "가을", "겨울", "연말", "새해"]
+DEFAULT_MODIFIERS = ["추천", "완벽 가이드", "총정리", "비교", "후기", "초보자 꿀팁"]
+
+def read_lines(path: str) -> Iterator[str]:
+    """
+    텍스트 파일을 한 줄씩 읽기 (빈 줄과 #으로 시작하는 줄은 건너뜀)
+    
+    Args:
+        path (str): 한 줄에 하나씩 적은 파일 경로
+        
+    Yields:
+        str: 앞뒤 공백을 지운 줄
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+def iter_generated_titles(keywords: Iterable[str], templates: Sequence[str], years: Sequence[int],
+                          seasons: Sequence[str], modifiers: Sequence[str]) -> Iterator[str]:
+    """
+    키워드 × 템플릿 × 연도 × 계절어 × 수식어 조합으로 제목을 하나씩 생성 (중복 포함)
+    
+    템플릿에 없는 자리표시자는 조합에서 빼므로 같은 제목이 여러 번 나올 수 있습니다.
+    
+    Args:
+        keywords (Iterable[str]): 키워드 (파일에서 읽는 생성기여도 됨)
+        templates (Sequence[str]): {keyword}, {year}, {season}, {modifier}를 쓰는 제목 템플릿
+        years (Sequence[int]): 연도 목록
+        seasons (Sequence[str]): 계절어 목록
+        modifiers (Sequence[str]): 수식어 목록
+        
+    Yields:
+        str: 제목
+    """
+    for keyword in keywords:
+        for template, year, season, modifier in itertools.product(templates, years, seasons, modifiers):
+            yield template.format(keyword=keyword, year=year, season=season, modifier=modifier)
+
+def shard_paths(file_name: str, shards: int) -> List[str]:
+    """
+    분할 파일 경로 목록 (1개면 원래 이름, 여러 개면 posting_1.xlsx, posting_2.xlsx, ...)
+    
+    Args:
+        file_name (str): 기본 파일 이름
+        shards (int): 분할 수
+        
+    Returns:
+        List[str]: 파일 경로 목록
+    """
+    if shards <= 1:
+        return [file_name]
+    stem, extension = os.path.splitext(file_name)
+    return [f"{stem}_{i + 1}{extension}" for i in range(shards)]
 
-def create_posting_excel():
-    """포스팅용 엑셀 파일 생성"""
+def generate_posting_sheets(titles: Iterable[str], file_name: str = "posting.xlsx", shards: int = 1,
+                            limit: Optional[int] = None) -> List[str]:
+    """
+    제목을 중복 없이 N개의 시트에 번갈아 기록 (한 행씩 스트리밍으로 기록)
+    
+    중복 검사는 제목 원문 대신 8바이트 해시만 집합에 담아 메모리를 줄입니다.
+    
+    Args:
+        titles (Iterable[str]): 제목 (생성기여도 됨)
+        file_name (str): 기본 파일 이름 (분할 시 _1, _2, ... 접미사)
+        shards (int): 나눌 파일 수 (작업자 수)
+        limit (Optional[int]): 기록할 최대 제목 수 (None이면 전부)
+        
+    Returns:
+        List[str]: 생성한 파일 경로 목록
+    """
+    paths = shard_paths(file_name, shards)
+    writers = [StreamingExcelWriter(path) for path in paths]
+    seen = set()
+    written = 0
+    duplicates = 0
+    try:
+        for title in titles:
+            digest = hashlib.blake2b(title.encode("utf-8"), digest_size=8).digest()
+            if digest in seen:
+                duplicates += 1
+                continue
+            seen.add(digest)
+            
+            # 작업자마다 행 수가 고르게 나뉘도록 번갈아 기록
+            writers[written % len(writers)].write_row(title, None)
+            written += 1
+            if written % 10000 == 0:
+                print(f"{written}개 기록 중...")
+            if limit is not None and written >= limit:
+                break
+    finally:
+        for writer in writers:
+            writer.close()
+    
+    per_shard = written // len(paths)
+    print(f"제목 {written}개 기록 완료 (중복 {duplicates}개 제외), 파일 {len(paths)}개 (파일당 약 {per_shard}개)")
+    for path in paths:
+        print(f"- {path}")
+    return paths
+
+def create_posting_excel(titles: Optional[List[str]] = None, file_name: str = "posting.xlsx"):
+    """
+    포스팅용 엑셀 파일 생성
+    
+    Args:
+        titles (Optional[List[str]]): 기록할 제목 목록 (None이면 샘플 제목, 키워드엔진.py가 선별한 제목을 넘김)
+        file_name (str): 생성할 파일 이름
+    """
     try:
         print("블로그 포스팅용 엑셀 파일 생성 중...")
+        titles = list(titles) if titles is not None else SAMPLE_TITLES
         
         # 현재 작업 디렉토리 확인
         current_dir = os.getcwd()
-        file_path = os.path.join(current_dir, "posting.xlsx")
+        file_path = os.path.join(current_dir, file_name)
         print(f"파일 경로: {file_path}")
         
-        # 많은 사용자가 검색할 법한 블로그 포스팅 제목 샘플
-        popular_titles = [
-            "2024년 최신 부업 추천 - 집에서 월 100만원 벌기",
-            "다이어트 성공 후기 - 3개월 만에 10kg 감량한 비법",
-            "ChatGPT 활용법 완벽 가이드 - 업무 효율 200% 향상",
-            "부동산 투자 초보자를 위한 완벽 가이드",
-            "코딩 독학 로드맵 - 6개월 만에 개발자 되기"
-        ]
-        
-        # 엑셀 데이터 준비
-        data = {
-            "제목": ["제목"] + popular_titles,
-            "본문": ["본문"] + [""] * 5  # 본문은 빈칸으로 남김
-        }
-        
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-        
-        # 엑셀 파일로 저장 (헤더 없이 저장하여 A1부터 데이터가 들어가도록)
-        df.to_excel(file_path, index=False, header=False)
+        # A1: 제목, B1: 본문 헤더 아래에 제목을 한 행씩 기록 (본문은 빈칸으로 남김)
+        writer = StreamingExcelWriter(file_path)
+        for title in titles:
+            writer.write_row(title, None)
+        writer.close()
         
         print("엑셀 파일 생성 완료!")
         print("파일 내용:")
         print("- A1: 제목, B1: 본문")
-        print("- A2~A6: 인기 블로그 포스팅 제목 샘플")
-        print("- B2~B6: 빈칸 (본문 작성용)")
+        print(f"- A2~A{len(titles) + 1}: 블로그 포스팅 제목 {len(titles)}개")
+        print(f"- B2~B{len(titles) + 1}: 빈칸 (본문 작성용)")
         
         # 파일 생성 확인
         if os.path.exists(file_path):
@@ -52,5 +171,49 @@ def create_posting_excel():
     except Exception as e:
         print(f"엑셀 파일 생성 중 오류 발생: {e}")
 
+def main():
+    parser = argparse.ArgumentParser(description="블로그 포스팅용 엑셀 파일 생성")
+    parser.add_argument("--keywords", default=None,
+                        help="키워드도구 형식의 키워드 표 (CSV/Excel, 주면 샘플 대신 키워드엔진으로 제목 선별)")
+    parser.add_argument("--index", default=None, help="미리 만든 동시 출현 색인 (.npz)")
+    parser.add_argument("--pairs", default=None, help="(seed, relKeyword[, count]) 연관 키워드 쌍 CSV")
+    parser.add_argument("--seed", default=None, help="시드 키워드 (생략하면 표 전체에서 선별)")
+    parser.add_argument("--top", type=int, default=20, help="키워드 표에서 뽑을 제목 수 (기본값: 20)")
+    parser.add_argument("--output", default="posting.xlsx", help="생성할 파일 이름 (기본값: posting.xlsx)")
+    parser.add_argument("--generate", action="store_true",
+                        help="키워드 목록 × 제목 템플릿 조합으로 대량의 제목 시트 생성")
+    parser.add_argument("--keyword-list", default=None,
+                        help="--generate에 쓸 키워드 파일 (한 줄에 하나, 생략하면 --keywords 표에서 --top개 선별)")
+    parser.add_argument("--templates", default=None,
+                        help="제목 템플릿 파일 (한 줄에 하나, {keyword} {year} {season} {modifier} 사용)")
+    parser.add_argument("--years", type=int, nargs="+", default=None, help="연도 목록 (기본값: 올해)")
+    parser.add_argument("--seasons", nargs="+", default=DEFAULT_SEASONS, help="계절어 목록")
+    parser.add_argument("--modifiers", nargs="+", default=DEFAULT_MODIFIERS, help="수식어 목록")
+    parser.add_argument("--shards", type=int, default=1, help="작업자 수만큼 나눌 파일 수 (기본값: 1)")
+    parser.add_argument("--limit", type=int, default=None, help="생성할 최대 제목 수")
+    args = parser.parse_args()
+    
+    if args.generate:
+        if args.keyword_list:
+            keywords = read_lines(args.keyword_list)
+        elif args.keywords:
+            from 키워드엔진 import KeywordEngine
+            engine = KeywordEngine.from_files(args.keywords, args.index, args.pairs)
+            keywords = engine.get_recommended_keywords(args.seed, top_n=args.top)["keyword"]
+        else:
+            parser.error("--generate에는 --keyword-list 또는 --keywords가 필요합니다.")
+        templates = list(read_lines(args.templates)) if args.templates else DEFAULT_TEMPLATES
+        years = args.years or [datetime.date.today().year]
+        titles = iter_generated_titles(keywords, templates, years, args.seasons, args.modifiers)
+        generate_posting_sheets(titles, args.output, shards=args.shards, limit=args.limit)
+        return
+    
+    titles = None
+    if args.keywords:
+        from 키워드엔진 import KeywordEngine
+        engine = KeywordEngine.from_files(args.keywords, args.index, args.pairs)
+        titles = engine.select_titles(args.seed, top_n=args.top)
+    create_posting_excel(titles, args.output)
+
 if __name__ == "__main__":
-    create_posting_excel()
\ No newline at end of file
+    main()
@@ -0,0 +1,185 @@
+"""
+Gemini API 응답 디스크 캐시 (모델명 + 프롬프트 + 생성 설정의 해시를 키로 사용)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+
+def make_cache_key(model_name: str, prompt: str, generation_config: dict) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        model_name (str): 모델 이름
+        prompt (str): 전체 프롬프트
+        generation_config (dict): 생성 설정 (max_output_tokens, temperature 등)
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    payload = json.dumps(
+        {"model": model_name, "prompt": prompt, "config": generation_config},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path: str = ".gemini_cache.sqlite3", max_bytes: int = 200 * 1024 * 1024,
+                 ttl_seconds: Optional[float] = 30 * 24 * 3600, enabled: bool = True):
+        """
+        응답 캐시 초기화
+
+        Args:
+            path (str): SQLite 캐시 파일 경로
+            max_bytes (int): 캐시 최대 크기 (초과하면 가장 오래 사용하지 않은 항목부터 삭제)
+            ttl_seconds (Optional[float]): 항목 유효 기간(초), None이면 만료 없음
+            enabled (bool): False이면 캐시를 읽거나 쓰지 않음 (우회 모드)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = None
+        self.total_bytes = 0
+
+        if self.enabled:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+            self.conn.commit()
+            self.total_bytes = self.conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시에서 응답 조회
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Optional[str]: 캐시된 본문 (없거나 만료되었으면 None)
+        """
+        return self.get_any([key])
+
+    def get_any(self, keys: List[str]) -> Optional[str]:
+        """
+        여러 후보 키 중 앞에 있는 키부터 캐시된 응답 조회 (한 번의 조회로 적중/미적중을 한 번만 셈)
+
+        Args:
+            keys (List[str]): 우선순위 순서의 캐시 키 목록
+
+        Returns:
+            Optional[str]: 처음으로 찾은 캐시된 본문 (모두 없거나 만료되었으면 None)
+        """
+        if not self.enabled or not keys:
+            return None
+
+        now = time.time()
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT key, content, created_at FROM responses WHERE key IN ({', '.join('?' * len(keys))})",
+                list(keys),
+            ).fetchall()
+            found = {key: (content, created_at) for key, content, created_at in rows}
+
+            expired = False
+            for key in keys:
+                if key not in found:
+                    continue
+                content, created_at = found[key]
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.total_bytes -= len(content.encode("utf-8"))
+                    expired = True
+                    continue
+
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+                self.hits += 1
+                return content
+
+            if expired:
+                self.conn.commit()
+            self.misses += 1
+            return None
+
+    def put(self, key: str, content: str):
+        """
+        응답을 캐시에 저장하고 용량 초과 시 LRU 삭제
+
+        Args:
+            key (str): 캐시 키
+            content (str): 생성된 본문
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self.total_bytes -= old[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, content, size, now, now),
+            )
+            self.total_bytes += size
+            self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """최대 크기를 넘지 않도록 가장 오래 사용하지 않은 항목 삭제 (lock 안에서 호출)"""
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        cursor = self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC")
+        evicted_keys = []
+        for key, size in cursor:
+            if self.total_bytes <= self.max_bytes:
+                break
+            evicted_keys.append((key,))
+            self.total_bytes -= size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+
+    def stats(self) -> str:
+        """
+        캐시 적중/미적중 통계 문자열
+
+        Returns:
+            str: 요약 문자열
+        """
+        if not self.enabled:
+            return "캐시 사용 안 함"
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return f"적중 {self.hits}회 / 미적중 {self.misses}회 (적중률 {rate:.1f}%)"
+
+    def close(self):
+        """캐시 연결 닫기"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
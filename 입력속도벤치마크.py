@@ -0,0 +1,89 @@
+"""
+텍스트 입력 방식별(insert, paste, human) 입력 시간 비교 벤치마크
+
+네이버에 접속하지 않고 로컬 contenteditable 페이지에 AI 본문 분량(약 1,500자)을
+입력하여 방식별 소요 시간을 측정합니다.
+
+사용법:
+    python 입력속도벤치마크.py
+    python 입력속도벤치마크.py --modes insert paste --chars 3000
+"""
+
+import argparse
+import time
+import urllib.parse
+
+from selenium.webdriver.common.by import By
+
+from 블로그글쓰기자동화 import TYPING_MODES, NaverBlogAutomate
+
+EDITOR_PAGE = "data:text/html;charset=utf-8," + urllib.parse.quote(
+    "<html><body><div id='editor' contenteditable='true' "
+    "style='min-height:300px;border:1px solid #ccc'></div></body></html>"
+)
+
+
+def make_sample_text(chars: int) -> str:
+    """문단 단위로 줄바꿈된 합성 본문 생성"""
+    sentence = "블로그 본문 입력 속도를 측정하기 위한 예시 문장입니다. "
+    paragraph = sentence * 2
+    lines = []
+    while sum(len(line) + 1 for line in lines) < chars:
+        lines.append(paragraph.strip())
+    return "\n".join(lines)[:chars]
+
+
+def measure(automate: NaverBlogAutomate, mode: str, text: str) -> float:
+    """
+    지정한 입력 방식으로 본문 입력 시간 측정
+
+    Args:
+        automate (NaverBlogAutomate): 브라우저가 열린 자동화 객체
+        mode (str): 입력 방식
+        text (str): 입력할 텍스트
+
+    Returns:
+        float: 소요 시간(초)
+    """
+    automate.typing_mode = mode
+    automate.driver.get(EDITOR_PAGE)
+    automate.driver.find_element(By.ID, "editor").click()
+
+    started = time.perf_counter()
+    automate.type_lines(text)
+    elapsed = time.perf_counter() - started
+
+    typed = automate.driver.find_element(By.ID, "editor").text
+    if len(typed.replace("\n", "")) < len(text.replace("\n", "")) * 0.9:
+        print(f"경고: {mode} 방식 입력 결과가 원문보다 짧습니다 ({len(typed)}자)")
+
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="텍스트 입력 방식 벤치마크")
+    parser.add_argument("--modes", nargs="+", choices=TYPING_MODES, default=list(TYPING_MODES),
+                        help="비교할 입력 방식 (기본값: 전체)")
+    parser.add_argument("--chars", type=int, default=1500, help="입력할 글자 수 (기본값: 1500)")
+    args = parser.parse_args()
+
+    text = make_sample_text(args.chars)
+    automate = NaverBlogAutomate()
+
+    try:
+        results = []
+        for mode in args.modes:
+            print(f"{mode} 방식 측정 중...")
+            results.append((mode, measure(automate, mode, text)))
+
+        print(f"\n{len(text)}자 입력 결과")
+        print(f"{'입력 방식':<8} | {'소요 시간':>9} | {'초당 글자':>9}")
+        print("-" * 34)
+        for mode, elapsed in results:
+            print(f"{mode:<8} | {elapsed:>8.2f}s | {len(text) / elapsed:>9.0f}")
+    finally:
+        automate.quit()
+
+
+if __name__ == "__main__":
+    main()
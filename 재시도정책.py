@@ -0,0 +1,254 @@
+"""
+Gemini API 오류 분류, 지터를 넣은 지수 백오프 재시도, AIMD 방식 동시 실행 수 조절
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+from google.api_core import exceptions as api_exceptions
+from google.generativeai.types import BlockedPromptException, StopCandidateException
+
+# 오류 종류
+ERROR_QUOTA = "quota"          # 429, 할당량 초과: 동시 실행 수를 줄이고 기다렸다가 재시도
+ERROR_TRANSIENT = "transient"  # 5xx, 타임아웃, 연결 끊김: 기다렸다가 재시도
+ERROR_SAFETY = "safety"        # 안전 필터 차단: 같은 프롬프트로는 다시 시도해도 소용없음
+ERROR_FATAL = "fatal"          # 잘못된 요청, 인증 오류 등: 재시도하지 않음
+
+RETRYABLE_ERRORS = (ERROR_QUOTA, ERROR_TRANSIENT)
+
+TRANSIENT_STATUS_CODES = {408, 500, 502, 503, 504}
+
+# "Please retry in 37.5s", "retry_delay { seconds: 37 }" 형태의 대기 시간 힌트
+RETRY_HINT_PATTERNS = [
+    re.compile(r"retry in ([\d.]+)\s*s", re.IGNORECASE),
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE),
+    re.compile(r"retry-after:?\s*([\d.]+)", re.IGNORECASE),
+]
+
+T = TypeVar("T")
+
+
+class SafetyBlockedError(Exception):
+    """응답이 안전 필터에 막혀 본문이 없을 때 발생하는 예외"""
+
+
+def classify_error(error: Exception) -> str:
+    """
+    예외를 재시도 정책에 맞는 종류로 분류
+
+    Args:
+        error (Exception): API 호출 중 발생한 예외
+
+    Returns:
+        str: quota, transient, safety, fatal 중 하나
+    """
+    if isinstance(error, (SafetyBlockedError, BlockedPromptException, StopCandidateException)):
+        return ERROR_SAFETY
+
+    if isinstance(error, (api_exceptions.ResourceExhausted, api_exceptions.TooManyRequests)):
+        return ERROR_QUOTA
+
+    if isinstance(error, api_exceptions.GoogleAPICallError):
+        code = int(error.code) if error.code is not None else None
+        if code == 429:
+            return ERROR_QUOTA
+        if code in TRANSIENT_STATUS_CODES or isinstance(error, api_exceptions.RetryError):
+            return ERROR_TRANSIENT
+        return ERROR_FATAL
+
+    if isinstance(error, (ConnectionError, TimeoutError, api_exceptions.RetryError)):
+        return ERROR_TRANSIENT
+
+    # response.text 접근 시 후보가 차단되어 있으면 ValueError가 발생함
+    message = str(error)
+    if isinstance(error, ValueError) and ("SAFETY" in message or "block" in message.lower()):
+        return ERROR_SAFETY
+
+    return ERROR_FATAL
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    오류에 포함된 재시도 대기 시간 힌트 읽기
+
+    Args:
+        error (Exception): API 호출 중 발생한 예외
+
+    Returns:
+        Optional[float]: 서버가 알려준 대기 시간(초), 없으면 None
+    """
+    for detail in getattr(error, "details", None) or []:
+        delay = getattr(detail, "retry_delay", None)
+        if delay is not None and (delay.seconds or delay.nanos):
+            return delay.seconds + delay.nanos / 1e9
+
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    if headers.get("retry-after"):
+        try:
+            return float(headers["retry-after"])
+        except ValueError:
+            pass
+
+    message = str(error)
+    for pattern in RETRY_HINT_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class AdaptiveConcurrency:
+    def __init__(self, max_limit: int, min_limit: int = 1, decrease_cooldown: float = 5.0):
+        """
+        AIMD 방식 동시 실행 수 제한기 초기화
+
+        성공이 현재 한도만큼 쌓이면 한도를 1 늘리고, 할당량 오류가 나면 절반으로 줄입니다.
+        한꺼번에 들어온 429 응답들이 한도를 연속으로 깎지 않도록 줄인 뒤 잠시 동안은
+        다시 줄이지 않습니다.
+
+        Args:
+            max_limit (int): 최대 동시 실행 수 (스레드 풀 크기)
+            min_limit (int): 최소 동시 실행 수
+            decrease_cooldown (float): 한도를 줄인 뒤 다시 줄이지 않을 시간(초)
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """실행 슬롯이 빌 때까지 대기 후 점유"""
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        """실행 슬롯 반납"""
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify()
+
+    def on_success(self):
+        """성공 기록 (가법 증가)"""
+        with self.condition:
+            self.successes += 1
+            if self.successes >= self.limit and self.limit < self.max_limit:
+                self.limit += 1
+                self.successes = 0
+                self.condition.notify()
+
+    def on_quota_error(self):
+        """할당량 오류 기록 (승법 감소)"""
+        with self.condition:
+            now = time.monotonic()
+            if now - self.last_decrease < self.decrease_cooldown:
+                return
+            self.last_decrease = now
+            self.successes = 0
+            new_limit = max(self.min_limit, self.limit // 2)
+            if new_limit < self.limit:
+                print(f"할당량 초과: 동시 실행 수를 {self.limit}개에서 {new_limit}개로 줄입니다.")
+            self.limit = new_limit
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0,
+                 concurrency: Optional[AdaptiveConcurrency] = None):
+        """
+        재시도 정책 초기화
+
+        Args:
+            max_attempts (int): 첫 시도를 포함한 최대 시도 횟수
+            base_delay (float): 첫 재시도 대기 시간의 상한(초), 시도마다 2배씩 늘어남
+            max_delay (float): 대기 시간 상한(초)
+            concurrency (Optional[AdaptiveConcurrency]): 할당량 오류를 반영할 동시 실행 수 제한기
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency = concurrency
+
+        # 오류 종류별 발생 횟수 (재시도로 복구된 것 포함)
+        self.lock = threading.Lock()
+        self.error_counts: Dict[str, int] = {}
+        self.retries = 0
+
+    def backoff(self, attempt: int, hint: Optional[float] = None) -> float:
+        """
+        재시도 전 대기 시간 계산 (full jitter 지수 백오프, 서버 힌트가 더 길면 힌트 사용)
+
+        Args:
+            attempt (int): 지금까지 실패한 횟수 (1부터)
+            hint (Optional[float]): 서버가 알려준 대기 시간(초)
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if hint is not None:
+            delay = max(delay, min(hint, self.max_delay) + random.uniform(0, self.base_delay))
+        return delay
+
+    def call(self, func: Callable[[], T], label: str = "") -> T:
+        """
+        분류된 오류에 따라 재시도하며 함수 실행
+
+        할당량/일시적 오류만 재시도하고 안전 차단/치명적 오류는 바로 다시 발생시킵니다.
+        마지막 시도까지 실패하면 마지막 예외를 그대로 발생시킵니다.
+
+        Args:
+            func (Callable[[], T]): 실행할 함수 (API 호출 1회)
+            label (str): 재시도 메시지에 표시할 이름
+
+        Returns:
+            T: 함수 반환값
+        """
+        attempt = 0
+        while True:
+            if self.concurrency is not None:
+                self.concurrency.acquire()
+            try:
+                result = func()
+            except Exception as e:
+                kind = classify_error(e)
+                with self.lock:
+                    self.error_counts[kind] = self.error_counts.get(kind, 0) + 1
+                if kind == ERROR_QUOTA and self.concurrency is not None:
+                    self.concurrency.on_quota_error()
+
+                attempt += 1
+                if kind not in RETRYABLE_ERRORS or attempt >= self.max_attempts:
+                    raise
+
+                delay = self.backoff(attempt, retry_after_seconds(e))
+                with self.lock:
+                    self.retries += 1
+                print(f"{label} {kind} 오류, {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts - 1}): {e}")
+            else:
+                if self.concurrency is not None:
+                    self.concurrency.on_success()
+                return result
+            finally:
+                if self.concurrency is not None:
+                    self.concurrency.release()
+
+            time.sleep(delay)
+
+    def stats(self) -> str:
+        """오류 종류별 횟수와 재시도 횟수 요약 문자열"""
+        with self.lock:
+            if not self.error_counts:
+                return "오류 없음"
+            counts = ", ".join(f"{kind} {count}회" for kind, count in self.error_counts.items())
+            limit = f", 현재 동시 실행 한도 {self.concurrency.limit}개" if self.concurrency else ""
+            return f"{counts} (재시도 {self.retries}회{limit})"
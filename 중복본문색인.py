@@ -0,0 +1,273 @@
+"""
+생성된 본문끼리 거의 같은 글을 찾는 MinHash/LSH 색인
+
+본문을 글자 5-gram 집합으로 보고 MinHash 서명을 만든 뒤, 서명을 밴드로 나눠 같은 버킷에
+들어간 글만 후보로 비교합니다(LSH). 색인은 SQLite에 저장되므로 지난 실행에서 만든
+본문과도 비교되며, 글이 수십만 개로 늘어나도 조회는 밴드 수만큼의 색인 조회로 끝납니다.
+
+사용법 (시트 안에서 서로 비슷한 본문 찾기):
+    python 중복본문색인.py --excel posting.xlsx --threshold 0.8
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 해시 계산에 쓰는 메르센 소수 (a * h + b가 uint64를 넘지 않도록 31비트 사용)
+MERSENNE_PRIME = (1 << 31) - 1
+SHINGLE_BASE = 1000003
+
+# 비교 전에 지우는 공백/문장부호 (띄어쓰기만 다른 글도 같은 글로 봄)
+NORMALIZE_PATTERN = re.compile(r"[\s\W_]+")
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    유사도 기준에 맞는 밴드 수와 밴드당 행 수 선택
+
+    같은 버킷에 들어갈 확률이 50%가 되는 유사도 (1/b)^(1/r)가 기준보다 조금 낮도록 골라
+    기준을 넘는 글을 놓치지 않게 합니다 (후보는 서명 비교로 다시 거름).
+
+    Args:
+        num_perm (int): MinHash 서명 길이
+        threshold (float): 중복으로 볼 유사도 기준 (0~1)
+
+    Returns:
+        Tuple[int, int]: (밴드 수, 밴드당 행 수)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold * 0.9:
+            best = (bands, rows)
+    return best
+
+
+class DuplicateIndex:
+    def __init__(self, path: str = ".body_index.sqlite3", threshold: float = 0.8,
+                 num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        중복 본문 색인 초기화
+
+        Args:
+            path (str): SQLite 색인 파일 경로 (":memory:"이면 이번 실행에서만 사용)
+            threshold (float): 중복으로 볼 추정 자카드 유사도 (0~1)
+            num_perm (int): MinHash 서명 길이 (길수록 정확하지만 느림)
+            shingle_size (int): 글자 n-gram 길이
+            seed (int): 해시 함수 시드 (색인 파일을 만든 뒤에는 바꾸지 않음)
+        """
+        self.path = path
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(num_perm, threshold)
+
+        generator = np.random.RandomState(seed)
+        self.perm_a = generator.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.perm_b = generator.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+        self.checks = 0
+        self.duplicates = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                UNIQUE (title, content_hash)
+            )
+            """
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (band INTEGER NOT NULL, bucket INTEGER NOT NULL, "
+            "doc_id INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bucket ON buckets (band, bucket)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._check_settings()
+        self.conn.commit()
+
+    def _check_settings(self):
+        """기존 색인 파일이 같은 서명 설정으로 만들어졌는지 확인"""
+        settings = f"{self.num_perm}/{self.bands}x{self.rows}/{self.shingle_size}"
+        row = self.conn.execute("SELECT value FROM settings WHERE name = 'signature'").fetchone()
+        if row is None:
+            self.conn.execute("INSERT INTO settings (name, value) VALUES ('signature', ?)", (settings,))
+        elif row[0] != settings:
+            raise ValueError(f"색인 파일 {self.path}의 서명 설정({row[0]})이 현재 설정({settings})과 다릅니다. "
+                             "다른 파일을 지정하거나 기존 파일을 지우세요.")
+
+    def shingles(self, text: str) -> np.ndarray:
+        """
+        정규화한 본문의 글자 n-gram 해시 (중복 제거)
+
+        Args:
+            text (str): 본문
+
+        Returns:
+            np.ndarray: n-gram 해시 배열 (uint64, 32비트 값)
+        """
+        normalized = NORMALIZE_PATTERN.sub(" ", text.lower()).strip()
+        codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        if len(codes) < self.shingle_size:
+            codes = np.pad(codes, (0, self.shingle_size - len(codes)))
+
+        # 다항식 해시를 n-gram 위치 전체에 한 번에 계산
+        count = len(codes) - self.shingle_size + 1
+        hashes = np.zeros(count, dtype=np.uint64)
+        for offset in range(self.shingle_size):
+            hashes = (hashes * SHINGLE_BASE + codes[offset:offset + count]) & 0xFFFFFFFF
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        본문의 MinHash 서명
+
+        Args:
+            text (str): 본문
+
+        Returns:
+            np.ndarray: 길이 num_perm의 서명 (uint32)
+        """
+        hashes = self.shingles(text)
+        permuted = (self.perm_a[:, None] * hashes[None, :] + self.perm_b[:, None]) % MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def band_buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        """서명을 밴드로 나눈 (밴드 번호, 버킷 해시) 목록"""
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            bucket = int.from_bytes(hashlib.blake2b(chunk, digest_size=8).digest(), "big", signed=True)
+            buckets.append((band, bucket))
+        return buckets
+
+    def find_similar(self, title: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+        색인에서 본문과 가장 비슷한 다른 제목의 글 찾기
+
+        같은 제목의 글(이전 실행에서 만든 같은 글, 캐시에서 다시 읽은 글)은 비교하지 않습니다.
+
+        Args:
+            title (str): 글 제목
+            text (str): 본문
+
+        Returns:
+            Optional[Tuple[str, float]]: 기준을 넘는 가장 비슷한 글의 (제목, 추정 유사도), 없으면 None
+        """
+        signature = self.signature(text)
+        with self.lock:
+            self.checks += 1
+            candidate_ids = set()
+            for band, bucket in self.band_buckets(signature):
+                rows = self.conn.execute(
+                    "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?", (band, bucket)
+                ).fetchall()
+                candidate_ids.update(doc_id for (doc_id,) in rows)
+            if not candidate_ids:
+                return None
+
+            placeholders = ",".join("?" * len(candidate_ids))
+            candidates = self.conn.execute(
+                f"SELECT title, signature FROM documents WHERE id IN ({placeholders}) AND title != ?",
+                (*candidate_ids, title),
+            ).fetchall()
+
+        best = None
+        for other_title, blob in candidates:
+            similarity = float(np.mean(np.frombuffer(blob, dtype=np.uint32) == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (other_title, similarity)
+
+        if best is not None:
+            with self.lock:
+                self.duplicates += 1
+        return best
+
+    def add(self, title: str, text: str):
+        """
+        본문을 색인에 추가 (같은 제목·같은 본문은 한 번만 저장)
+
+        Args:
+            title (str): 글 제목
+            text (str): 본문
+        """
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        signature = self.signature(text)
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO documents (title, content_hash, signature, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (title, content_hash, signature.tobytes(), time.time()),
+            )
+            if cursor.rowcount:
+                self.conn.executemany(
+                    "INSERT INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                    [(band, bucket, cursor.lastrowid) for band, bucket in self.band_buckets(signature)],
+                )
+            self.conn.commit()
+
+    def size(self) -> int:
+        """색인된 글 수"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def stats(self) -> str:
+        """
+        중복 검사 통계 문자열
+
+        Returns:
+            str: 요약 문자열
+        """
+        return (f"검사 {self.checks}회 / 중복 {self.duplicates}회 "
+                f"(기준 유사도 {self.threshold}, 색인된 글 {self.size()}개)")
+
+    def close(self):
+        """색인 연결 닫기"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def main():
+    from 엑셀스트리밍 import StreamingExcelReader
+
+    parser = argparse.ArgumentParser(description="시트 안에서 서로 비슷한 본문 찾기")
+    parser.add_argument("--excel", default="posting.xlsx", help="제목/본문 Excel 파일 (기본값: posting.xlsx)")
+    parser.add_argument("--threshold", type=float, default=0.8, help="중복으로 볼 유사도 (기본값: 0.8)")
+    parser.add_argument("--index", default=":memory:",
+                        help="지난 실행의 본문과도 비교하려면 색인 파일 지정 (기본값: 시트 안에서만 비교)")
+    args = parser.parse_args()
+
+    index = DuplicateIndex(args.index, threshold=args.threshold)
+    flagged = 0
+    started = time.perf_counter()
+    try:
+        for row_number, title, body in StreamingExcelReader(args.excel).iter_rows():
+            if not title or body is None or str(body).strip() == "":
+                continue
+            match = index.find_similar(str(title), str(body))
+            if match is not None:
+                flagged += 1
+                print(f"{row_number}행 '{title}' ≈ '{match[0]}' (유사도 {match[1]:.2f})")
+            index.add(str(title), str(body))
+        elapsed = time.perf_counter() - started
+        print(f"\n중복 의심 본문: {flagged}개, {index.stats()}, 소요 시간 {elapsed:.1f}초")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
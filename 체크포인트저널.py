@@ -0,0 +1,119 @@
+"""
+블로그 본문 생성 결과를 행 단위로 기록하는 체크포인트 저널 (추가 전용 JSONL)
+"""
+
+import json
+import os
+import threading
+from typing import Dict
+
+
+class CheckpointJournal:
+    def __init__(self, path: str):
+        """
+        체크포인트 저널 초기화
+
+        Args:
+            path (str): 저널 파일 경로 (예: posting.xlsx.journal.jsonl)
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = None
+
+    def load(self) -> Dict[int, dict]:
+        """
+        저널에 기록된 완료 행 읽기
+
+        마지막 줄이 기록 도중 중단되어 깨져 있으면 그 줄만 무시합니다.
+
+        Returns:
+            Dict[int, dict]: DataFrame 인덱스별 기록 ({"index", "row", "title", "content"})
+        """
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    print(f"저널의 손상된 줄을 건너뜁니다: {line[:50]}")
+                    continue
+                entries[entry["index"]] = entry
+
+        return entries
+
+    def index_offsets(self) -> Dict[int, int]:
+        """
+        본문은 읽지 않고 DataFrame 인덱스별 기록 위치(바이트 오프셋)만 수집
+
+        대용량 시트에서 본문 전체를 메모리에 올리지 않기 위해 사용합니다.
+
+        Returns:
+            Dict[int, int]: DataFrame 인덱스별 마지막 기록의 파일 오프셋
+        """
+        offsets = {}
+        if not os.path.exists(self.path):
+            return offsets
+
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                # 본문 앞에 있는 index 필드만 확인
+                if line.startswith(b'{"index": ') and line.endswith(b"}\n"):
+                    index = int(line[10:line.index(b",")])
+                    offsets[index] = offset
+                offset += len(line)
+
+        return offsets
+
+    def read_entry(self, offset: int) -> dict:
+        """
+        지정한 오프셋의 기록 1건 읽기
+
+        Args:
+            offset (int): index_offsets()가 돌려준 파일 오프셋
+
+        Returns:
+            dict: 기록 ({"index", "row", "title", "content"})
+        """
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline().decode("utf-8"))
+
+    def open(self, reset: bool = False):
+        """
+        저널 파일을 추가 모드로 열기
+
+        Args:
+            reset (bool): True이면 기존 기록을 지우고 새로 시작
+        """
+        mode = "w" if reset else "a"
+        self.file = open(self.path, mode, encoding="utf-8")
+
+    def append(self, index: int, title: str, content: str, **fields):
+        """
+        완료된 행 1건을 기록하고 즉시 디스크에 반영
+
+        Args:
+            index (int): DataFrame 인덱스
+            title (str): 블로그 제목
+            content (str): 생성된 본문
+            **fields: 함께 기록할 값
+        """
+        entry = {"index": index, "row": index + 2, "title": title, "content": content, **fields}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        """저널 파일 닫기"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
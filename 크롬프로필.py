@@ -0,0 +1,237 @@
+"""
+Chrome 실행 프로필 (일반 창 / 포스팅 작업용 헤드리스) 및 브라우저 메모리 측정
+"""
+
+import os
+import threading
+from typing import Optional
+
+from selenium import webdriver
+
+# default: 창이 보이는 일반 브라우저, worker: 리소스를 줄인 헤드리스 작업용 브라우저
+BROWSER_PROFILES = ("default", "worker")
+
+# worker 프로필에서 요청 자체를 막을 리소스 (이미지, 미디어, 폰트, 분석/광고 스크립트)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*lcs.naver.com*", "*wcs.naver.net*", "*nlog.naver.com*", "*veta.naver.com*",
+    "*siape.veta.naver.com*", "*tivan.naver.com*",
+]
+
+# worker 프로필 디스크 캐시 위치 (실행이 바뀌어도 같은 자리를 다시 사용)
+DEFAULT_CACHE_ROOT = ".chrome_cache"
+DISK_CACHE_SIZE = 200 * 1024 * 1024
+
+HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# 동시에 실행 중인 브라우저가 쓰고 있는 캐시 자리 번호
+_cache_slots_in_use = set()
+_cache_slots_lock = threading.Lock()
+
+
+def acquire_cache_slot() -> int:
+    """비어 있는 가장 작은 캐시 자리 번호 예약"""
+    with _cache_slots_lock:
+        slot = 0
+        while slot in _cache_slots_in_use:
+            slot += 1
+        _cache_slots_in_use.add(slot)
+        return slot
+
+
+def release_cache_slot(slot: Optional[int]):
+    """브라우저 종료 후 캐시 자리 반납"""
+    if slot is None:
+        return
+    with _cache_slots_lock:
+        _cache_slots_in_use.discard(slot)
+
+
+def build_chrome_options(profile: str = "default", cache_dir: Optional[str] = None) -> webdriver.ChromeOptions:
+    """
+    프로필에 맞는 Chrome 옵션 생성
+
+    Args:
+        profile (str): 브라우저 프로필 (default, worker)
+        cache_dir (Optional[str]): worker 프로필의 디스크 캐시 디렉터리
+
+    Returns:
+        webdriver.ChromeOptions: Chrome 옵션
+    """
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"지원하지 않는 브라우저 프로필입니다: {profile} (가능: {', '.join(BROWSER_PROFILES)})")
+
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if profile == "worker":
+        # 화면 없이 실행하되 에디터 레이아웃이 데스크톱 기준으로 그려지도록 창 크기 지정
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1280,900")
+
+        # GPU, 확장 프로그램, 백그라운드 작업 끄기
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-software-rasterizer")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--mute-audio")
+
+        # 브라우저 하나가 쓰는 메모리 상한
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--renderer-process-limit=2")
+        chrome_options.add_argument("--js-flags=--max-old-space-size=512")
+
+        # 이미지는 요청 차단과 별개로 렌더링 단계에서도 끄기
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+
+        if cache_dir:
+            chrome_options.add_argument(f"--disk-cache-dir={os.path.abspath(cache_dir)}")
+            chrome_options.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
+
+    return chrome_options
+
+
+def enable_asset_blocking(driver):
+    """
+    CDP로 이미지/미디어/폰트/분석 스크립트 요청 차단
+
+    Args:
+        driver: Chrome WebDriver
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+def create_chrome_driver(profile: str = "default", cache_root: str = DEFAULT_CACHE_ROOT):
+    """
+    프로필에 맞게 설정된 Chrome WebDriver 실행
+
+    worker 프로필은 동시에 실행 중인 브라우저끼리 캐시 디렉터리가 겹치지 않도록
+    캐시 자리 번호를 예약하며, 반환된 driver의 cache_slot 속성에 기록합니다.
+    종료할 때는 release_cache_slot(driver.cache_slot)으로 반납합니다.
+
+    Args:
+        profile (str): 브라우저 프로필 (default, worker)
+        cache_root (str): worker 프로필의 디스크 캐시 상위 디렉터리
+
+    Returns:
+        Chrome WebDriver
+    """
+    slot = None
+    cache_dir = None
+    if profile == "worker":
+        slot = acquire_cache_slot()
+        cache_dir = os.path.join(cache_root, f"worker-{slot}")
+        os.makedirs(cache_dir, exist_ok=True)
+
+    try:
+        driver = webdriver.Chrome(options=build_chrome_options(profile, cache_dir))
+    except Exception:
+        release_cache_slot(slot)
+        raise
+
+    driver.cache_slot = slot
+    driver.execute_script(HIDE_WEBDRIVER_SCRIPT)
+
+    if profile == "worker":
+        try:
+            enable_asset_blocking(driver)
+            # 헤드리스 표시가 들어간 User-Agent는 차단될 수 있으므로 일반 Chrome처럼 보이게 함
+            user_agent = driver.execute_script("return navigator.userAgent;")
+            driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+                "userAgent": user_agent.replace("HeadlessChrome", "Chrome")
+            })
+        except Exception:
+            driver.quit()
+            release_cache_slot(slot)
+            raise
+
+    return driver
+
+
+def _read_process_memory(pid: int) -> int:
+    """
+    프로세스 메모리 (PSS, 없으면 RSS) 바이트 단위로 읽기
+
+    PSS는 여러 Chrome 프로세스가 공유하는 메모리를 나눠서 계산하므로 합계가
+    실제 사용량에 가깝습니다.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def _child_pids(pid: int) -> list:
+    """/proc에서 직계 자식 프로세스 목록 읽기"""
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", "r") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def measure_browser_memory(driver) -> Optional[int]:
+    """
+    chromedriver와 그 아래 모든 Chrome 프로세스의 메모리 합계 측정 (Linux 전용)
+
+    Args:
+        driver: Chrome WebDriver
+
+    Returns:
+        Optional[int]: 메모리 사용량(바이트), 측정할 수 없으면 None
+    """
+    if not os.path.exists("/proc/self/status"):
+        return None
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        total += _read_process_memory(pid)
+        pending.extend(_child_pids(pid))
+    return total
+
+
+def available_memory() -> Optional[int]:
+    """
+    새 프로세스가 쓸 수 있는 시스템 메모리 (/proc/meminfo의 MemAvailable)
+
+    Returns:
+        Optional[int]: 사용 가능한 메모리(바이트), 측정할 수 없으면 None
+    """
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
@@ -0,0 +1,485 @@
+"""
+키워드추출로직.md의 추천/연관/상위노출 가능 키워드 선별 로직을 오프라인 키워드 표로 계산하는 엔진
+
+네이버 검색광고 키워드도구 응답 형식(relKeyword, monthlyPcQcCnt, ...)으로 저장한 CSV/Excel 표를
+pandas 열로 읽어 한 번에(벡터 연산으로) 점수를 매깁니다. 2차 연관 키워드 확장은 미리 만들어 둔
+동시 출현 색인(키워드별 연관 키워드 목록을 CSR 배열로 저장)으로 계산합니다.
+
+사용법:
+    python 키워드엔진.py --keywords keywords.csv --pairs related_pairs.csv --build-index cooccurrence.npz
+    python 키워드엔진.py --keywords keywords.csv --index cooccurrence.npz --seed "카페 창업" --top 5
+"""
+
+import argparse
+import datetime
+import os
+import re
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 키워드도구 응답 필드 → 엔진에서 쓰는 열 이름 (SERP 분석 열은 직접 수집한 경우에만 있음)
+COLUMN_NAMES = {
+    "relKeyword": "keyword",
+    "monthlyPcQcCnt": "pc_volume",
+    "monthlyMobileQcCnt": "mobile_volume",
+    "monthlyAvePcClkCnt": "pc_clicks",
+    "monthlyAveMobileClkCnt": "mobile_clicks",
+    "monthlyAvePcCtr": "pc_ctr",
+    "monthlyAveMobileCtr": "mobile_ctr",
+    "compIdx": "comp_idx",
+    "competingPages": "competing_pages",
+    "domainAuthority": "domain_authority",
+    "contentLength": "content_length",
+    "backlinks": "backlinks",
+}
+
+# 경쟁 정도 → 단계 (경쟁도역수 = 1 / 단계)
+COMPETITION_LEVELS = {"낮음": 1, "중간": 2, "높음": 3}
+
+# 키워드 의도 분류 (연관 키워드 카테고리)
+CATEGORY_INFO = "정보성"
+CATEGORY_PURCHASE = "구매의도"
+CATEGORY_BRAND = "브랜드"
+CATEGORY_OTHER = "기타"
+INFO_PATTERN = r"(?:란|이란|방법|하는법|하는 법|뜻|이유|효과|차이|종류|원리)$|방법"
+PURCHASE_PATTERN = r"가격|추천|비교|후기|구매|할인|순위|비용|견적|최저가"
+
+# 카테고리별 제목 템플릿
+TITLE_TEMPLATES = {
+    CATEGORY_INFO: "{keyword} 완벽 정리 - 처음이라면 꼭 알아야 할 핵심",
+    CATEGORY_PURCHASE: "{keyword} 솔직 비교 - 실제 후기로 골라본 추천",
+    CATEGORY_BRAND: "{keyword} 장단점 총정리 - 사기 전에 확인하세요",
+    CATEGORY_OTHER: "{year}년 {keyword} 가이드 - 최신 정보 한눈에 보기",
+}
+
+
+def to_number(column: pd.Series) -> np.ndarray:
+    """
+    키워드도구 값을 숫자 배열로 변환 ("< 10" 같은 문자열은 5로 봄)
+
+    Args:
+        column (pd.Series): 원본 열
+
+    Returns:
+        np.ndarray: float64 배열 (읽을 수 없는 값은 0)
+    """
+    if column.dtype == object:
+        column = column.astype(str).str.replace(",", "", regex=False).str.strip()
+        column = column.mask(column.str.startswith("<"), "5")
+    return pd.to_numeric(column, errors="coerce").fillna(0).to_numpy(dtype=np.float64)
+
+
+def normalize(values: np.ndarray) -> np.ndarray:
+    """최솟값 0, 최댓값 1로 정규화 (값이 모두 같으면 0)"""
+    if len(values) == 0:
+        return values
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros_like(values, dtype=np.float64)
+    return (values - low) / (high - low)
+
+
+def load_keyword_table(path: str) -> pd.DataFrame:
+    """
+    키워드도구 응답 형식의 CSV/Excel 표 읽기
+
+    Args:
+        path (str): .csv 또는 .xlsx 파일 경로
+
+    Returns:
+        pd.DataFrame: 엔진 열 이름으로 바꾼 표
+    """
+    if path.endswith(".csv"):
+        table = pd.read_csv(path)
+    else:
+        table = pd.read_excel(path)
+    return table.rename(columns=COLUMN_NAMES)
+
+
+class CooccurrenceIndex:
+    def __init__(self, offsets: np.ndarray, targets: np.ndarray, weights: np.ndarray):
+        """
+        키워드 번호별 연관 키워드 목록 (CSR 형식)
+
+        키워드 i의 연관 키워드는 targets[offsets[i]:offsets[i + 1]], 동시 출현 횟수는 같은
+        구간의 weights입니다. 키워드 번호는 키워드 표의 행 순서와 같습니다.
+
+        Args:
+            offsets (np.ndarray): 길이 (키워드 수 + 1)의 구간 시작 위치
+            targets (np.ndarray): 연관 키워드 번호
+            weights (np.ndarray): 동시 출현 횟수
+        """
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def build(cls, keywords: pd.Index, sources: Sequence[str], related: Sequence[str],
+              counts: Optional[Sequence[float]] = None) -> "CooccurrenceIndex":
+        """
+        (시드 키워드, 연관 키워드) 쌍 목록으로 색인 생성 (양방향, 같은 쌍은 횟수 합산)
+
+        Args:
+            keywords (pd.Index): 키워드 표의 키워드 열 (번호 = 위치)
+            sources (Sequence[str]): 시드 키워드 목록
+            related (Sequence[str]): 시드마다 함께 조회된 연관 키워드 목록
+            counts (Optional[Sequence[float]]): 쌍별 동시 출현 횟수 (None이면 1)
+
+        Returns:
+            CooccurrenceIndex: 생성된 색인
+        """
+        size = len(keywords)
+        src = keywords.get_indexer(pd.Index(sources))
+        dst = keywords.get_indexer(pd.Index(related))
+        weight = np.ones(len(src)) if counts is None else np.asarray(counts, dtype=np.float64)
+
+        # 표에 없는 키워드와 자기 자신을 가리키는 쌍은 제외
+        valid = (src >= 0) & (dst >= 0) & (src != dst)
+        src, dst, weight = src[valid], dst[valid], weight[valid]
+        src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+        weight = np.concatenate([weight, weight])
+
+        pair_keys, inverse = np.unique(src.astype(np.int64) * size + dst, return_inverse=True)
+        summed = np.bincount(inverse, weights=weight)
+        pair_src = pair_keys // size
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_src, minlength=size), out=offsets[1:])
+        return cls(offsets, (pair_keys % size).astype(np.int64), summed)
+
+    @classmethod
+    def load(cls, path: str) -> "CooccurrenceIndex":
+        """np.savez로 저장한 색인 읽기"""
+        data = np.load(path)
+        return cls(data["offsets"], data["targets"], data["weights"])
+
+    def save(self, path: str):
+        """색인을 npz 파일로 저장"""
+        np.savez(path, offsets=self.offsets, targets=self.targets, weights=self.weights)
+
+    def neighbors(self, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        여러 키워드의 연관 키워드를 한 번에 조회
+
+        Args:
+            ids (np.ndarray): 키워드 번호 배열
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (연관 키워드 번호, 동시 출현 횟수,
+            각 연관 키워드가 나온 ids의 위치)
+        """
+        starts = self.offsets[ids]
+        lengths = self.offsets[ids + 1] - starts
+        total = int(lengths.sum())
+        parents = np.repeat(np.arange(len(ids)), lengths)
+        # 구간마다 starts[i], starts[i] + 1, ... 위치를 만들어 한 번에 모음
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        return self.targets[positions], self.weights[positions], parents
+
+
+class KeywordEngine:
+    def __init__(self, table: pd.DataFrame, cooccurrence: Optional[CooccurrenceIndex] = None,
+                 brands: Sequence[str] = ()):
+        """
+        키워드 엔진 초기화 (점수 계산에 쓰는 열을 미리 배열로 만들어 둠)
+
+        Args:
+            table (pd.DataFrame): 키워드 표 (키워드도구 필드 이름 또는 엔진 열 이름, 키워드 열 필수)
+            cooccurrence (Optional[CooccurrenceIndex]): 2차 확장에 쓸 동시 출현 색인
+            brands (Sequence[str]): 브랜드 키워드로 분류할 브랜드 이름
+        """
+        table = table.rename(columns=COLUMN_NAMES)
+        if "keyword" not in table.columns:
+            raise ValueError("키워드 표에 relKeyword(keyword) 열이 없습니다.")
+
+        table = table.drop_duplicates("keyword").reset_index(drop=True)
+        self.table = table
+        self.keywords = pd.Index(table["keyword"].astype(str))
+        self.cooccurrence = cooccurrence
+        self.brands = [brand for brand in brands if brand]
+
+        def column(name: str) -> np.ndarray:
+            return to_number(table[name]) if name in table.columns else np.zeros(len(table))
+
+        pc_volume, mobile_volume = column("pc_volume"), column("mobile_volume")
+        self.volume = pc_volume + mobile_volume
+
+        # 클릭률(%): CTR 열이 있으면 검색량 가중 평균, 없으면 클릭 수 / 검색량
+        if "pc_ctr" in table.columns or "mobile_ctr" in table.columns:
+            clicks = pc_volume * column("pc_ctr") + mobile_volume * column("mobile_ctr")
+            self.ctr = np.divide(clicks, self.volume, out=np.zeros(len(table)), where=self.volume > 0)
+        else:
+            clicks = column("pc_clicks") + column("mobile_clicks")
+            self.ctr = np.divide(clicks * 100, self.volume, out=np.zeros(len(table)), where=self.volume > 0)
+
+        if "comp_idx" in table.columns:
+            levels = table["comp_idx"].map(COMPETITION_LEVELS)
+            self.competition = levels.fillna(COMPETITION_LEVELS["중간"]).to_numpy(dtype=np.float64)
+        else:
+            self.competition = np.full(len(table), float(COMPETITION_LEVELS["중간"]))
+
+        # 경쟁 페이지 수가 없으면 문서 예시처럼 경쟁 단계 × 1000으로 대신함
+        competing_pages = column("competing_pages")
+        self.competing_pages = np.where(competing_pages > 0, competing_pages, self.competition * 1000)
+
+        # 난이도 = 도메인권위도×0.4 + 콘텐츠길이×0.3 + 백링크×0.3 (각 0~100으로 정규화)
+        # SERP 분석 열이 없으면 경쟁 단계로 대신함 (낮음 33, 중간 67, 높음 100)
+        serp_columns = ("domain_authority", "content_length", "backlinks")
+        if all(name in table.columns for name in serp_columns):
+            self.difficulty = 100 * (normalize(column("domain_authority")) * 0.4
+                                     + normalize(column("content_length")) * 0.3
+                                     + normalize(column("backlinks")) * 0.3)
+        else:
+            self.difficulty = self.competition / len(COMPETITION_LEVELS) * 100
+
+        self.categories = self.categorize(self.keywords.to_series())
+
+    @classmethod
+    def from_files(cls, keyword_path: str, index_path: Optional[str] = None,
+                   pairs_path: Optional[str] = None, brands: Sequence[str] = ()) -> "KeywordEngine":
+        """
+        파일에서 엔진 생성
+
+        Args:
+            keyword_path (str): 키워드 표 (CSV/Excel)
+            index_path (Optional[str]): 미리 만든 동시 출현 색인 (.npz)
+            pairs_path (Optional[str]): 색인이 없을 때 바로 만들 (seed, relKeyword[, count]) 쌍 CSV
+            brands (Sequence[str]): 브랜드 이름 목록
+
+        Returns:
+            KeywordEngine: 생성된 엔진
+        """
+        engine = cls(load_keyword_table(keyword_path), brands=brands)
+        if index_path and os.path.exists(index_path):
+            engine.cooccurrence = CooccurrenceIndex.load(index_path)
+            if len(engine.cooccurrence.offsets) != len(engine.keywords) + 1:
+                raise ValueError(f"동시 출현 색인 {index_path}가 현재 키워드 표와 맞지 않습니다. 다시 만드세요.")
+        elif pairs_path:
+            engine.cooccurrence = engine.build_index(pairs_path)
+        return engine
+
+    def build_index(self, pairs_path: str) -> CooccurrenceIndex:
+        """
+        (seed, relKeyword[, count]) 쌍 CSV로 이 키워드 표에 맞는 동시 출현 색인 생성
+
+        Args:
+            pairs_path (str): 쌍 CSV 파일 경로
+
+        Returns:
+            CooccurrenceIndex: 생성된 색인
+        """
+        pairs = pd.read_csv(pairs_path)
+        counts = pairs["count"] if "count" in pairs.columns else None
+        return CooccurrenceIndex.build(self.keywords, pairs["seed"].astype(str),
+                                       pairs["relKeyword"].astype(str), counts)
+
+    def categorize(self, keywords: pd.Series) -> np.ndarray:
+        """
+        키워드 의도 분류 (정보성, 구매의도, 브랜드, 기타)
+
+        Args:
+            keywords (pd.Series): 키워드 문자열
+
+        Returns:
+            np.ndarray: 카테고리 배열
+        """
+        conditions = []
+        choices = []
+        if self.brands:
+            brand_pattern = "|".join(re.escape(brand) for brand in self.brands)
+            conditions.append(keywords.str.contains(brand_pattern, regex=True).to_numpy())
+            choices.append(CATEGORY_BRAND)
+        conditions.append(keywords.str.contains(PURCHASE_PATTERN, regex=True).to_numpy())
+        choices.append(CATEGORY_PURCHASE)
+        conditions.append(keywords.str.contains(INFO_PATTERN, regex=True).to_numpy())
+        choices.append(CATEGORY_INFO)
+        return np.select(conditions, choices, default=CATEGORY_OTHER)
+
+    def frame(self, ids: np.ndarray, **columns) -> pd.DataFrame:
+        """선택한 키워드 번호의 기본 지표와 추가 열을 담은 결과 표"""
+        return pd.DataFrame({
+            "keyword": self.keywords.to_numpy()[ids],
+            "volume": self.volume[ids],
+            "ctr": self.ctr[ids],
+            "competition": self.competition[ids],
+            "category": self.categories[ids],
+            **columns,
+        })
+
+    def get_related_keywords(self, main_keyword: str, top_n: Optional[int] = 100) -> pd.DataFrame:
+        """
+        메인 키워드의 1차·2차 연관 키워드와 관련성 점수
+
+        관련성 = 동시 출현 점수×0.6 + 메인 키워드와의 단어 겹침×0.4
+        (2차 키워드의 동시 출현 점수는 1차 점수와 곱한 뒤 절반으로 낮춤)
+        메인 키워드가 색인에 없으면 메인 키워드를 포함하는 키워드를 1차 연관 키워드로 씁니다.
+
+        Args:
+            main_keyword (str): 메인 키워드
+            top_n (Optional[int]): 반환할 개수 (None이면 전부)
+
+        Returns:
+            pd.DataFrame: keyword, level, relevance, category 등 (관련성 높은 순)
+        """
+        size = len(self.keywords)
+        main_id = self.keywords.get_indexer([main_keyword])[0]
+        cooccurrence = np.zeros(size)
+        level = np.zeros(size, dtype=np.int8)
+
+        if self.cooccurrence is not None and main_id >= 0:
+            first, first_weights, _ = self.cooccurrence.neighbors(np.array([main_id]))
+        else:
+            first = np.flatnonzero(self.keywords.str.contains(main_keyword, regex=False))
+            first_weights = np.ones(len(first))
+        first_weights = first_weights / first_weights.max() if len(first) else first_weights
+        np.maximum.at(cooccurrence, first, first_weights)
+        level[first] = 1
+
+        if self.cooccurrence is not None and len(first):
+            second, second_weights, parents = self.cooccurrence.neighbors(first)
+            if len(second):
+                second_scores = first_weights[parents] * second_weights / second_weights.max() * 0.5
+                np.add.at(cooccurrence, second, second_scores)
+                level[second[level[second] == 0]] = 2
+
+        if main_id >= 0:
+            level[main_id] = 0
+        ids = np.flatnonzero(level > 0)
+        if main_id < 0:
+            ids = ids[self.keywords.to_numpy()[ids] != main_keyword]
+
+        # 메인 키워드의 단어가 연관 키워드에 얼마나 들어 있는지 (의미적 유사도 대신 사용)
+        candidates = self.keywords.to_series().iloc[ids].reset_index(drop=True)
+        tokens = main_keyword.split() or [main_keyword]
+        overlap = np.zeros(len(ids))
+        for token in tokens:
+            overlap += candidates.str.contains(token, regex=False).to_numpy()
+        overlap /= len(tokens)
+
+        relevance = normalize(np.minimum(cooccurrence[ids], 1.0)) * 0.6 + overlap * 0.4
+        result = self.frame(ids, level=level[ids], relevance=relevance)
+        result = result.sort_values("relevance", ascending=False, kind="stable")
+        return result.head(top_n) if top_n else result
+
+    def get_recommended_keywords(self, seed_keyword: Optional[str] = None, top_n: int = 20,
+                                 min_volume: float = 100, min_ctr: float = 1.0,
+                                 candidates: int = 100) -> pd.DataFrame:
+        """
+        추천 키워드 선별
+
+        점수 = 검색량×0.4 + 클릭률×0.3 + 경쟁도역수×0.3 (단위가 다르므로 각각 0~1로 정규화,
+        검색량은 로그를 취해 정규화)
+
+        Args:
+            seed_keyword (Optional[str]): 시드 키워드 (None이면 표 전체가 후보)
+            top_n (int): 추천 개수
+            min_volume (float): 최소 월 검색량
+            min_ctr (float): 최소 클릭률(%)
+            candidates (int): 시드의 연관 키워드 중 후보로 쓸 개수
+
+        Returns:
+            pd.DataFrame: keyword, score 등 (점수 높은 순)
+        """
+        if seed_keyword:
+            related = self.get_related_keywords(seed_keyword, top_n=candidates)
+            ids = self.keywords.get_indexer(related["keyword"])
+        else:
+            ids = np.arange(len(self.keywords))
+
+        mask = ((self.volume[ids] >= min_volume)
+                & (self.competition[ids] <= COMPETITION_LEVELS["중간"])
+                & (self.ctr[ids] >= min_ctr))
+        ids = ids[mask]
+
+        score = (normalize(np.log1p(self.volume[ids])) * 0.4
+                 + normalize(self.ctr[ids]) * 0.3
+                 + normalize(1 / self.competition[ids]) * 0.3)
+        order = np.argsort(-score, kind="stable")[:top_n]
+        return self.frame(ids[order], score=score[order])
+
+    def find_rankable_keywords(self, keywords: Optional[Sequence[str]] = None,
+                               top_n: Optional[int] = None) -> pd.DataFrame:
+        """
+        상위 노출 가능 키워드 선별
+
+        KEI = 월간검색량² / 경쟁페이지수, 기회점수 = (검색량 / 난이도) × 100
+
+        Args:
+            keywords (Optional[Sequence[str]]): 평가할 키워드 (None이면 표 전체, 표에 없는 키워드는 제외)
+            top_n (Optional[int]): 반환할 개수 (None이면 전부)
+
+        Returns:
+            pd.DataFrame: keyword, kei, difficulty, opportunity 등 (기회점수 높은 순)
+        """
+        if keywords is None:
+            ids = np.arange(len(self.keywords))
+        else:
+            ids = self.keywords.get_indexer(pd.Index(keywords))
+            ids = ids[ids >= 0]
+
+        kei = self.volume[ids] ** 2 / self.competing_pages[ids]
+        difficulty = np.maximum(self.difficulty[ids], 1.0)
+        opportunity = self.volume[ids] / difficulty * 100
+        order = np.argsort(-opportunity, kind="stable")
+        if top_n:
+            order = order[:top_n]
+        return self.frame(ids[order], kei=kei[order], difficulty=difficulty[order],
+                          opportunity=opportunity[order])
+
+    def select_titles(self, seed_keyword: Optional[str] = None, top_n: int = 20,
+                      year: Optional[int] = None) -> List[str]:
+        """
+        추천 키워드 중 상위 노출 기회가 큰 순서로 블로그 제목 생성
+
+        Args:
+            seed_keyword (Optional[str]): 시드 키워드 (None이면 표 전체에서 선별)
+            top_n (int): 제목 수
+            year (Optional[int]): 템플릿에 넣을 연도 (None이면 올해)
+
+        Returns:
+            List[str]: 블로그 제목 목록
+        """
+        year = year or datetime.date.today().year
+        recommended = self.get_recommended_keywords(seed_keyword, top_n=top_n * 3)
+        ranked = self.find_rankable_keywords(recommended["keyword"], top_n=top_n)
+        return [
+            TITLE_TEMPLATES[category].format(keyword=keyword, year=year)
+            for keyword, category in zip(ranked["keyword"], ranked["category"])
+        ]
+
+
+def main():
+    from 엑셀파일생성 import create_posting_excel
+
+    parser = argparse.ArgumentParser(description="키워드 표로 추천/상위노출 가능 키워드를 골라 포스팅 제목 생성")
+    parser.add_argument("--keywords", required=True, help="키워드도구 형식의 키워드 표 (CSV/Excel)")
+    parser.add_argument("--pairs", default=None, help="(seed, relKeyword[, count]) 연관 키워드 쌍 CSV")
+    parser.add_argument("--index", default=None, help="미리 만든 동시 출현 색인 (.npz)")
+    parser.add_argument("--build-index", default=None, help="--pairs로 동시 출현 색인을 만들어 저장할 경로 (.npz)")
+    parser.add_argument("--seed", default=None, help="시드 키워드 (생략하면 표 전체에서 선별)")
+    parser.add_argument("--brands", nargs="*", default=[], help="브랜드 키워드로 분류할 브랜드 이름")
+    parser.add_argument("--top", type=int, default=20, help="생성할 제목 수 (기본값: 20)")
+    parser.add_argument("--output", default="posting.xlsx", help="제목을 기록할 Excel 파일 (기본값: posting.xlsx)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    engine = KeywordEngine.from_files(args.keywords, args.index, args.pairs, brands=args.brands)
+    print(f"키워드 {len(engine.keywords)}개를 읽었습니다 ({time.perf_counter() - started:.1f}초).")
+
+    if args.build_index:
+        if engine.cooccurrence is None:
+            parser.error("--build-index에는 --pairs가 필요합니다.")
+        engine.cooccurrence.save(args.build_index)
+        print(f"동시 출현 색인 저장 완료: {args.build_index} (연관 쌍 {len(engine.cooccurrence.targets)}개)")
+        return
+
+    started = time.perf_counter()
+    titles = engine.select_titles(args.seed, top_n=args.top)
+    print(f"제목 {len(titles)}개 선별 ({time.perf_counter() - started:.2f}초)")
+    create_posting_excel(titles, args.output)
+
+
+if __name__ == "__main__":
+    main()
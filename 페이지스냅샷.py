@@ -0,0 +1,266 @@
+"""
+한 번의 스크립트 실행으로 페이지 구조(입력창, 버튼, iframe 안쪽 포함)를 JSON으로 가져오는 스냅샷 분석기
+
+find_elements 후 요소마다 get_attribute/text를 호출하면 속성 하나가 WebDriver 왕복 한 번이라
+요소가 수백 개면 몇 초가 걸립니다. 스냅샷은 왕복 한 번으로 최상위 문서와 같은 출처의 iframe
+(#mainFrame 등)을 모두 훑고, 태그/id/클래스/placeholder별로 색인하여 저장된 기준 구조와 비교합니다.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+# 최상위 문서부터 같은 출처의 iframe까지 관심 요소의 속성과 감시 셀렉터 개수를 수집하는 스크립트
+SNAPSHOT_SCRIPT = """
+var selectors = arguments[0] || [], limit = arguments[1];
+var query = 'input, button, textarea, select, iframe, a[role="button"], [contenteditable="true"], [id]';
+var started = performance.now();
+var root;
+try { root = window.top.document; } catch (e) { root = document; }
+
+function describe(el) {
+    var rect = el.getClientRects().length > 0;
+    // 버튼/링크만 글자를 읽음 (id가 붙은 큰 컨테이너의 innerText는 페이지 전체라 비쌈)
+    var tag = el.tagName;
+    var raw = (tag === 'BUTTON' || tag === 'A') ? el.innerText : (tag === 'INPUT' ? el.value : '');
+    var text = (raw || '').slice(0, 200).replace(/\\s+/g, ' ').trim();
+    return {
+        tag: tag.toLowerCase(),
+        id: el.id || '',
+        name: el.getAttribute('name') || '',
+        type: el.getAttribute('type') || '',
+        classes: (typeof el.className === 'string' ? el.className : '').split(/\\s+/).filter(Boolean),
+        placeholder: el.getAttribute('placeholder') || '',
+        text: text.slice(0, 40),
+        visible: rect,
+        editable: !!el.isContentEditable
+    };
+}
+
+var frames = [];
+function visit(doc, path) {
+    var nodes = doc.querySelectorAll(query), elements = [];
+    for (var i = 0; i < nodes.length && elements.length < limit; i++) {
+        elements.push(describe(nodes[i]));
+    }
+    var counts = {};
+    for (var s = 0; s < selectors.length; s++) {
+        try { counts[selectors[s]] = doc.querySelectorAll(selectors[s]).length; }
+        catch (e) { counts[selectors[s]] = -1; }
+    }
+    frames.push({path: path, url: doc.location ? doc.location.href : '', elements: elements,
+                 truncated: nodes.length > limit, selectors: counts});
+    var iframes = doc.querySelectorAll('iframe');
+    for (var f = 0; f < iframes.length; f++) {
+        var child = null;
+        try { child = iframes[f].contentDocument; } catch (e) { child = null; }
+        if (child && child.documentElement) {
+            var label = iframes[f].id || iframes[f].name || ('iframe' + f);
+            visit(child, path + '>' + label);
+        }
+    }
+}
+visit(root, 'top');
+return {url: root.location.href, frames: frames, elapsed_ms: performance.now() - started};
+"""
+
+# 스냅샷에 담을 프레임당 최대 요소 수 (운영 중에도 부담 없도록 제한)
+DEFAULT_ELEMENT_LIMIT = 500
+
+
+def take_snapshot(driver, selectors: Sequence[str] = (), limit: int = DEFAULT_ELEMENT_LIMIT) -> "DomSnapshot":
+    """
+    현재 페이지의 스냅샷 (WebDriver 왕복 1회)
+
+    Args:
+        driver: WebDriver (iframe 안에 있어도 최상위 문서부터 수집)
+        selectors (Sequence[str]): 프레임별로 맞는 요소 수를 셀 감시 셀렉터
+        limit (int): 프레임당 최대 요소 수
+
+    Returns:
+        DomSnapshot: 색인된 스냅샷
+    """
+    return DomSnapshot(driver.execute_script(SNAPSHOT_SCRIPT, list(selectors), limit))
+
+
+class DomSnapshot:
+    def __init__(self, data: dict):
+        """
+        스냅샷 데이터를 태그/id/클래스/placeholder별로 색인
+
+        Args:
+            data (dict): SNAPSHOT_SCRIPT 결과 또는 저장된 기준 스냅샷
+        """
+        self.data = data
+        self.elements: List[dict] = []
+        self.by_tag: Dict[str, List[int]] = {}
+        self.by_id: Dict[str, List[int]] = {}
+        self.by_class: Dict[str, List[int]] = {}
+        self.by_placeholder: Dict[str, List[int]] = {}
+
+        for frame in data.get("frames", []):
+            for element in frame["elements"]:
+                element = dict(element, frame=frame["path"])
+                position = len(self.elements)
+                self.elements.append(element)
+                self.by_tag.setdefault(element["tag"], []).append(position)
+                if element["id"]:
+                    self.by_id.setdefault(element["id"], []).append(position)
+                for class_name in element["classes"]:
+                    self.by_class.setdefault(class_name, []).append(position)
+                if element["placeholder"]:
+                    self.by_placeholder.setdefault(element["placeholder"], []).append(position)
+
+    @property
+    def frames(self) -> List[str]:
+        return [frame["path"] for frame in self.data.get("frames", [])]
+
+    def find(self, tag: Optional[str] = None, element_id: Optional[str] = None,
+             class_name: Optional[str] = None, placeholder: Optional[str] = None) -> List[dict]:
+        """
+        조건에 모두 맞는 요소 찾기 (색인 조회)
+
+        Args:
+            tag (Optional[str]): 태그 이름 (소문자)
+            element_id (Optional[str]): id
+            class_name (Optional[str]): 클래스 하나
+            placeholder (Optional[str]): placeholder 전체 문자열
+
+        Returns:
+            List[dict]: 요소 정보 (frame 경로 포함)
+        """
+        positions = None
+        for index, key in ((self.by_tag, tag), (self.by_id, element_id),
+                           (self.by_class, class_name), (self.by_placeholder, placeholder)):
+            if key is None:
+                continue
+            matched = set(index.get(key, []))
+            positions = matched if positions is None else positions & matched
+        if positions is None:
+            positions = set(range(len(self.elements)))
+        return [self.elements[position] for position in sorted(positions)]
+
+    def selector_counts(self) -> Dict[str, int]:
+        """감시 셀렉터별로 모든 프레임에서 맞는 요소 수의 합"""
+        counts: Dict[str, int] = {}
+        for frame in self.data.get("frames", []):
+            for selector, count in frame["selectors"].items():
+                counts[selector] = counts.get(selector, 0) + max(count, 0)
+        return counts
+
+    def diff(self, baseline: "DomSnapshot") -> Dict[str, List[str]]:
+        """
+        기준 스냅샷과 비교하여 달라진 점 정리
+
+        Args:
+            baseline (DomSnapshot): 기준 스냅샷
+
+        Returns:
+            Dict[str, List[str]]: missing_selectors(기준에서는 있었지만 사라진 감시 셀렉터),
+            removed/added_ids, removed/added_classes, removed/added_placeholders, removed/added_frames
+        """
+        current_counts = self.selector_counts()
+        result = {
+            "missing_selectors": sorted(
+                selector for selector, count in baseline.selector_counts().items()
+                if count > 0 and current_counts.get(selector, 0) == 0
+            ),
+        }
+        for name, current, previous in (
+            ("ids", self.by_id, baseline.by_id),
+            ("classes", self.by_class, baseline.by_class),
+            ("placeholders", self.by_placeholder, baseline.by_placeholder),
+            ("frames", dict.fromkeys(self.frames), dict.fromkeys(baseline.frames)),
+        ):
+            result[f"removed_{name}"] = sorted(set(previous) - set(current))
+            result[f"added_{name}"] = sorted(set(current) - set(previous))
+        return result
+
+    def summary(self) -> str:
+        """프레임/태그별 요소 수 요약 문자열"""
+        tags = ", ".join(f"{tag} {len(positions)}" for tag, positions in sorted(self.by_tag.items()))
+        return (f"프레임 {len(self.frames)}개 ({', '.join(self.frames)}), 요소 {len(self.elements)}개 [{tags}], "
+                f"수집 {self.data.get('elapsed_ms', 0):.1f}ms")
+
+
+class SnapshotBaseline:
+    def __init__(self, path: str = "dom_baseline.json"):
+        """
+        페이지별 기준 스냅샷 저장소
+
+        처음 본 페이지는 기준으로 저장하고, 이후에는 기준과 비교하여 감시 셀렉터가 사라지거나
+        id/클래스가 바뀌면 경고합니다. 같은 변경은 한 번만 출력합니다.
+
+        Args:
+            path (str): 기준 스냅샷 JSON 파일 경로
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.baselines: Dict[str, dict] = {}
+        self.reported = set()
+        self.checks = 0
+        self.drifts = 0
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.baselines = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"기준 스냅샷을 읽지 못해 새로 시작합니다: {e}")
+
+    def check(self, page: str, snapshot: DomSnapshot) -> Optional[Dict[str, List[str]]]:
+        """
+        스냅샷을 기준과 비교 (기준이 없으면 이 스냅샷을 기준으로 저장)
+
+        Args:
+            page (str): 페이지 이름 (login, editor 등)
+            snapshot (DomSnapshot): 현재 스냅샷
+
+        Returns:
+            Optional[Dict[str, List[str]]]: 달라진 점이 있으면 DomSnapshot.diff 결과, 없으면 None
+        """
+        with self.lock:
+            self.checks += 1
+            baseline = self.baselines.get(page)
+            if baseline is None:
+                self.baselines[page] = snapshot.data
+                self._save()
+                print(f"{page} 페이지 기준 스냅샷 저장: {snapshot.summary()}")
+                return None
+
+        changes = snapshot.diff(DomSnapshot(baseline))
+        # 감시 셀렉터가 사라진 것만 셀렉터 변경으로 봄 (id/클래스 변화는 참고용)
+        if not changes["missing_selectors"] and not changes["removed_frames"]:
+            return None
+
+        # 자동 생성 id처럼 매번 바뀌는 항목 때문에 같은 경고가 반복되지 않도록 셀렉터/프레임으로만 구분
+        key = (page, tuple(changes["missing_selectors"]), tuple(changes["removed_frames"]))
+        with self.lock:
+            self.drifts += 1
+            if key in self.reported:
+                return changes
+            self.reported.add(key)
+
+        print(f"⚠ {page} 페이지 구조가 기준과 다릅니다:")
+        for name, items in changes.items():
+            if items:
+                shown = ", ".join(items[:10]) + (f" 외 {len(items) - 10}개" if len(items) > 10 else "")
+                print(f"  {name}: {shown}")
+        return changes
+
+    def reset(self, page: str):
+        """페이지 기준 스냅샷 삭제 (다음 검사 때 새로 저장)"""
+        with self.lock:
+            self.baselines.pop(page, None)
+            self._save()
+
+    def _save(self):
+        """기준 스냅샷 파일 저장 (lock 안에서 호출)"""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.baselines, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def stats(self) -> str:
+        """검사 통계 문자열"""
+        return f"검사 {self.checks}회, 구조 변경 감지 {self.drifts}회"
@@ -0,0 +1,296 @@
+"""
+파일에서 읽는 프롬프트 템플릿과 글당 토큰 예산
+
+prompts/ 폴더의 템플릿 파일은 [system], [user] 같은 구역으로 나뉩니다. 불러올 때 줄 앞뒤
+공백과 연속된 빈 줄을 지우고 구역별 토큰 수를 미리 계산해 둡니다. 모든 글에 같은 [system]
+구역은 시스템 지시문(캐시 가능한 앞부분)으로 보내고, 글마다 달라지는 [user] 구역만 채워서
+보냅니다. 예전처럼 f-string 안의 들여쓰기와 요구사항 전체를 글마다 다시 보내지 않습니다.
+
+사용법 (예전 프롬프트와 비교한 입력 토큰/비용 절감 보고서):
+    python 프롬프트템플릿.py --excel posting.xlsx
+"""
+
+import argparse
+import os
+import re
+import string
+from typing import Dict, List
+
+from 속도제한기 import estimate_tokens
+
+# 기본 템플릿 폴더 (실행 위치와 무관하게 스크립트 옆의 prompts/)
+DEFAULT_PROMPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+# "[system]"처럼 한 줄에 구역 이름만 있는 줄
+SECTION_PATTERN = re.compile(r"^\[(\w+)\]$")
+BLANK_LINES = re.compile(r"\n{3,}")
+
+# 예전 generate_blog_content의 f-string 프롬프트 (절감 보고서의 비교 기준)
+LEGACY_PROMPT = """
+        다음 제목으로 블로그 포스트의 본문을 작성해주세요.
+
+        제목: {title}
+
+        요구사항:
+        1. 서론-본론-결론 구조로 작성
+        2. 독자에게 유용한 정보 제공
+        3. 자연스럽고 읽기 쉬운 문체 사용
+        4. 적절한 길이 (1000-1500자 정도)
+        5. 실용적이고 구체적인 내용 포함
+
+        블로그 본문만 작성해주세요:
+        """
+
+
+class TokenBudgetError(ValueError):
+    """입력 프롬프트만으로 글당 토큰 예산을 넘어 최소 출력 토큰을 확보할 수 없음"""
+
+
+def compact_whitespace(text: str) -> str:
+    """
+    줄마다 앞뒤 공백을 지우고 빈 줄은 하나만 남기기
+
+    Args:
+        text (str): 템플릿 또는 프롬프트
+
+    Returns:
+        str: 공백을 줄인 문자열
+    """
+    lines = [line.strip() for line in text.strip().splitlines()]
+    return BLANK_LINES.sub("\n\n", "\n".join(lines))
+
+
+class PromptTemplate:
+    def __init__(self, name: str, sections: Dict[str, str]):
+        """
+        구역별로 공백을 줄이고 토큰 수를 미리 계산한 템플릿
+
+        Args:
+            name (str): 템플릿 이름 (파일 이름에서 확장자를 뺀 값)
+            sections (Dict[str, str]): 구역 이름별 원문 (system 구역은 채울 값이 없어야 함)
+        """
+        self.name = name
+        self.sections = {section: compact_whitespace(text) for section, text in sections.items()}
+        self.system = self.sections.get("system", "")
+
+        # 구역별 채울 값 이름과, 값을 뺀 고정 부분의 토큰 수
+        self.fields: Dict[str, List[str]] = {}
+        self.base_tokens: Dict[str, int] = {}
+        for section, text in self.sections.items():
+            parsed = list(string.Formatter().parse(text))
+            self.fields[section] = [field for _, field, _, _ in parsed if field]
+            self.base_tokens[section] = estimate_tokens("".join(literal for literal, _, _, _ in parsed))
+
+        if self.fields.get("system"):
+            raise ValueError(f"{name} 템플릿의 [system] 구역에는 채울 값을 넣을 수 없습니다: {self.fields['system']}")
+        self.system_tokens = estimate_tokens(self.system) if self.system else 0
+
+    @classmethod
+    def load(cls, path: str) -> "PromptTemplate":
+        """
+        템플릿 파일 읽기 (#으로 시작하는 줄은 주석)
+
+        Args:
+            path (str): 템플릿 파일 경로
+
+        Returns:
+            PromptTemplate: 컴파일된 템플릿
+        """
+        sections: Dict[str, List[str]] = {}
+        current = None
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped.startswith("#"):
+                    continue
+                match = SECTION_PATTERN.match(stripped)
+                if match:
+                    current = match.group(1)
+                    sections[current] = []
+                elif current is not None:
+                    sections[current].append(line)
+                elif stripped:
+                    raise ValueError(f"{path}: 구역([system], [user] 등) 앞에 내용이 있습니다: {stripped}")
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        if "user" not in sections:
+            raise ValueError(f"{path}: [user] 구역이 없습니다.")
+        return cls(name, {section: "".join(lines) for section, lines in sections.items()})
+
+    def render(self, section: str = "user", **values) -> str:
+        """
+        구역에 값을 채운 프롬프트
+
+        Args:
+            section (str): 구역 이름
+            **values: 채울 값
+
+        Returns:
+            str: 프롬프트
+        """
+        return self.sections[section].format(**values)
+
+    def estimate(self, section: str = "user", **values) -> int:
+        """
+        값을 채운 구역의 토큰 수 (고정 부분은 미리 계산한 값 사용)
+
+        Args:
+            section (str): 구역 이름
+            **values: 채울 값
+
+        Returns:
+            int: 예상 토큰 수
+        """
+        return self.base_tokens[section] + sum(estimate_tokens(str(values[field])) for field in self.fields[section])
+
+
+class PromptLibrary:
+    def __init__(self, directory: str = DEFAULT_PROMPT_DIR):
+        """
+        폴더의 템플릿 파일(*.txt)을 모두 읽어 컴파일
+
+        Args:
+            directory (str): 템플릿 폴더
+        """
+        self.directory = directory
+        self.templates: Dict[str, PromptTemplate] = {}
+        try:
+            for file_name in sorted(os.listdir(directory)):
+                if file_name.endswith(".txt"):
+                    template = PromptTemplate.load(os.path.join(directory, file_name))
+                    self.templates[template.name] = template
+        except FileNotFoundError:
+            print(f"오류: 프롬프트 템플릿 폴더를 찾을 수 없습니다: {directory}")
+            raise
+
+    def get(self, name: str) -> PromptTemplate:
+        """이름으로 템플릿 찾기"""
+        if name not in self.templates:
+            raise KeyError(f"{self.directory}에 {name}.txt 템플릿이 없습니다.")
+        return self.templates[name]
+
+    def describe(self) -> str:
+        """템플릿별 시스템 지시문/구역 토큰 수 요약"""
+        return ", ".join(
+            f"{name}(시스템 {template.system_tokens}토큰, "
+            + ", ".join(f"{section} {tokens}토큰" for section, tokens in template.base_tokens.items()
+                        if section != "system")
+            + ")"
+            for name, template in self.templates.items()
+        )
+
+
+class TokenBudget:
+    def __init__(self, max_tokens: int, min_output_tokens: int = 800):
+        """
+        글 하나에 쓸 수 있는 입력+출력 토큰 예산
+
+        Args:
+            max_tokens (int): 글당 입력+출력 토큰 상한
+            min_output_tokens (int): 이보다 적게 출력할 수밖에 없으면 요청하지 않음 (본문이 잘리므로)
+        """
+        self.max_tokens = max_tokens
+        self.min_output_tokens = min_output_tokens
+
+    def output_tokens(self, input_tokens: int, requested: int, rows: int = 1) -> int:
+        """
+        예산 안에서 요청할 최대 출력 토큰 수
+
+        Args:
+            input_tokens (int): 요청의 입력 토큰 수 (시스템 지시문 포함)
+            requested (int): 원래 요청하려던 최대 출력 토큰 수
+            rows (int): 요청 하나에 담긴 글 수 (배치 요청이면 예산과 최소 출력도 글 수만큼)
+
+        Returns:
+            int: 최대 출력 토큰 수
+
+        Raises:
+            TokenBudgetError: 입력만으로 예산을 넘어 최소 출력 토큰을 확보할 수 없을 때
+        """
+        available = self.max_tokens * rows - input_tokens
+        if available < self.min_output_tokens * rows:
+            raise TokenBudgetError(f"입력 {input_tokens}토큰으로 글당 예산 {self.max_tokens}토큰을 넘습니다 "
+                                   f"(최소 출력 {self.min_output_tokens}토큰 확보 불가)")
+        return min(requested, available)
+
+
+def savings_report(titles: List[str], template: PromptTemplate, input_price: float,
+                   context_cached: bool = False) -> Dict[str, float]:
+    """
+    예전 f-string 프롬프트와 템플릿 프롬프트의 입력 토큰/비용 비교
+
+    Args:
+        titles (List[str]): 제목 목록
+        template (PromptTemplate): 비교할 템플릿 (보통 blog)
+        input_price (float): 입력 토큰 100만 개당 가격 (달러)
+        context_cached (bool): 시스템 지시문이 컨텍스트 캐시에 올라가 글마다 보내지 않는다고 볼지 여부
+
+    Returns:
+        Dict[str, float]: legacy_tokens, template_tokens, saved_ratio, legacy_cost, template_cost
+    """
+    legacy_tokens = sum(estimate_tokens(LEGACY_PROMPT.format(title=title)) for title in titles)
+    system_tokens = 0 if context_cached else template.system_tokens
+    template_tokens = sum(system_tokens + template.estimate("user", title=title) for title in titles)
+    return {
+        "legacy_tokens": legacy_tokens,
+        "template_tokens": template_tokens,
+        "saved_ratio": 1 - template_tokens / legacy_tokens if legacy_tokens else 0.0,
+        "legacy_cost": legacy_tokens / 1_000_000 * input_price,
+        "template_cost": template_tokens / 1_000_000 * input_price,
+    }
+
+
+def main():
+    from 생성백엔드 import CONTEXT_CACHE_MIN_TOKENS
+    from 엑셀스트리밍 import StreamingExcelReader
+
+    parser = argparse.ArgumentParser(description="프롬프트 템플릿의 입력 토큰/비용 절감 보고서")
+    parser.add_argument("--excel", default="posting.xlsx", help="제목 Excel 파일 (기본값: posting.xlsx)")
+    parser.add_argument("--prompts", default=DEFAULT_PROMPT_DIR, help="프롬프트 템플릿 폴더 (기본값: prompts/)")
+    parser.add_argument("--input-price", type=float, default=0.30,
+                        help="입력 토큰 100만 개당 가격(달러) (기본값: 0.30, gemini-2.5-flash)")
+    parser.add_argument("--trace", default=None,
+                        help="실제 실행 트레이스(JSONL)가 있으면 응답의 prompt_tokens를 함께 집계")
+    args = parser.parse_args()
+
+    library = PromptLibrary(args.prompts)
+    template = library.get("blog")
+    titles = [title for _, title in StreamingExcelReader(args.excel).iter_titles()]
+    if not titles:
+        print(f"{args.excel}에 제목이 없습니다.")
+        return
+
+    print(f"템플릿: {library.describe()}")
+    print(f"제목 {len(titles)}개 기준 입력 토큰 (추정, 한글 약 2자당 1토큰)\n")
+    print(f"{'방식':<28} | {'글당 토큰':>9} | {'전체 토큰':>10} | {'비용($)':>9} | {'절감':>6}")
+    print("-" * 76)
+    for label, cached in (("템플릿 (시스템 지시문 매번 전송)", False), ("템플릿 (시스템 지시문 캐시)", True)):
+        report = savings_report(titles, template, args.input_price, context_cached=cached)
+        if not cached:
+            print(f"{'예전 f-string 프롬프트':<28} | {report['legacy_tokens'] / len(titles):>9.0f} | "
+                  f"{report['legacy_tokens']:>10.0f} | {report['legacy_cost']:>9.4f} | {'-':>6}")
+        print(f"{label:<28} | {report['template_tokens'] / len(titles):>9.0f} | "
+              f"{report['template_tokens']:>10.0f} | {report['template_cost']:>9.4f} | {report['saved_ratio']:>6.1%}")
+
+    if template.system_tokens < CONTEXT_CACHE_MIN_TOKENS:
+        print(f"\n※ 시스템 지시문({template.system_tokens}토큰)이 컨텍스트 캐시 최소 길이({CONTEXT_CACHE_MIN_TOKENS}토큰)보다 "
+              "짧아 실제로는 매번 전송됩니다 (캐시 행은 지시문을 늘렸을 때의 기준).")
+
+    if args.trace:
+        import json
+
+        calls = prompt_tokens = cached_tokens = 0
+        with open(args.trace, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if "prompt_tokens" in entry:
+                    calls += 1
+                    prompt_tokens += entry["prompt_tokens"]
+                    cached_tokens += entry.get("cached_tokens", 0)
+        if calls:
+            print(f"\n트레이스의 실제 사용량: 요청 {calls}회, 요청당 입력 {prompt_tokens / calls:.0f}토큰 "
+                  f"(그중 캐시 {cached_tokens / calls:.0f}토큰)")
+
+
+if __name__ == "__main__":
+    main()